@@ -11,18 +11,28 @@ import asyncio
 from datetime import timedelta, datetime, timezone
 import logging
 import os
-from typing import Any
+import time
+from typing import Any, Container, Mapping
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_EMAIL,
     CONF_PASSWORD,
+    EVENT_HOMEASSISTANT_CLOSE,
     Platform,
 )
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -41,6 +51,15 @@ from .const import (
     DEFAULT_EXCLUDE_DAYS,
     CONF_EXCLUDE_INVISIBLE,
     DEFAULT_EXCLUDE_INVISIBLE,
+    CONF_PRESENCE_HOME_RSSI,
+    DEFAULT_PRESENCE_HOME_RSSI,
+    CONF_PRESENCE_AWAY_RSSI,
+    DEFAULT_PRESENCE_AWAY_RSSI,
+    CONF_PRESENCE_AWAY_AFTER,
+    DEFAULT_PRESENCE_AWAY_AFTER,
+    PRESENCE_CHECK_INTERVAL,
+    FULL_SYNC_INTERVAL,
+    METADATA_REFRESH_INTERVAL,
     SERVICE_PLAY_SOUND,
     SERVICE_REFRESH_TILES,
     SERVICE_SCAN_TILES,
@@ -59,7 +78,26 @@ from .const import (
     ATTR_PRESET,
     PRESET_SONGS,
 )
-from .tile_api import TileApiClient, TileDevice, TileAuthError
+from .account_registry import (
+    TileAccountRegistry,
+    async_cleanup_account_registry,
+    get_account_registry,
+)
+from .poll_scheduler import TilePollScheduler
+from .presence import TilePresenceEngine
+from .refresh_scheduler import (
+    TileRefreshScheduler,
+    async_cleanup_refresh_scheduler,
+    get_refresh_scheduler,
+)
+from .storage import TileApiCacheStore, TileTrackerStore
+from .tile_api import (
+    TileApiClient,
+    TileDevice,
+    TileAuthError,
+    TileRateLimitError,
+    create_client_session,
+)
 from .tile_service import get_tile_service, async_cleanup_services
 from .websocket_api import async_setup_websocket_api
 
@@ -128,16 +166,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     exclude_days = entry.options.get(CONF_EXCLUDE_DAYS, DEFAULT_EXCLUDE_DAYS)
     exclude_invisible = entry.options.get(CONF_EXCLUDE_INVISIBLE, DEFAULT_EXCLUDE_INVISIBLE)
     
-    # Create API client
-    api = TileApiClient(email, password)
-    
-    # Test authentication
-    try:
-        await api.login()
-    except TileAuthError as err:
-        raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
-    except Exception as err:
-        raise ConfigEntryNotReady(f"Unable to connect to Tile: {err}") from err
+    # Create the account's API client on the shared connection pool and
+    # restore its persisted session and tile metadata; another entry for
+    # the same account shares the client it already loaded
+    accounts = get_account_registry(hass)
+    api, created = accounts.acquire(
+        entry.entry_id,
+        email,
+        lambda: TileApiClient(email, password, session=_async_get_api_session(hass)),
+    )
+    api_store = TileApiCacheStore(hass, entry.entry_id)
+    if created:
+        await api_store.load(api)
+    tile_store = TileTrackerStore(hass, entry.entry_id)
+    await tile_store.load()
     
     # Create update coordinator
     coordinator = TileDataUpdateCoordinator(
@@ -146,10 +188,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=timedelta(minutes=scan_interval),
         exclude_days=exclude_days,
         exclude_invisible=exclude_invisible,
+        api_store=api_store,
+        tile_store=tile_store,
+        accounts=accounts,
+        entry_id=entry.entry_id,
+    )
+    entry.async_on_unload(
+        accounts.listen(entry.entry_id, coordinator.async_tiles_released)
     )
     
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Local presence: fed by advertisements via the tile service, and
+    # tiles that go unheard are marked away periodically
+    coordinator.presence.configure(*_presence_options(entry.options))
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            coordinator.async_check_presence,
+            timedelta(seconds=PRESENCE_CHECK_INTERVAL),
+        )
+    )
+    
+    # Stagger this account's refreshes against the other entries'
+    entry.async_on_unload(coordinator.async_join_scheduler(get_refresh_scheduler(hass)))
+    
+    if coordinator.async_restore_snapshot():
+        # Entities come up with last-known data; the live refresh (and a
+        # login, if needed) runs in the background so startup doesn't
+        # wait on the Tile cloud
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+    else:
+        # First start: log in only without a persisted session (a restored
+        # session is validated by the first request) and fetch initial data
+        try:
+            if not api.is_logged_in:
+                try:
+                    await api.login()
+                except TileAuthError as err:
+                    raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
+                except Exception as err:
+                    raise ConfigEntryNotReady(f"Unable to connect to Tile: {err}") from err
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            if accounts.release(entry.entry_id):
+                await api.close()
+            raise
     
     # Store coordinator
     hass.data[DOMAIN][entry.entry_id] = {
@@ -157,6 +241,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "api": api,
     }
     
+    # Index the entry's tiles for service and button lookups, and keep the
+    # BLE cache fed from Home Assistant's bluetooth integration
+    tile_service = get_tile_service(hass)
+    entry.async_on_unload(tile_service.track_coordinator(entry.entry_id, coordinator))
+    await tile_service.async_start_passive_discovery()
+    
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
@@ -180,20 +270,69 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        # Close API session
+        # Close the API session unless another entry shares the account
         data = hass.data[DOMAIN].pop(entry.entry_id)
-        await data["api"].close()
+        if get_account_registry(hass).release(entry.entry_id):
+            await data["api"].close()
     
-    # Remove services if no more entries
+    # Remove services and the shared HTTP pool if no more entries
     if not hass.data[DOMAIN]:
         _async_remove_services(hass)
+        await _async_close_api_session(hass)
+        async_cleanup_refresh_scheduler(hass)
+        async_cleanup_account_registry(hass)
     
     return unload_ok
 
 
+# Pooled HTTP session per hass, shared by every config entry so keep-alive
+# connections to the Tile API are reused across refreshes and accounts
+_api_sessions: dict[int, aiohttp.ClientSession] = {}
+
+
+def _async_get_api_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Get or create the shared Tile API session for this hass instance."""
+    hass_id = id(hass)
+    session = _api_sessions.get(hass_id)
+    if session is None or session.closed:
+        session = _api_sessions[hass_id] = create_client_session()
+        
+        async def _async_close(event: Event) -> None:
+            await _async_close_api_session(hass)
+        
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return session
+
+
+async def _async_close_api_session(hass: HomeAssistant) -> None:
+    """Close the shared Tile API session, if any."""
+    session = _api_sessions.pop(id(hass), None)
+    if session and not session.closed:
+        await session.close()
+
+
+def _presence_options(options: Mapping[str, Any]) -> tuple[float, float, float]:
+    """Return the presence thresholds (home RSSI, away RSSI, away after)."""
+    return (
+        options.get(CONF_PRESENCE_HOME_RSSI, DEFAULT_PRESENCE_HOME_RSSI),
+        options.get(CONF_PRESENCE_AWAY_RSSI, DEFAULT_PRESENCE_AWAY_RSSI),
+        options.get(CONF_PRESENCE_AWAY_AFTER, DEFAULT_PRESENCE_AWAY_AFTER),
+    )
+
+
 async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Update options."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply changed options to the running coordinator (no reload)."""
+    data = hass.data[DOMAIN].get(entry.entry_id)
+    if not isinstance(data, dict) or not data.get("coordinator"):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    data["coordinator"].async_apply_options(entry.options)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted API cache and snapshot when a config entry is removed."""
+    await TileApiCacheStore(hass, entry.entry_id).remove()
+    await TileTrackerStore(hass, entry.entry_id).remove()
 
 
 # Frontend card URL path
@@ -305,9 +444,9 @@ async def _async_setup_services(hass: HomeAssistant) -> None:
                 {
                     "address": device.address,
                     "name": device.name or "Unknown",
-                    "rssi": adv_data.rssi if adv_data else -100,
+                    "rssi": cached.rssi,
                 }
-                for device, adv_data in tiles
+                for device, cached in tiles
             ],
         }
     
@@ -530,6 +669,10 @@ class TileDataUpdateCoordinator(DataUpdateCoordinator[dict[str, TileDevice]]):
         update_interval: timedelta,
         exclude_days: int = DEFAULT_EXCLUDE_DAYS,
         exclude_invisible: bool = DEFAULT_EXCLUDE_INVISIBLE,
+        api_store: TileApiCacheStore | None = None,
+        tile_store: TileTrackerStore | None = None,
+        accounts: TileAccountRegistry | None = None,
+        entry_id: str | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -539,8 +682,291 @@ class TileDataUpdateCoordinator(DataUpdateCoordinator[dict[str, TileDevice]]):
             update_interval=update_interval,
         )
         self.api = api
+        self.api_store = api_store
+        self.tile_store = tile_store
+        
+        # Account sharing: only the account's primary entry polls, and
+        # tiles owned by another entry (shared between accounts) are left
+        # out of data and skip their detail fetches
+        self.accounts = accounts
+        self.entry_id = entry_id
+        self._foreign_uuids: set[str] = set()
+        
+        # Configured interval. update_interval follows the earliest tile due
+        # in the poll scheduler, and is stretched while rate limited.
+        self._base_update_interval = update_interval
+        self.poll_scheduler = TilePollScheduler(
+            update_interval.total_seconds(),
+            cold_after=exclude_days * 86400 if exclude_days > 0 else None,
+        )
+        self._rate_limited = False
         self.exclude_days = exclude_days
         self.exclude_invisible = exclude_invisible
+        
+        # Monotonic times of the last full /users/groups resync and of the
+        # last metadata (slow tier) refresh
+        self._last_full_sync: float | None = None
+        self._last_metadata_refresh: float | None = None
+        
+        # Dead/invisible tiles seen in groups syncs, so tile_states entries
+        # for them aren't mistaken for new tiles
+        self._inactive_uuids: set[str] = set()
+        
+        # Per-tile change tracking: fingerprints as of the last notification,
+        # a version bumped whenever a tile changes, and the tiles changed by
+        # the refresh being delivered (None notifies every listener)
+        self._fingerprints: dict[str, tuple] = {}
+        self.tile_versions: dict[str, int] = {}
+        self._changed_tiles: set[str] | None = None
+        self._notified_success: bool | None = None
+        
+        # Shared scheduler that staggers refreshes across config entries,
+        # and how far the pending refresh was pulled ahead of its due time
+        self.refresh_scheduler: TileRefreshScheduler | None = None
+        self._refresh_lead = 0.0
+        
+        # Home/away from local BLE advertisements
+        self.presence = TilePresenceEngine()
+
+    @callback
+    def async_join_scheduler(self, scheduler: TileRefreshScheduler) -> CALLBACK_TYPE:
+        """Stagger and throttle refreshes through a shared scheduler.
+        
+        Returns:
+            Callback that leaves the scheduler again
+        """
+        self.refresh_scheduler = scheduler
+        unregister = scheduler.register(self)
+        
+        @callback
+        def _leave() -> None:
+            unregister()
+            self.refresh_scheduler = None
+        
+        return _leave
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh on this entry's slot of the shared scheduler.
+        
+        DataUpdateCoordinator offsets every refresh by a random fraction of
+        a second (_microsecond, next to _update_interval_seconds); the
+        offset is replaced with the shift onto the slot, which moves the
+        refresh by at most half a spread window. Should those private
+        attributes ever change, the refresh keeps its default schedule.
+        """
+        interval = getattr(self, "_update_interval_seconds", None)
+        if (
+            self.refresh_scheduler is not None
+            and isinstance(interval, (int, float))
+            and interval > 0
+            and isinstance(getattr(self, "_microsecond", None), float)
+        ):
+            target = int(self.hass.loop.time()) + interval
+            shift = max(self.refresh_scheduler.offset(self, target), -interval / 2)
+            self._microsecond = shift
+            self._refresh_lead = max(0.0, -shift)
+        super()._schedule_refresh()
+
+    @callback
+    def async_add_tile_listener(
+        self,
+        tile_uuid: str,
+        update_callback: CALLBACK_TYPE,
+    ) -> CALLBACK_TYPE:
+        """Listen for updates of one tile only.
+        
+        Equivalent to CoordinatorEntity(coordinator, context=tile_uuid).
+        """
+        return self.async_add_listener(update_callback, tile_uuid)
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply config entry options in place.
+        
+        Changes the polling interval, exclusion thresholds and filters
+        without a reload, so there is no re-login, refetch or entity
+        recreation.
+        """
+        update_interval = timedelta(
+            minutes=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.exclude_days = options.get(CONF_EXCLUDE_DAYS, DEFAULT_EXCLUDE_DAYS)
+        self.exclude_invisible = options.get(
+            CONF_EXCLUDE_INVISIBLE, DEFAULT_EXCLUDE_INVISIBLE
+        )
+        
+        self.presence.configure(*_presence_options(options))
+        
+        self._base_update_interval = update_interval
+        self.poll_scheduler.base_interval = update_interval.total_seconds()
+        self.poll_scheduler.cold_after = (
+            self.exclude_days * 86400 if self.exclude_days > 0 else None
+        )
+        _LOGGER.debug(
+            "Applied options: scan interval %s, exclude_days %d, exclude_invisible %s",
+            update_interval,
+            self.exclude_days,
+            self.exclude_invisible,
+        )
+        
+        if not self.data or self._rate_limited:
+            return
+        
+        # Re-tier the tiles and wake up on the new schedule
+        self.poll_scheduler.rebase(self.data, time.monotonic())
+        self._update_wakeup()
+        if self._listeners:
+            self._async_unsub_refresh()
+            self._schedule_refresh()
+
+    @callback
+    def async_observe_advertisement(
+        self,
+        tile_uuid: str,
+        rssi: float,
+        seen_at: float | None = None,
+    ) -> None:
+        """Update a tile's local presence from one of its advertisements.
+        
+        ``seen_at`` is the wall-clock time the advertisement was heard;
+        one older than the presence timeout is ignored, as it no longer
+        says the tile is around.
+        """
+        if seen_at is not None and time.time() - seen_at > self.presence.away_after:
+            return
+        if self.presence.observe(tile_uuid, rssi, seen_at):
+            self._async_notify_tile(tile_uuid)
+
+    @callback
+    def async_check_presence(self, now: datetime | None = None) -> None:
+        """Mark tiles that went unheard away."""
+        for tile_uuid in self.presence.check():
+            self._async_notify_tile(tile_uuid)
+
+    @callback
+    def _async_notify_tile(self, tile_uuid: str) -> None:
+        """Update the entities of one tile outside a refresh."""
+        self._async_notify_contexts({tile_uuid}, include_global=False)
+
+    @callback
+    def _async_notify_contexts(self, tile_uuids: Container[str], include_global: bool) -> None:
+        """Call the listeners of some tiles, and optionally the global ones.
+        
+        The only place that reads DataUpdateCoordinator's private
+        ``_listeners`` (listener id -> (callback, context)); per-tile
+        entities register with their tile UUID as context. Should that
+        layout ever change, every listener is notified instead, which is
+        correct if not selective.
+        """
+        try:
+            listeners = [
+                (update_callback, context)
+                for update_callback, context in self._listeners.values()
+            ]
+        except (AttributeError, TypeError, ValueError):
+            _LOGGER.debug("Unknown coordinator listener layout, notifying all")
+            super().async_update_listeners()
+            return
+        
+        for update_callback, context in listeners:
+            if context is None:
+                if include_global:
+                    update_callback()
+            elif context in tile_uuids:
+                update_callback()
+
+    @callback
+    def async_restore_snapshot(self) -> bool:
+        """Seed data from the persisted snapshot.
+        
+        Returns:
+            True if tiles were restored
+        """
+        if not self.tile_store:
+            return False
+        tiles = self.tile_store.get_tiles()
+        if not tiles:
+            return False
+        
+        tiles = self._claim_tiles(tiles)
+        if not tiles:
+            return False
+        
+        _LOGGER.debug("Restored %d tiles from snapshot", len(tiles))
+        self.data = tiles
+        return True
+
+    def _claim_tiles(self, tiles: dict[str, TileDevice]) -> dict[str, TileDevice]:
+        """Keep only the tiles this entry owns in the account registry."""
+        if self.accounts is None:
+            return tiles
+        owned = self.accounts.claim_tiles(self.entry_id, tiles)
+        self._foreign_uuids = tiles.keys() - owned
+        if not self._foreign_uuids:
+            return tiles
+        return {tile_uuid: tiles[tile_uuid] for tile_uuid in owned}
+
+    @callback
+    def async_tiles_released(self) -> None:
+        """Resync in full, another entry gave up tiles or the account."""
+        # Released tiles are ours to fetch with details now
+        self._foreign_uuids = set()
+        self._last_full_sync = None
+        self._last_metadata_refresh = None
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Work out which tiles changed before listeners are notified.
+        
+        DataUpdateCoordinator's hook for subclasses, called after every
+        refresh. Without it _changed_tiles stays None and every listener
+        is notified.
+        """
+        self._changed_tiles = self._diff_tiles()
+        
+        # Persist the new state for the next startup
+        if self.tile_store and self.last_update_success and self._changed_tiles != set():
+            self.tile_store.async_schedule_save(self.data)
+
+    def _diff_tiles(self) -> set[str] | None:
+        """Return UUIDs of tiles changed since the last notification.
+        
+        Returns None if availability changed, so every entity updates.
+        """
+        tiles = self.data or {}
+        changed = self._fingerprints.keys() - tiles.keys()
+        for tile_uuid in changed:
+            del self._fingerprints[tile_uuid]
+            self.tile_versions.pop(tile_uuid, None)
+        
+        for tile_uuid, tile in tiles.items():
+            fingerprint = tile.fingerprint()
+            if self._fingerprints.get(tile_uuid) != fingerprint:
+                self._fingerprints[tile_uuid] = fingerprint
+                self.tile_versions[tile_uuid] = self.tile_versions.get(tile_uuid, 0) + 1
+                changed.add(tile_uuid)
+        
+        if self._notified_success != self.last_update_success:
+            self._notified_success = self.last_update_success
+            return None
+        return changed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify tile-independent listeners and those of changed tiles.
+        
+        Listeners registered with a tile UUID as context (per-tile entities)
+        are skipped when their tile didn't change in this refresh.
+        """
+        changed, self._changed_tiles = self._changed_tiles, None
+        if changed is None:
+            super().async_update_listeners()
+            return
+        
+        _LOGGER.debug("Notifying listeners of %d changed tiles", len(changed))
+        self._async_notify_contexts(changed, include_global=True)
 
     def should_disable_tile(self, tile: TileDevice) -> bool:
         """Determine if a tile should be disabled based on configuration.
@@ -577,23 +1003,217 @@ class TileDataUpdateCoordinator(DataUpdateCoordinator[dict[str, TileDevice]]):
         return False
 
     async def _async_update_data(self) -> dict[str, TileDevice]:
+        """Fetch data from Tile API within the shared sweep limit."""
+        if self.refresh_scheduler is None:
+            return await self._async_fetch_data()
+        async with self.refresh_scheduler.sweep():
+            return await self._async_fetch_data()
+
+    async def _async_fetch_data(self) -> dict[str, TileDevice]:
         """Fetch data from Tile API."""
+        # A staggered refresh may run a little early; tiles due by the
+        # original time count as due
+        lead, self._refresh_lead = self._refresh_lead, 0.0
+        if not self._polls_account():
+            # Another entry for the same account polls it; keep what was
+            # restored from the snapshot rather than wiping the entities
+            return self.data or {}
         try:
             # Re-login if needed
             if not self.api.is_logged_in:
                 await self.api.login()
             
-            tiles = await self.api.get_tiles()
-            
-            # Also get latest states
-            if tiles:
-                await self.api.get_tile_states()
+            # Fast tier: refresh the tiles that are due. A scheduled wakeup
+            # always has some; an empty list means an out-of-band refresh
+            # (button, service) that should cover every tile but cold ones.
+            if not self._metadata_refresh_due():
+                due = self.poll_scheduler.due(time.monotonic() + lead) or [
+                    tile_uuid
+                    for tile_uuid in self.data
+                    if tile_uuid not in self.poll_scheduler.cold_tiles
+                ]
+                tiles = await self._async_refresh_states(due)
+                if tiles is not None:
+                    self._schedule_next_poll(tiles, due)
+                    return tiles
             
-            # Return as dict keyed by tile_uuid
-            return {tile.tile_uuid: tile for tile in tiles}
+            # Slow tier: resync the account graph and per-tile metadata
+            tiles = self._claim_tiles(await self._async_sync_tiles())
+            self._last_metadata_refresh = time.monotonic()
+            self._schedule_next_poll(tiles, None)
+            return tiles
             
+        except TileRateLimitError as err:
+            # Keep the last known data and poll less often until the
+            # account's request budget recovers
+            if not self.data:
+                raise UpdateFailed(f"Tile API rate limited: {err}") from err
+            self._stretch_update_interval(err.retry_after)
+            return self.data
         except TileAuthError as err:
             # Trigger reauth flow
             raise ConfigEntryAuthFailed(str(err)) from err
         except Exception as err:
             raise UpdateFailed(f"Error fetching Tile data: {err}") from err
+        finally:
+            # Persist a renewed session or refreshed metadata; only the
+            # entry polling the account persists its shared client
+            if self.api_store and self._polls_account():
+                self.api_store.async_schedule_save(self.api)
+
+    def _polls_account(self) -> bool:
+        """Return True if this entry polls its account's shared API client."""
+        return self.accounts is None or self.accounts.is_primary(self.entry_id)
+
+    def _stretch_update_interval(self, retry_after: float) -> None:
+        """Poll no sooner than the rate limiter allows."""
+        interval = max(self._base_update_interval, timedelta(seconds=retry_after))
+        if interval != self.update_interval:
+            _LOGGER.warning(
+                "Tile API rate limited, polling every %s until it recovers",
+                interval,
+            )
+            self.update_interval = interval
+        self._rate_limited = True
+
+    def _schedule_next_poll(
+        self,
+        tiles: dict[str, TileDevice],
+        polled: list[str] | None,
+    ) -> None:
+        """Reschedule tiles and wake up when the next one is due.
+        
+        The wakeup is also capped by the next metadata refresh so the slow
+        tier keeps its cadence while every tile is backed off.
+        
+        Args:
+            tiles: Tiles after this refresh
+            polled: UUIDs refreshed as due (None if every tile was)
+        """
+        self.poll_scheduler.observe_all(tiles, time.monotonic(), polled)
+        self.presence.prune(tiles)
+        self._update_wakeup()
+        
+        if self._rate_limited:
+            _LOGGER.info("Tile API recovered, resuming adaptive polling")
+            self._rate_limited = False
+
+    def _update_wakeup(self) -> None:
+        """Set update_interval to when the next tile (or metadata) is due."""
+        now = time.monotonic()
+        delay = self.poll_scheduler.next_due(now)
+        if delay is None:
+            delay = self._base_update_interval.total_seconds()
+        if self._last_metadata_refresh is not None:
+            delay = min(
+                delay,
+                METADATA_REFRESH_INTERVAL - (now - self._last_metadata_refresh),
+            )
+        self.update_interval = timedelta(
+            seconds=max(delay, self.poll_scheduler.hot_interval)
+        )
+
+    def _metadata_refresh_due(self) -> bool:
+        """Return True if the slow (metadata) tier should run this poll."""
+        return (
+            not self.data
+            or self._last_metadata_refresh is None
+            or time.monotonic() - self._last_metadata_refresh >= METADATA_REFRESH_INTERVAL
+        )
+
+    async def _async_refresh_states(
+        self,
+        due: list[str],
+    ) -> dict[str, TileDevice] | None:
+        """Update locations on existing tiles from tiles/tile_states.
+        
+        tile_states is one call for the whole account, so every tile is
+        updated for the price of the due ones. If it fails or carries no
+        locations, only the due tiles are fetched, one detail call each.
+        
+        Returns None when the slow tier is needed instead: nothing usable
+        came back, or tile_states reported a tile we don't know yet.
+        """
+        states = await self.api.get_tile_states()
+        if not states:
+            return await self._async_refresh_due_tiles(due)
+        
+        new_uuids = (
+            states.keys() - self.data.keys() - self._inactive_uuids - self._foreign_uuids
+        )
+        if new_uuids:
+            _LOGGER.debug("New tiles in tile_states: %s", ", ".join(sorted(new_uuids)))
+            return None
+        
+        applied = 0
+        for tile_uuid, state in states.items():
+            tile = self.data.get(tile_uuid)
+            if tile is not None and tile.apply_state(state):
+                applied += 1
+        
+        if not applied:
+            _LOGGER.debug("tile_states carried no locations, fetching due tiles")
+            return await self._async_refresh_due_tiles(due)
+        
+        _LOGGER.debug("Updated %d/%d tiles from tile_states", applied, len(self.data))
+        return dict(self.data)
+
+    async def _async_refresh_due_tiles(
+        self,
+        due: list[str],
+    ) -> dict[str, TileDevice] | None:
+        """Fetch details for the due tiles in one concurrent sweep.
+        
+        Returns None (slow tier) if none of them loaded.
+        """
+        refreshed = await self.api.get_tile_details(due)
+        if not refreshed:
+            return None
+        
+        tiles = dict(self.data)
+        for tile in refreshed:
+            tiles[tile.tile_uuid] = tile
+        _LOGGER.debug("Refreshed %d/%d due tiles", len(refreshed), len(due))
+        return tiles
+
+    async def _async_sync_tiles(self) -> dict[str, TileDevice]:
+        """Sync tiles incrementally and merge them into the current data.
+        
+        Falls back to a full resync on first refresh, every
+        FULL_SYNC_INTERVAL seconds, or when the delta reports a gap.
+        """
+        now = time.monotonic()
+        full = (
+            not self.data
+            or self._last_full_sync is None
+            or now - self._last_full_sync >= FULL_SYNC_INTERVAL
+        )
+        
+        # Cold tiles (older than exclude_days) never cost a detail call here;
+        # they are checked by the daily sweep and promoted on a new fix.
+        # Neither do tiles another entry owns, it fetches them already.
+        skip = self.poll_scheduler.cold_tiles | self._foreign_uuids
+        result = await self.api.sync_tiles(full=full, skip_details=skip)
+        if result.gap:
+            _LOGGER.debug("Incremental sync found a gap, running full resync")
+            result = await self.api.sync_tiles(full=True, skip_details=skip)
+        
+        # Tiles whose detail fetch failed come back without static data;
+        # keep what the previous record had rather than losing the auth key
+        previous = self.data or {}
+        for tile_uuid, tile in result.tiles.items():
+            if (old := previous.get(tile_uuid)) is not None and old is not tile:
+                tile.keep_metadata(old)
+        
+        if result.full:
+            self._last_full_sync = now
+            self._inactive_uuids = set(result.removed)
+            return dict(result.tiles)
+        
+        # Merge changes into the existing tiles, keyed by tile_uuid
+        tiles = dict(self.data)
+        tiles.update(result.tiles)
+        for tile_uuid in result.removed:
+            tiles.pop(tile_uuid, None)
+        self._inactive_uuids = (self._inactive_uuids | result.removed) - result.tiles.keys()
+        return tiles
@@ -0,0 +1,185 @@
+"""Tile accounts shared between config entries.
+
+Copyright (c) 2024-2026 Jeff Hamm
+SPDX-License-Identifier: MIT
+
+Config entries for the same Tile account share one TileApiClient: the
+first entry to load an account is its primary and polls it, later entries
+for the account follow without fetching anything. A tile shared between
+accounts is owned by the first entry that reports it; other entries skip
+its detail fetches and don't create entities for it. When an entry unloads
+or stops reporting tiles, the remaining entries are told to resync so they
+can take over.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Callable, Iterable
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from .tile_api import TileApiClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def account_key(email: str) -> str:
+    """Normalize an account email (the config flow's unique ID)."""
+    return email.strip().lower()
+
+
+class _Account:
+    """One Tile account and the entries using it."""
+
+    __slots__ = ("api", "entry_ids")
+
+    def __init__(self, api: TileApiClient) -> None:
+        """Initialize the account."""
+        self.api = api
+        self.entry_ids: list[str] = []
+
+
+class TileAccountRegistry:
+    """API clients per account and tile ownership per config entry."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._accounts: dict[str, _Account] = {}
+        self._entry_accounts: dict[str, str] = {}
+        # tile_uuid -> owning entry_id, and each entry's tiles
+        self._owners: dict[str, str] = {}
+        self._owned: dict[str, set[str]] = {}
+        self._listeners: dict[str, Callable[[], None]] = {}
+
+    def acquire(
+        self,
+        entry_id: str,
+        email: str,
+        create: Callable[[], TileApiClient],
+    ) -> tuple[TileApiClient, bool]:
+        """Get the account's API client, creating it for the first entry.
+
+        Args:
+            entry_id: Config entry using the account
+            email: Account email
+            create: Factory for a new client
+
+        Returns:
+            The shared client, and True if it was just created
+        """
+        key = account_key(email)
+        account = self._accounts.get(key)
+        created = account is None
+        if account is None:
+            account = self._accounts[key] = _Account(create())
+        elif entry_id not in account.entry_ids:
+            _LOGGER.debug("Sharing Tile account %s with entry %s", key, entry_id)
+
+        if entry_id not in account.entry_ids:
+            account.entry_ids.append(entry_id)
+        self._entry_accounts[entry_id] = key
+        return account.api, created
+
+    def is_primary(self, entry_id: str) -> bool:
+        """Return True if the entry polls its account (the first to load it)."""
+        key = self._entry_accounts.get(entry_id)
+        if key is None:
+            return True
+        return self._accounts[key].entry_ids[0] == entry_id
+
+    def listen(self, entry_id: str, on_release: Callable[[], None]) -> Callable[[], None]:
+        """Call ``on_release`` when tiles or an account may need a new owner.
+
+        Returns:
+            Callback that removes the listener
+        """
+        self._listeners[entry_id] = on_release
+
+        def _unlisten() -> None:
+            if self._listeners.get(entry_id) is on_release:
+                del self._listeners[entry_id]
+
+        return _unlisten
+
+    def claim_tiles(self, entry_id: str, tile_uuids: Iterable[str]) -> set[str]:
+        """Claim the tiles an entry reports.
+
+        Tiles nobody owns go to this entry; tiles it owned but no longer
+        reports are released.
+
+        Returns:
+            The reported tiles this entry owns
+        """
+        owned: set[str] = set()
+        for tile_uuid in tile_uuids:
+            if self._owners.setdefault(tile_uuid, entry_id) == entry_id:
+                owned.add(tile_uuid)
+
+        dropped = self._owned.get(entry_id, set()) - owned
+        for tile_uuid in dropped:
+            del self._owners[tile_uuid]
+        self._owned[entry_id] = owned
+        if dropped:
+            self._notify(entry_id)
+        return owned
+
+    def owner(self, tile_uuid: str) -> str | None:
+        """Return the entry that owns a tile."""
+        return self._owners.get(tile_uuid)
+
+    def release(self, entry_id: str) -> bool:
+        """Drop an entry's account and tile claims.
+
+        Returns:
+            True if no other entry uses the entry's API client any more
+        """
+        owned = self._owned.pop(entry_id, set())
+        for tile_uuid in owned:
+            self._owners.pop(tile_uuid, None)
+        self._listeners.pop(entry_id, None)
+
+        key = self._entry_accounts.pop(entry_id, None)
+        account = self._accounts.get(key) if key else None
+        if account is None:
+            return True
+
+        was_primary = account.entry_ids[0] == entry_id
+        account.entry_ids.remove(entry_id)
+        if not account.entry_ids:
+            del self._accounts[key]
+            last = True
+        else:
+            last = False
+
+        if owned or (was_primary and not last):
+            self._notify(entry_id)
+        return last
+
+    def _notify(self, entry_id: str) -> None:
+        """Tell every other entry to resync."""
+        for other_id, on_release in list(self._listeners.items()):
+            if other_id != entry_id:
+                on_release()
+
+    def __len__(self) -> int:
+        """Return the number of loaded accounts."""
+        return len(self._accounts)
+
+
+# Shared registry per hass instance
+_account_registries: dict[int, TileAccountRegistry] = {}
+
+
+def get_account_registry(hass: HomeAssistant) -> TileAccountRegistry:
+    """Get or create the account registry for a Home Assistant instance."""
+    hass_id = id(hass)
+    if hass_id not in _account_registries:
+        _account_registries[hass_id] = TileAccountRegistry()
+    return _account_registries[hass_id]
+
+
+def async_cleanup_account_registry(hass: HomeAssistant) -> None:
+    """Drop the account registry once no account is loaded."""
+    registry = _account_registries.get(id(hass))
+    if registry is not None and not len(registry):
+        del _account_registries[id(hass)]
@@ -78,7 +78,7 @@ class TileLostBinarySensor(CoordinatorEntity, BinarySensorEntity):
         tile_uuid: str,
     ) -> None:
         """Initialize the lost binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=tile_uuid)
         self._tile_uuid = tile_uuid
         self._attr_unique_id = f"tile_{tile_uuid}_lost"
         self._attr_name = "Lost"
@@ -136,7 +136,7 @@ class TileLocateButton(CoordinatorEntity, ButtonEntity, RestoreEntity):
         entity_enabled: bool = True,
     ) -> None:
         """Initialize the locate button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=tile_uuid)
         self._hass = hass
         self._tile_uuid = tile_uuid
         self._attr_unique_id = f"tile_{tile_uuid}_locate"
@@ -282,7 +282,7 @@ class TileRefreshDeviceButton(CoordinatorEntity, ButtonEntity, RestoreEntity):
         entity_enabled: bool = True,
     ) -> None:
         """Initialize the refresh button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=tile_uuid)
         self._tile_uuid = tile_uuid
         self._attr_unique_id = f"tile_{tile_uuid}_refresh"
         self._attr_name = "Refresh"
@@ -358,7 +358,7 @@ class TileProgramRingtoneButton(CoordinatorEntity, ButtonEntity):
         entity_enabled: bool = True,
     ) -> None:
         """Initialize the program ringtone button."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=tile_uuid)
         self._hass = hass
         self._tile_uuid = tile_uuid
         self._attr_unique_id = f"tile_{tile_uuid}_program_ringtone"
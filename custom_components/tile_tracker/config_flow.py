@@ -26,6 +26,12 @@ from .const import (
     DEFAULT_EXCLUDE_DAYS,
     CONF_EXCLUDE_INVISIBLE,
     DEFAULT_EXCLUDE_INVISIBLE,
+    CONF_PRESENCE_HOME_RSSI,
+    DEFAULT_PRESENCE_HOME_RSSI,
+    CONF_PRESENCE_AWAY_RSSI,
+    DEFAULT_PRESENCE_AWAY_RSSI,
+    CONF_PRESENCE_AWAY_AFTER,
+    DEFAULT_PRESENCE_AWAY_AFTER,
 )
 from .tile_api import TileApiClient
 
@@ -150,31 +156,58 @@ class TileTrackerOptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
-        if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+        errors: dict[str, str] = {}
 
+        if user_input is not None:
+            if user_input.get(
+                CONF_PRESENCE_HOME_RSSI, DEFAULT_PRESENCE_HOME_RSSI
+            ) <= user_input.get(CONF_PRESENCE_AWAY_RSSI, DEFAULT_PRESENCE_AWAY_RSSI):
+                errors[CONF_PRESENCE_AWAY_RSSI] = "away_rssi_not_below_home"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = user_input or self.config_entry.options
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
-                        default=self.config_entry.options.get(
+                        default=options.get(
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                         ),
                     ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
                     vol.Optional(
                         CONF_EXCLUDE_DAYS,
-                        default=self.config_entry.options.get(
+                        default=options.get(
                             CONF_EXCLUDE_DAYS, DEFAULT_EXCLUDE_DAYS
                         ),
                     ): vol.All(vol.Coerce(int), vol.Range(min=0, max=365)),
                     vol.Optional(
                         CONF_EXCLUDE_INVISIBLE,
-                        default=self.config_entry.options.get(
+                        default=options.get(
                             CONF_EXCLUDE_INVISIBLE, DEFAULT_EXCLUDE_INVISIBLE
                         ),
                     ): bool,
+                    vol.Optional(
+                        CONF_PRESENCE_HOME_RSSI,
+                        default=options.get(
+                            CONF_PRESENCE_HOME_RSSI, DEFAULT_PRESENCE_HOME_RSSI
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=-120, max=-20)),
+                    vol.Optional(
+                        CONF_PRESENCE_AWAY_RSSI,
+                        default=options.get(
+                            CONF_PRESENCE_AWAY_RSSI, DEFAULT_PRESENCE_AWAY_RSSI
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=-120, max=-20)),
+                    vol.Optional(
+                        CONF_PRESENCE_AWAY_AFTER,
+                        default=options.get(
+                            CONF_PRESENCE_AWAY_AFTER, DEFAULT_PRESENCE_AWAY_AFTER
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
                 }
             ),
+            errors=errors,
         )
@@ -24,6 +24,59 @@ TILE_APP_ID: Final = "android-tile-production"
 TILE_APP_VERSION: Final = "2.109.0.4485"
 TILE_USER_AGENT: Final = "Tile/android/2.109.0/4485 (Unknown; Android11)"
 
+# Tile API request tuning
+API_MAX_CONCURRENT_REQUESTS: Final = 8  # in-flight per-tile detail requests
+API_REQUEST_TIMEOUT: Final = 15.0  # seconds, per request
+API_CONNECT_TIMEOUT: Final = 10.0  # seconds
+API_CONNECTION_LIMIT_PER_HOST: Final = 8  # pooled keep-alive connections
+API_KEEPALIVE_TIMEOUT: Final = 90.0  # seconds an idle connection is kept
+API_DNS_CACHE_TTL: Final = 300  # seconds
+
+# Per-account rate limiting and backoff
+API_RATE_LIMIT: Final = 5.0  # sustained requests per second
+API_RATE_BURST: Final = 30  # token bucket size
+API_MAX_RETRIES: Final = 3  # retries for 429/5xx responses
+API_MAX_RETRY_WAIT: Final = 30.0  # seconds; longer waits fail the request
+API_BACKOFF_BASE: Final = 2.0  # seconds
+API_BACKOFF_MAX: Final = 900.0  # seconds
+
+# Incremental /users/groups sync
+FULL_SYNC_INTERVAL: Final = 3600  # seconds between forced full resyncs
+SYNC_WATERMARK_OVERLAP: Final = 60_000  # ms re-requested to absorb clock skew
+
+# Two-tier refresh: tile_states every poll, metadata on a long interval
+METADATA_REFRESH_INTERVAL: Final = 1800  # seconds
+
+# Adaptive per-tile polling (the scan interval is the base interval)
+POLL_HOT_INTERVAL: Final = 60  # seconds, for moving or recently seen tiles
+POLL_HOT_WINDOW: Final = 900  # seconds a fix counts as recent
+POLL_MAX_INTERVAL: Final = 4 * 3600  # seconds, cap for unchanged tiles
+POLL_BACKOFF_FACTOR: Final = 2.0  # interval growth per unchanged poll
+COLD_POLL_INTERVAL: Final = 86400  # seconds, for tiles older than exclude_days
+
+# Refresh scheduling shared by all config entries
+REFRESH_SPREAD_WINDOW: Final = 60.0  # seconds; entries get evenly spaced slots in it
+REFRESH_JITTER: Final = 0.1  # fraction of the slot spacing
+REFRESH_MAX_CONCURRENT_SWEEPS: Final = 2  # account refreshes running at once
+REFRESH_STATS_WINDOW: Final = 3600.0  # seconds of sweeps used for saturation
+
+# TTLs (seconds) for static TileDevice fields kept in the metadata cache
+METADATA_FIELD_TTLS: Final = {
+    "auth_key": 7 * 86400,
+    "firmware_version": 86400,
+    "hardware_version": 30 * 86400,
+    "archetype": 30 * 86400,
+    "product": 30 * 86400,
+    "expected_tdt_cmd_config": 86400,
+}
+API_CACHE_SAVE_DELAY: Final = 30  # seconds
+
+# Coordinator snapshot used to seed entities at startup
+SNAPSHOT_SAVE_DELAY: Final = 60  # seconds
+
+# Assumed session lifetime when the login cookie carries no expiry
+SESSION_DEFAULT_LIFETIME: Final = 7 * 86400  # seconds
+
 # BLE UUIDs for Tile devices
 FEED_SERVICE_UUID: Final = "0000feed-0000-1000-8000-00805f9b34fb"
 FEEC_SERVICE_UUID: Final = "0000feec-0000-1000-8000-00805f9b34fb"
@@ -39,6 +92,9 @@ BLE_SCAN_TIMEOUT: Final = 10.0  # seconds
 # Cache TTL values
 UUID_MAC_CACHE_TTL: Final = 3600  # 1 hour - MAC addresses rarely change
 SCAN_CACHE_TTL: Final = 60  # 1 minute - for rapid re-scans
+BLE_CACHE_SAVE_DELAY: Final = 120  # seconds - persisted UUID→MAC mappings
+BLE_DEVICE_CACHE_SIZE: Final = 256  # devices kept by the BLE cache
+BLE_DEVICE_CACHE_TTL: Final = 900  # 15 minutes - drop devices not seen since
 
 # Services
 SERVICE_REFRESH_TILES: Final = "refresh_tiles"
@@ -74,6 +130,16 @@ CONF_EXCLUDE_DAYS: Final = "exclude_days"
 DEFAULT_EXCLUDE_DAYS: Final = 365  # days
 CONF_EXCLUDE_INVISIBLE: Final = "exclude_invisible"
 DEFAULT_EXCLUDE_INVISIBLE: Final = True
+CONF_PRESENCE_HOME_RSSI: Final = "presence_home_rssi"
+DEFAULT_PRESENCE_HOME_RSSI: Final = -85  # dBm, smoothed RSSI to count as home
+CONF_PRESENCE_AWAY_RSSI: Final = "presence_away_rssi"
+DEFAULT_PRESENCE_AWAY_RSSI: Final = -95  # dBm, smoothed RSSI to count as away
+CONF_PRESENCE_AWAY_AFTER: Final = "presence_away_after"
+DEFAULT_PRESENCE_AWAY_AFTER: Final = 300  # seconds unheard before away
+
+# Local presence from BLE advertisements
+PRESENCE_RSSI_SMOOTHING: Final = 0.3  # EWMA weight of each new RSSI sample
+PRESENCE_CHECK_INTERVAL: Final = 30  # seconds between unheard-tile checks
 
 # Attribution
 ATTRIBUTION: Final = "Data provided by Tile"
@@ -105,6 +171,8 @@ ATTR_VISIBLE: Final = "visible"
 ATTR_DEAD: Final = "dead"
 ATTR_PRODUCT: Final = "product"
 ATTR_MAC_ADDRESS: Final = "mac_address"
+ATTR_LOCAL_RSSI: Final = "local_rssi"
+ATTR_LOCAL_LAST_SEEN: Final = "local_last_seen"
 
 # Services
 SERVICE_SET_LOST: Final = "set_lost"
@@ -7,12 +7,15 @@ SPDX-License-Identifier: MIT
 """
 from __future__ import annotations
 
+from datetime import datetime, timezone
 import logging
 from typing import Any
 
+from homeassistant.components import zone
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_HOME, STATE_NOT_HOME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -31,7 +34,10 @@ from .const import (
     ATTR_DURATION,
     ATTR_SONG_NAME,
     ATTR_BATTERY_STATUS,
+    ATTR_LOCAL_RSSI,
+    ATTR_LOCAL_LAST_SEEN,
 )
+from .presence import TilePresence
 from .tile_api import TileDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -88,7 +94,7 @@ class TileDeviceTracker(CoordinatorEntity, TrackerEntity):
         tile_uuid: str,
     ) -> None:
         """Initialize the Tile device tracker."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=tile_uuid)
         self._tile_uuid = tile_uuid
         self._attr_unique_id = f"tile_{tile_uuid}"
         
@@ -109,6 +115,34 @@ class TileDeviceTracker(CoordinatorEntity, TrackerEntity):
             return self.coordinator.data.get(self._tile_uuid)
         return None
 
+    @property
+    def presence(self) -> TilePresence | None:
+        """Return the tile's presence from local advertisements."""
+        return self.coordinator.presence.get(self._tile_uuid)
+
+    @property
+    def location_name(self) -> str | None:
+        """Return home/away from local advertisements.
+        
+        A tile heard at home is home. Otherwise the state follows the
+        cloud's coordinates (None), unless the tile has gone unheard for
+        the away timeout and the coordinates aren't in any zone.
+        """
+        presence = self.presence
+        if presence is None:
+            return None
+        if presence.home:
+            return STATE_HOME
+        if not self.coordinator.presence.timed_out(self._tile_uuid):
+            return None
+        
+        latitude, longitude = self.latitude, self.longitude
+        if latitude is not None and longitude is not None and zone.async_active_zone(
+            self.hass, latitude, longitude, self.location_accuracy
+        ) is not None:
+            return None
+        return STATE_NOT_HOME
+
     @property
     def source_type(self) -> SourceType:
         """Return the source type."""
@@ -169,6 +203,13 @@ class TileDeviceTracker(CoordinatorEntity, TrackerEntity):
             if self.tile.advertised_rssi is not None:
                 attrs[ATTR_ADVERTISED_RSSI] = self.tile.advertised_rssi
             
+            # Smoothed signal from Home Assistant's own adapters
+            if (presence := self.presence) is not None:
+                attrs[ATTR_LOCAL_RSSI] = round(presence.rssi)
+                attrs[ATTR_LOCAL_LAST_SEEN] = datetime.fromtimestamp(
+                    presence.last_seen, tz=timezone.utc
+                ).isoformat()
+            
             # Speed
             if self.tile.speed is not None:
                 attrs[ATTR_SPEED] = self.tile.speed
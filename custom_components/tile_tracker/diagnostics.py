@@ -75,6 +75,15 @@ async def async_get_config_entry_diagnostics(
             "last_update_success": coordinator.last_update_success if coordinator else None,
             "last_update_time": coordinator.last_update_success_time.isoformat() if coordinator and coordinator.last_update_success_time else None,
             "update_interval": str(coordinator.update_interval) if coordinator else None,
+            "poll_scheduler": coordinator.poll_scheduler.stats() if coordinator else None,
+            "refresh_scheduler": coordinator.refresh_scheduler.stats() if coordinator and coordinator.refresh_scheduler else None,
+            "presence": coordinator.presence.stats() if coordinator else None,
+        },
+        "api": {
+            "last_fetch_duration": api.last_fetch_duration if api else None,
+            "last_fetch_failures": len(api.last_fetch_failures) if api else None,
+            "rate_limit": api.rate_limiter.budget if api else None,
+            "json_decoder": api.json_decoder if api else None,
         },
     }
     
@@ -70,7 +70,7 @@ class TileDefaultDurationNumber(CoordinatorEntity, NumberEntity, RestoreEntity):
         tile: TileDevice,
     ) -> None:
         """Initialize the duration number entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=tile.tile_uuid)
         self._tile = tile
         self._attr_unique_id = f"{tile.tile_uuid}_default_duration"
         self._attr_device_info = {
@@ -0,0 +1,279 @@
+"""Adaptive per-tile polling for Tile Tracker integration.
+
+Every tile gets its own next-refresh time. Moving or recently seen tiles
+are polled often, tiles whose state doesn't change back off exponentially,
+tiles older than the staleness threshold sit in a daily "cold" tier, and
+the coordinator wakes up when the earliest tile is due and refreshes
+everything due in one sweep.
+
+Copyright (c) 2024-2026 Jeff Hamm
+SPDX-License-Identifier: MIT
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Iterable, Mapping
+
+from .const import (
+    COLD_POLL_INTERVAL,
+    POLL_BACKOFF_FACTOR,
+    POLL_HOT_INTERVAL,
+    POLL_HOT_WINDOW,
+    POLL_MAX_INTERVAL,
+)
+from .tile_api import TileDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def tile_fingerprint(tile: TileDevice) -> tuple[Any, ...]:
+    """Return the state fields whose change makes a tile worth polling."""
+    return (
+        tile.last_timestamp_ms,
+        tile.latitude,
+        tile.longitude,
+        tile.ring_state,
+        tile.connection_state,
+        tile.battery_status,
+        tile.lost,
+    )
+
+
+class _PollState:
+    """Polling state of one tile."""
+
+    __slots__ = ("interval", "next_due", "fingerprint")
+
+    def __init__(self, interval: float, next_due: float, fingerprint: tuple) -> None:
+        """Initialize the poll state."""
+        self.interval = interval
+        self.next_due = next_due
+        self.fingerprint = fingerprint
+
+
+class TilePollScheduler:
+    """Per-tile refresh schedule with exponential backoff.
+
+    Times passed in are monotonic seconds. A tile is "hot" if it reports
+    speed or its last fix is within the hot window; hot tiles are polled
+    every ``hot_interval``. A tile whose state changed is polled again after
+    ``base_interval`` (the configured scan interval), and every poll that
+    finds it unchanged multiplies its interval by ``backoff`` up to
+    ``max_interval``.
+    
+    Tiles whose last fix is older than ``cold_after`` seconds (the
+    exclude_days option) are cold: they are checked every ``cold_interval``
+    and callers skip their per-tile detail fetches. A new fix brings a cold
+    tile straight back.
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        hot_interval: float = POLL_HOT_INTERVAL,
+        max_interval: float = POLL_MAX_INTERVAL,
+        hot_window: float = POLL_HOT_WINDOW,
+        backoff: float = POLL_BACKOFF_FACTOR,
+        cold_after: float | None = None,
+        cold_interval: float = COLD_POLL_INTERVAL,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.cold_after = cold_after
+        self.cold_interval = cold_interval
+        self._cold: set[str] = set()
+        self._hot_interval = hot_interval
+        self._max_interval = max_interval
+        self._hot_window_ms = hot_window * 1000
+        self._backoff = max(1.0, backoff)
+        self._tiles: dict[str, _PollState] = {}
+        self.base_interval = base_interval
+
+    def __len__(self) -> int:
+        """Return the number of scheduled tiles."""
+        return len(self._tiles)
+
+    @property
+    def base_interval(self) -> float:
+        """Return the interval for tiles that just changed."""
+        return self._base_interval
+
+    @base_interval.setter
+    def base_interval(self, value: float) -> None:
+        """Set the base interval; hot and max intervals are kept around it."""
+        self._base_interval = value
+        self.hot_interval = min(self._hot_interval, value)
+        self.max_interval = max(self._max_interval, value)
+
+    def is_hot(self, tile: TileDevice, wall_now: float | None = None) -> bool:
+        """Return True if a tile is moving or was seen recently."""
+        if tile.speed:
+            return True
+        last_ms = tile.last_timestamp_ms
+        if not last_ms:
+            return False
+        if wall_now is None:
+            wall_now = time.time()
+        return wall_now * 1000 - last_ms < self._hot_window_ms
+
+    def is_stale(self, tile: TileDevice, wall_now: float | None = None) -> bool:
+        """Return True if a tile's last fix is older than ``cold_after``."""
+        if not self.cold_after:
+            return False
+        last_ms = tile.last_timestamp_ms
+        if not last_ms:
+            return False
+        if wall_now is None:
+            wall_now = time.time()
+        return wall_now * 1000 - last_ms > self.cold_after * 1000
+
+    @property
+    def cold_tiles(self) -> set[str]:
+        """Return UUIDs of tiles in the cold tier."""
+        return self._cold
+
+    def observe(
+        self,
+        tile: TileDevice,
+        now: float,
+        polled: bool = True,
+        wall_now: float | None = None,
+    ) -> float:
+        """Record a tile's latest state and reschedule it.
+
+        Args:
+            tile: The tile as just refreshed
+            now: Current monotonic time
+            polled: True if the tile was due and this counts as its poll.
+                Tiles refreshed for free (by an account-wide call) are only
+                rescheduled when their state changed.
+            wall_now: Current wall-clock time (defaults to time.time())
+
+        Returns:
+            Seconds until the tile is due again
+        """
+        fingerprint = tile_fingerprint(tile)
+        state = self._tiles.get(tile.tile_uuid)
+        changed = state is None or state.fingerprint != fingerprint
+
+        cold = False
+        if self.is_hot(tile, wall_now):
+            interval = self.hot_interval
+        elif not changed and not polled:
+            return max(0.0, state.next_due - now)
+        elif self.is_stale(tile, wall_now):
+            interval = self.cold_interval
+            cold = True
+        elif changed:
+            interval = self.base_interval
+        else:
+            interval = min(state.interval * self._backoff, self.max_interval)
+
+        if cold != (tile.tile_uuid in self._cold):
+            _LOGGER.debug(
+                "Tile %s moved to the %s tier",
+                tile.tile_uuid,
+                "cold" if cold else "active",
+            )
+            if cold:
+                self._cold.add(tile.tile_uuid)
+            else:
+                self._cold.discard(tile.tile_uuid)
+
+        if state is None:
+            self._tiles[tile.tile_uuid] = _PollState(interval, now + interval, fingerprint)
+        else:
+            state.interval = interval
+            state.next_due = now + interval
+            state.fingerprint = fingerprint
+        return interval
+
+    def observe_all(
+        self,
+        tiles: Mapping[str, TileDevice],
+        now: float,
+        polled: Iterable[str] | None = None,
+    ) -> None:
+        """Observe every tile and forget tiles that are gone.
+
+        Args:
+            tiles: Current tiles keyed by UUID
+            now: Current monotonic time
+            polled: UUIDs that were due this sweep (None means all)
+        """
+        polled_set = None if polled is None else set(polled)
+        wall_now = time.time()
+        for tile_uuid, tile in tiles.items():
+            self.observe(
+                tile,
+                now,
+                polled=polled_set is None or tile_uuid in polled_set,
+                wall_now=wall_now,
+            )
+        for tile_uuid in self._tiles.keys() - tiles.keys():
+            del self._tiles[tile_uuid]
+            self._cold.discard(tile_uuid)
+
+    def rebase(self, tiles: Mapping[str, TileDevice], now: float) -> None:
+        """Re-derive every tile's tier after the settings changed.
+        
+        Used when ``base_interval`` or ``cold_after`` is changed at runtime:
+        tiles that became stale go cold, cold tiles that no longer are come
+        back at the base interval, and no active tile waits longer than its
+        new interval.
+        """
+        wall_now = time.time()
+        for tile_uuid, tile in tiles.items():
+            state = self._tiles.get(tile_uuid)
+            if state is None:
+                continue
+            
+            was_cold = tile_uuid in self._cold
+            if self.is_stale(tile, wall_now):
+                self._cold.add(tile_uuid)
+                if not was_cold:
+                    state.interval = self.cold_interval
+                    state.next_due = now + self.cold_interval
+                continue
+            
+            self._cold.discard(tile_uuid)
+            interval = self.hot_interval if self.is_hot(tile, wall_now) else self.base_interval
+            if was_cold or state.interval > interval:
+                state.interval = interval
+            state.next_due = min(state.next_due, now + state.interval)
+            if was_cold:
+                state.next_due = now + interval
+
+    def due(self, now: float) -> list[str]:
+        """Return the UUIDs of tiles due for a refresh."""
+        return [
+            tile_uuid
+            for tile_uuid, state in self._tiles.items()
+            if state.next_due <= now
+        ]
+
+    def next_due(self, now: float) -> float | None:
+        """Return seconds until the next tile is due (None if none scheduled)."""
+        if not self._tiles:
+            return None
+        return max(0.0, min(state.next_due for state in self._tiles.values()) - now)
+
+    def interval(self, tile_uuid: str) -> float | None:
+        """Return the current polling interval of a tile."""
+        state = self._tiles.get(tile_uuid)
+        return state.interval if state else None
+
+    def stats(self, now: float | None = None) -> dict[str, Any]:
+        """Return scheduler statistics for diagnostics."""
+        if now is None:
+            now = time.monotonic()
+        intervals = [state.interval for state in self._tiles.values()]
+        return {
+            "tiles": len(intervals),
+            "hot": sum(1 for interval in intervals if interval <= self.hot_interval),
+            "backed_off": sum(1 for interval in intervals if interval > self.base_interval),
+            "cold": len(self._cold),
+            "due": len(self.due(now)),
+            "next_due": self.next_due(now),
+            "base_interval": self.base_interval,
+        }
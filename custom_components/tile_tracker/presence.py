@@ -0,0 +1,162 @@
+"""Local presence of tiles from their BLE advertisements.
+
+Copyright (c) 2024-2026 Jeff Hamm
+SPDX-License-Identifier: MIT
+
+Home Assistant's own adapters and proxies hear our tiles advertise every
+few seconds, long before the Tile cloud gets a fix from some phone. Every
+advertisement updates an exponentially weighted moving average of the
+tile's RSSI and its last-seen time; a tile is home once the smoothed
+signal is strong enough, and only away again once it drops well below
+that or the tile goes unheard, so a flickering signal doesn't flap the
+tracker.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Collection
+
+from .const import (
+    DEFAULT_PRESENCE_AWAY_AFTER,
+    DEFAULT_PRESENCE_AWAY_RSSI,
+    DEFAULT_PRESENCE_HOME_RSSI,
+    PRESENCE_RSSI_SMOOTHING,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TilePresence:
+    """Local presence of one tile."""
+
+    __slots__ = ("rssi", "last_seen", "home")
+
+    def __init__(self, rssi: float, last_seen: float) -> None:
+        """Initialize the presence."""
+        self.rssi = rssi
+        self.last_seen = last_seen
+        self.home = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the presence for diagnostics."""
+        return {
+            "rssi": round(self.rssi, 1),
+            "last_seen": self.last_seen,
+            "home": self.home,
+        }
+
+
+class TilePresenceEngine:
+    """Home/away from smoothed RSSI with hysteresis.
+
+    Times are wall-clock seconds, so they compare with the cloud's fixes.
+    A tile becomes home when its smoothed RSSI reaches ``home_rssi``. It is
+    away when the smoothed RSSI falls below ``away_rssi`` (set lower than
+    ``home_rssi``) or it hasn't been heard for ``away_after`` seconds.
+    """
+
+    def __init__(
+        self,
+        home_rssi: float = DEFAULT_PRESENCE_HOME_RSSI,
+        away_rssi: float = DEFAULT_PRESENCE_AWAY_RSSI,
+        away_after: float = DEFAULT_PRESENCE_AWAY_AFTER,
+        smoothing: float = PRESENCE_RSSI_SMOOTHING,
+    ) -> None:
+        """Initialize the engine."""
+        self.home_rssi = home_rssi
+        self.away_rssi = min(away_rssi, home_rssi)
+        self.away_after = away_after
+        self._alpha = min(1.0, max(0.01, smoothing))
+        self._tiles: dict[str, TilePresence] = {}
+
+    def __len__(self) -> int:
+        """Return the number of tiles heard locally."""
+        return len(self._tiles)
+
+    def configure(self, home_rssi: float, away_rssi: float, away_after: float) -> None:
+        """Change the thresholds; takes effect with the next update."""
+        self.home_rssi = home_rssi
+        self.away_rssi = min(away_rssi, home_rssi)
+        self.away_after = away_after
+
+    def get(self, tile_uuid: str) -> TilePresence | None:
+        """Return a tile's presence (None if never heard locally)."""
+        return self._tiles.get(tile_uuid)
+
+    def timed_out(self, tile_uuid: str, now: float | None = None) -> bool:
+        """Return True if a tile heard locally went unheard for ``away_after``."""
+        presence = self._tiles.get(tile_uuid)
+        if presence is None:
+            return False
+        if now is None:
+            now = time.time()
+        return now - presence.last_seen > self.away_after
+
+    def observe(self, tile_uuid: str, rssi: float, now: float | None = None) -> bool:
+        """Record an advertisement heard at ``now``.
+
+        An advertisement older than the last one recorded is ignored.
+
+        Returns:
+            True if the tile's home/away state changed
+        """
+        if now is None:
+            now = time.time()
+        presence = self._tiles.get(tile_uuid)
+        if presence is not None and now < presence.last_seen:
+            return False
+        if presence is None:
+            presence = self._tiles[tile_uuid] = TilePresence(rssi, now)
+        else:
+            presence.rssi += self._alpha * (rssi - presence.rssi)
+            presence.last_seen = now
+
+        if presence.home:
+            home = presence.rssi >= self.away_rssi
+        else:
+            home = presence.rssi >= self.home_rssi
+        return self._set_home(tile_uuid, presence, home)
+
+    def check(self, now: float | None = None) -> list[str]:
+        """Mark tiles unheard for ``away_after`` seconds away.
+
+        Returns:
+            UUIDs of tiles that just left
+        """
+        if now is None:
+            now = time.time()
+        left = []
+        for tile_uuid, presence in self._tiles.items():
+            if presence.home and now - presence.last_seen > self.away_after:
+                self._set_home(tile_uuid, presence, False)
+                left.append(tile_uuid)
+        return left
+
+    def _set_home(self, tile_uuid: str, presence: TilePresence, home: bool) -> bool:
+        """Update the home flag; return True if it changed."""
+        if home == presence.home:
+            return False
+        presence.home = home
+        _LOGGER.debug(
+            "Tile %s is %s (smoothed RSSI %.1f)",
+            tile_uuid,
+            "home" if home else "away",
+            presence.rssi,
+        )
+        return True
+
+    def prune(self, tile_uuids: Collection[str]) -> None:
+        """Drop every tile not in ``tile_uuids`` (no longer tracked)."""
+        for tile_uuid in self._tiles.keys() - tile_uuids:
+            del self._tiles[tile_uuid]
+
+    def stats(self) -> dict[str, Any]:
+        """Return presence statistics for diagnostics."""
+        return {
+            "tiles": len(self._tiles),
+            "home": sum(1 for presence in self._tiles.values() if presence.home),
+            "home_rssi": self.home_rssi,
+            "away_rssi": self.away_rssi,
+            "away_after": self.away_after,
+        }
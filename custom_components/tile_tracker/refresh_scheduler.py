@@ -0,0 +1,180 @@
+"""Refresh scheduling across Tile Tracker config entries.
+
+Every config entry has its own coordinator. Left alone, entries set up at
+the same moment refresh in lockstep. The shared scheduler gives each
+coordinator an evenly spaced, slightly jittered slot in a spread window,
+caps how many account sweeps run at once, and reports how saturated the
+schedule is.
+
+Copyright (c) 2024-2026 Jeff Hamm
+SPDX-License-Identifier: MIT
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
+
+from .const import (
+    REFRESH_JITTER,
+    REFRESH_MAX_CONCURRENT_SWEEPS,
+    REFRESH_SPREAD_WINDOW,
+    REFRESH_STATS_WINDOW,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TileRefreshScheduler:
+    """Stagger and throttle coordinator refreshes for one hass instance.
+
+    Coordinators are ordered by registration and coordinator ``i`` of ``n``
+    gets the slot ``i / n`` of the spread window. offset() returns how far
+    to shift a refresh so it lands on that slot (give or take the jitter),
+    and sweep() limits how many refreshes run concurrently.
+    """
+
+    def __init__(
+        self,
+        window: float = REFRESH_SPREAD_WINDOW,
+        max_concurrent: int = REFRESH_MAX_CONCURRENT_SWEEPS,
+        jitter: float = REFRESH_JITTER,
+        stats_window: float = REFRESH_STATS_WINDOW,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.window = window
+        self.max_concurrent = max(1, max_concurrent)
+        self._jitter = jitter
+        self._stats_window = stats_window
+        self._members: list[object] = []
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._active = 0
+        self._waiting = 0
+        # (finished_at, duration, waited) of recent sweeps, monotonic seconds
+        self._sweeps: deque[tuple[float, float, float]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of registered coordinators."""
+        return len(self._members)
+
+    def register(self, member: object) -> Callable[[], None]:
+        """Add a coordinator to the schedule.
+
+        Returns:
+            Callback that removes it again
+        """
+        self._members.append(member)
+        _LOGGER.debug("Refresh scheduler has %d coordinators", len(self._members))
+
+        def _unregister() -> None:
+            if member in self._members:
+                self._members.remove(member)
+
+        return _unregister
+
+    @property
+    def slot_spacing(self) -> float:
+        """Return the time between two coordinators' slots."""
+        return self.window / max(1, len(self._members))
+
+    def offset(self, member: object, target: float) -> float:
+        """Return the shift that moves a refresh due at ``target`` to its slot.
+
+        The shift is within half a window either way, so a coordinator's
+        average interval is unchanged.
+
+        Args:
+            member: A registered coordinator
+            target: Loop time the refresh would otherwise run at
+        """
+        if member not in self._members:
+            return 0.0
+
+        spacing = self.slot_spacing
+        slot = self._members.index(member) * spacing
+        slot += random.uniform(-self._jitter, self._jitter) * spacing
+
+        shift = (slot - target) % self.window
+        if shift >= self.window / 2:
+            shift -= self.window
+        return shift
+
+    @asynccontextmanager
+    async def sweep(self) -> AsyncIterator[None]:
+        """Run one account sweep within the concurrency cap."""
+        queued = time.monotonic()
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        started = time.monotonic()
+        waited = started - queued
+        if waited > 1.0:
+            _LOGGER.debug("Account refresh waited %.1fs for a sweep slot", waited)
+
+        self._active += 1
+        try:
+            yield
+        finally:
+            self._active -= 1
+            self._semaphore.release()
+            finished = time.monotonic()
+            self._sweeps.append((finished, finished - started, waited))
+            self._prune(finished)
+
+    def _prune(self, now: float) -> None:
+        """Forget sweeps older than the stats window."""
+        while self._sweeps and now - self._sweeps[0][0] > self._stats_window:
+            self._sweeps.popleft()
+
+    def stats(self) -> dict[str, Any]:
+        """Return scheduling and saturation statistics for diagnostics.
+
+        ``saturation`` is the share of sweep capacity (``max_concurrent``
+        sweeps over the stats window) that was spent refreshing; waits mean
+        sweeps already queue behind each other.
+        """
+        now = time.monotonic()
+        self._prune(now)
+        busy = sum(duration for _, duration, _ in self._sweeps)
+        waits = [waited for _, _, waited in self._sweeps]
+        return {
+            "coordinators": len(self._members),
+            "window": self.window,
+            "slot_spacing": self.slot_spacing,
+            "max_concurrent": self.max_concurrent,
+            "active": self._active,
+            "waiting": self._waiting,
+            "sweeps": len(self._sweeps),
+            "saturation": round(busy / (self._stats_window * self.max_concurrent), 4),
+            "queued_sweeps": sum(1 for waited in waits if waited > 1.0),
+            "max_wait": round(max(waits, default=0.0), 3),
+        }
+
+
+# Shared scheduler per hass instance
+_refresh_schedulers: dict[int, TileRefreshScheduler] = {}
+
+
+def get_refresh_scheduler(hass: HomeAssistant) -> TileRefreshScheduler:
+    """Get or create the refresh scheduler for a Home Assistant instance."""
+    hass_id = id(hass)
+    if hass_id not in _refresh_schedulers:
+        _refresh_schedulers[hass_id] = TileRefreshScheduler()
+    return _refresh_schedulers[hass_id]
+
+
+def async_cleanup_refresh_scheduler(hass: HomeAssistant) -> None:
+    """Drop the refresh scheduler once no coordinator uses it."""
+    scheduler = _refresh_schedulers.get(id(hass))
+    if scheduler is not None and not len(scheduler):
+        del _refresh_schedulers[id(hass)]
@@ -63,7 +63,7 @@ class TileSongSelect(CoordinatorEntity, SelectEntity):
         tile: TileDevice,
     ) -> None:
         """Initialize the song select entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=tile.tile_uuid)
         self._tile = tile
         self._attr_unique_id = f"{tile.tile_uuid}_song"
         self._attr_device_info = {
@@ -144,7 +144,7 @@ class TileDefaultVolumeSelect(CoordinatorEntity, SelectEntity, RestoreEntity):
         tile: TileDevice,
     ) -> None:
         """Initialize the volume select entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=tile.tile_uuid)
         self._tile = tile
         self._attr_unique_id = f"{tile.tile_uuid}_default_volume"
         self._attr_device_info = {
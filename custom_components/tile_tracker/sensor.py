@@ -105,7 +105,7 @@ class TileBaseSensor(CoordinatorEntity, SensorEntity):
         tile_uuid: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=tile_uuid)
         self._tile_uuid = tile_uuid
 
     @property
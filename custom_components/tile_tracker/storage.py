@@ -15,15 +15,27 @@ from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Any, Mapping, Self
+from typing import TYPE_CHECKING, Any, Mapping, Self
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import (
+    API_CACHE_SAVE_DELAY,
+    BLE_CACHE_SAVE_DELAY,
+    DOMAIN,
+    SNAPSHOT_SAVE_DELAY,
+)
+from .tile_api import TileDevice
+
+if TYPE_CHECKING:
+    from .tile_api import TileApiClient
+    from .tile_service import TileBleCache
 
 STORAGE_VERSION = 1
+API_CACHE_STORAGE_KEY = f"{DOMAIN}.api_cache"
+BLE_CACHE_STORAGE_KEY = f"{DOMAIN}.ble_cache"
 
 
 @dataclass
@@ -88,6 +100,9 @@ class StoredTileData:
     ring_state: str | None = None
     available_songs: list[dict] | None = None
     selected_song_id: int = 0
+    
+    # Full TileDevice.as_dict() snapshot, used to seed the coordinator
+    device: dict[str, Any] | None = None
 
     def as_dict(self) -> dict[str, Any]:
         """Return a dict representation of the data."""
@@ -101,8 +116,43 @@ class StoredTileData:
             "ring_state": self.ring_state,
             "available_songs": self.available_songs,
             "selected_song_id": self.selected_song_id,
+            "device": self.device,
         }
 
+    @classmethod
+    def from_tile(cls, tile: TileDevice) -> Self:
+        """Initialize from a live TileDevice."""
+        location = None
+        if tile.latitude is not None and tile.longitude is not None:
+            location = StoredTileLocation(
+                latitude=tile.latitude,
+                longitude=tile.longitude,
+                gps_accuracy=int(tile.accuracy or 0),
+                last_seen=tile.last_timestamp or dt_util.utcnow(),
+                speed=tile.speed or 0.0,
+                altitude=tile.altitude,
+            )
+        
+        return cls(
+            tile_uuid=tile.tile_uuid,
+            name=tile.name,
+            tile_type=tile.tile_type,
+            location=location,
+            ring_state=tile.ring_state,
+            available_songs=tile.available_songs,
+            selected_song_id=tile.selected_song_id,
+            device=tile.as_dict(),
+        )
+
+    def to_tile(self) -> TileDevice | None:
+        """Return the stored TileDevice, or None if there is no snapshot."""
+        if not self.device:
+            return None
+        try:
+            return TileDevice.from_dict(self.device)
+        except (TypeError, ValueError):
+            return None
+
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> Self:
         """Initialize from a dictionary."""
@@ -120,6 +170,7 @@ class StoredTileData:
             ring_state=data.get("ring_state"),
             available_songs=data.get("available_songs"),
             selected_song_id=data.get("selected_song_id", 0),
+            device=data.get("device"),
         )
 
 
@@ -156,15 +207,21 @@ class TileTrackerStore:
     
     Provides storage that persists across Home Assistant restarts,
     allowing faster startup and last-known-location restoration.
+    With an entry_id the store holds that config entry's coordinator
+    snapshot; it is private because tile snapshots carry auth keys.
     """
 
     _loaded: bool = False
     data: TileTrackerStoreData
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, entry_id: str | None = None) -> None:
         """Initialize storage."""
-        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, DOMAIN)
+        key = DOMAIN if entry_id is None else f"{DOMAIN}.{entry_id}"
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, key, private=True
+        )
         self.data = TileTrackerStoreData()
+        self._pending: Mapping[str, TileDevice] | None = None
 
     @property
     def loaded(self) -> bool:
@@ -194,6 +251,36 @@ class TileTrackerStore:
         self.data.last_updated = dt_util.utcnow()
         await self._store.async_save(self.data.as_dict())
 
+    def get_tiles(self) -> dict[str, TileDevice]:
+        """Return the stored coordinator snapshot as TileDevice objects."""
+        tiles = {}
+        for tile_uuid, stored in self.data.tiles.items():
+            tile = stored.to_tile()
+            if tile is not None:
+                tiles[tile_uuid] = tile
+        return tiles
+
+    @callback
+    def async_schedule_save(self, tiles: Mapping[str, TileDevice]) -> None:
+        """Schedule a delayed write of the coordinator's tiles.
+        
+        The snapshot is built when the write happens, from the latest tiles
+        passed in, so frequent refreshes cost one write per delay window.
+        """
+        self._pending = tiles
+        self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Build the data written by async_schedule_save()."""
+        if self._pending is not None:
+            self.data.tiles = {
+                tile_uuid: StoredTileData.from_tile(tile)
+                for tile_uuid, tile in self._pending.items()
+            }
+            self._pending = None
+        self.data.last_updated = dt_util.utcnow()
+        return self.data.as_dict()
+
     async def remove(self) -> None:
         """Remove storage file."""
         await self._store.async_remove()
@@ -240,3 +327,92 @@ class TileTrackerStore:
             speed=kwargs.get("speed", 0.0),
             altitude=kwargs.get("altitude"),
         )
+
+
+class TileApiCacheStore:
+    """Persistent cache of Tile API client state for one config entry.
+    
+    Keeps the client's session cookie and static tile metadata cache across
+    restarts, so startup needs neither a login round trip nor a detail call
+    for every tile.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize storage."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{API_CACHE_STORAGE_KEY}.{entry_id}",
+            private=True,
+        )
+
+    async def load(self, api: TileApiClient) -> bool:
+        """Load cached state into an API client.
+        
+        Returns True if cached data was found, False otherwise.
+        """
+        try:
+            store_data = await self._store.async_load()
+        except Exception:
+            store_data = None
+        
+        if not store_data:
+            return False
+        
+        api.restore_session(store_data.get("session"))
+        api.metadata_cache.load(store_data.get("metadata"))
+        return True
+
+    @callback
+    def async_schedule_save(self, api: TileApiClient) -> None:
+        """Schedule a delayed write if the client's cached state changed."""
+        if not api.metadata_cache.dirty and not api.session_dirty:
+            return
+        api.metadata_cache.dirty = False
+        api.session_dirty = False
+        self._store.async_delay_save(
+            lambda: {
+                "session": api.session_state,
+                "metadata": api.metadata_cache.as_dict(),
+            },
+            API_CACHE_SAVE_DELAY,
+        )
+
+    async def remove(self) -> None:
+        """Remove storage file."""
+        await self._store.async_remove()
+
+
+class TileBleCacheStore:
+    """Persistent UUID→MAC mappings of the BLE cache.
+    
+    Shared by every config entry, so the first ring after a restart finds
+    the tile's MAC without a scan.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize storage."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, BLE_CACHE_STORAGE_KEY
+        )
+
+    async def async_load(self) -> dict[str, Any]:
+        """Load the stored mappings keyed by tile UUID."""
+        try:
+            store_data = await self._store.async_load()
+        except Exception:
+            store_data = None
+        return (store_data or {}).get("mappings") or {}
+
+    @callback
+    def async_schedule_save(self, cache: TileBleCache) -> None:
+        """Schedule a delayed write of the cache's mappings."""
+        cache.dirty = False
+        self._store.async_delay_save(
+            lambda: {"mappings": cache.mappings_as_dict()},
+            BLE_CACHE_SAVE_DELAY,
+        )
+
+    async def remove(self) -> None:
+        """Remove storage file."""
+        await self._store.async_remove()
@@ -79,7 +79,7 @@ class TileLostSwitch(CoordinatorEntity, SwitchEntity):
         tile_uuid: str,
     ) -> None:
         """Initialize the lost switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=tile_uuid)
         self._api = api
         self._tile_uuid = tile_uuid
         self._attr_unique_id = f"tile_{tile_uuid}_lost"
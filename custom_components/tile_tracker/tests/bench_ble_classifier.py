@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tile Advertisement Classifier Benchmark
+
+Standalone benchmark for the check run by the scan detection callback on
+every BLE advertisement in range, on a synthetic neighbourhood where most
+advertisers are phones, TVs and other non-Tile devices:
+
+- before: lower-cased string lists of service UUIDs and service-data keys
+          and five substring checks per advertisement
+- after:  tile_service.is_tile_advertisement (frozenset membership)
+
+Needs bleak and homeassistant importable (the integration's test
+environment); no adapter or Tile credentials are used.
+
+Usage:
+    python bench_ble_classifier.py
+    python bench_ble_classifier.py --adverts 20000 --tile-share 0.05 --rounds 20
+"""
+import argparse
+import importlib
+import os
+import random
+import sys
+import time
+import types
+
+# Load the integration's tile_service module without the package __init__
+INTEGRATION_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_pkg = types.ModuleType("tile_tracker_bench")
+_pkg.__path__ = [INTEGRATION_DIR]
+sys.modules["tile_tracker_bench"] = _pkg
+tile_service = importlib.import_module("tile_tracker_bench.tile_service")
+const = importlib.import_module("tile_tracker_bench.const")
+
+from bleak.backends.device import BLEDevice  # noqa: E402
+from bleak.backends.scanner import AdvertisementData  # noqa: E402
+
+OTHER_UUIDS = [
+    "0000fe9f-0000-1000-8000-00805f9b34fb",  # Google
+    "0000fd6f-0000-1000-8000-00805f9b34fb",  # Exposure notification
+    "0000180f-0000-1000-8000-00805f9b34fb",  # Battery
+    "0000fe2c-0000-1000-8000-00805f9b34fb",  # Fast pair
+    "9fa480e0-4967-4542-9390-d343dc5d04ae",  # Apple
+]
+
+
+def make_adverts(count: int, tile_share: float) -> list[tuple[BLEDevice, AdvertisementData]]:
+    """Create advertisements, ``tile_share`` of them from Tiles."""
+    rng = random.Random(1)
+    adverts = []
+    for i in range(count):
+        address = ":".join(f"{rng.randrange(256):02X}" for _ in range(6))
+        if rng.random() < tile_share:
+            name, uuids = "Tile", [const.FEED_SERVICE_UUID]
+            service_data = {const.FEED_SERVICE_UUID: b"\x02\x00"}
+        else:
+            name = rng.choice([None, "Phone", "[TV] Samsung", "Buds"])
+            uuids = rng.sample(OTHER_UUIDS, rng.randint(0, 3))
+            service_data = {uuid: b"\x00" for uuid in uuids[:1]}
+        adv = AdvertisementData(
+            local_name=name,
+            manufacturer_data={76: b"\x10\x05"},
+            service_data=service_data,
+            service_uuids=uuids,
+            tx_power=None,
+            rssi=-rng.randint(40, 100),
+            platform_data=(),
+        )
+        adverts.append((BLEDevice(address, name, {}), adv))
+    return adverts
+
+
+def classify_before(device: BLEDevice, adv_data: AdvertisementData) -> bool:
+    """Previous detection callback check."""
+    service_uuids = [str(u).lower() for u in (adv_data.service_uuids or [])]
+    service_data_keys = [str(k).lower() for k in (adv_data.service_data or {}).keys()]
+    all_services = service_uuids + service_data_keys
+
+    is_tile = any(
+        "feed" in s or "feec" in s or
+        const.FEED_SERVICE_UUID.lower() in s or
+        "0000feed" in s or "0000feec" in s
+        for s in all_services
+    )
+    if device.name and device.name.lower() == "tile":
+        is_tile = True
+    return is_tile
+
+
+def best_of(classify, adverts, rounds: int) -> float:
+    """Return the fastest of ``rounds`` passes in microseconds per advert."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for device, adv in adverts:
+            classify(device, adv)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / len(adverts) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tile advertisement classifier benchmark")
+    parser.add_argument("--adverts", type=int, default=10000)
+    parser.add_argument("--tile-share", type=float, default=0.05)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    adverts = make_adverts(args.adverts, args.tile_share)
+    after_classify = tile_service.is_tile_advertisement
+    tiles = sum(after_classify(device, adv) for device, adv in adverts)
+    assert tiles == sum(classify_before(device, adv) for device, adv in adverts)
+
+    before = best_of(classify_before, adverts, args.rounds)
+    after = best_of(after_classify, adverts, args.rounds)
+
+    print(f"{args.adverts} advertisements, {tiles} from Tiles")
+    print(f"  before (string lists + substrings): {before:6.3f} us/advert")
+    print(f"  after  (frozenset membership):      {after:6.3f} us/advert")
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
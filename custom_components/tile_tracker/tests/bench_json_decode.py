@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tile Groups Decoding Benchmark
+
+Standalone benchmark for turning a /users/groups response body into
+TileDevice objects on a synthetic account:
+
+- before: stdlib json.loads, then separate passes to split GROUP/dead/
+          invisible nodes, build tiles and find the watermark
+- after:  the client's decoder (orjson when installed) and the single
+          TileApiClient._extract_group_nodes pass
+
+Home Assistant is not required.
+
+Usage:
+    python bench_json_decode.py
+    python bench_json_decode.py --nodes 5000 --rounds 20
+"""
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+import types
+
+# Load the integration's tile_api module without importing Home Assistant
+INTEGRATION_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_pkg = types.ModuleType("tile_tracker_bench")
+_pkg.__path__ = [INTEGRATION_DIR]
+sys.modules["tile_tracker_bench"] = _pkg
+tile_api = importlib.import_module("tile_tracker_bench.tile_api")
+
+
+def make_body(node_count: int) -> bytes:
+    """Create a groups body: 80% tiles, 10% groups, 5% dead, 5% invisible."""
+    nodes = {}
+    for i in range(node_count):
+        uuid = f"{i:012x}deadbeef"
+        kind = i % 20
+        if kind < 2:
+            nodes[uuid] = {
+                "node_type": "GROUP",
+                "name": f"Group {i}",
+                "children": [f"{j:012x}deadbeef" for j in range(i, i + 8)],
+                "last_modified_timestamp": 1_700_000_000_000 + i,
+            }
+            continue
+        nodes[uuid] = {
+            "node_type": "TILE",
+            "name": f"Tile {i}",
+            "archetype": "TILE_MATE",
+            "firmware_version": "01.23.45.67",
+            "hw_version": "02.34",
+            "product": "Tile Mate",
+            "visible": kind != 3,
+            "is_dead": kind == 2,
+            "battery_status": "OK",
+            "last_modified_timestamp": 1_700_000_000_000 + i,
+            "firmware": {"expected_tdt_cmd_config": "0x01", "expected_firmware_version": "01.23.45.67"},
+            "last_tile_state": {
+                "timestamp": 1_700_000_000_000 + i,
+                "latitude": 47.6 + i / 1e5,
+                "longitude": -122.3 - i / 1e5,
+                "altitude": 50.0,
+                "h_accuracy": 12.5,
+                "advertised_rssi": -70,
+                "speed": 0.0,
+                "ring_state": "STOPPED",
+                "connection_state": "DISCONNECTED",
+                "voip_state": "OFFLINE",
+            },
+        }
+    body = {
+        "version": 1,
+        "revision": 1,
+        "timestamp": "2024-01-01T00:00:00.000Z",
+        "result_code": 0,
+        "result": {"nodes": nodes, "last_modified_timestamp": 1_700_000_000_000},
+    }
+    return json.dumps(body).encode()
+
+
+def decode_before(body: bytes) -> int:
+    """Previous pipeline: stdlib decode and three passes over the nodes."""
+    result = json.loads(body)["result"]
+    nodes = result["nodes"]
+    active = {
+        uuid: node
+        for uuid, node in nodes.items()
+        if node.get("node_type") != "GROUP"
+        and not node.get("is_dead", False)
+        and node.get("visible", True)
+    }
+    tiles = {
+        uuid: tile_api.TileDevice.from_api_response(uuid, node)
+        for uuid, node in active.items()
+    }
+    max(
+        stamp
+        for stamp in (
+            result.get("last_modified_timestamp"),
+            *(node.get("last_modified_timestamp") for node in nodes.values()),
+        )
+        if isinstance(stamp, (int, float))
+    )
+    return len(tiles)
+
+
+def decode_after(body: bytes) -> int:
+    """Current pipeline: pluggable decoder and one extraction pass."""
+    result = tile_api.json_loads(body)["result"]
+    return len(tile_api.TileApiClient._extract_group_nodes(result).tiles)
+
+
+def best_of(func, body: bytes, rounds: int) -> float:
+    """Return the fastest of ``rounds`` runs in milliseconds."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(body)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tile groups decoding benchmark")
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    body = make_body(args.nodes)
+    assert decode_before(body) == decode_after(body)
+
+    decode_only_stdlib = best_of(json.loads, body, args.rounds)
+    decode_only = best_of(tile_api.json_loads, body, args.rounds)
+    before = best_of(decode_before, body, args.rounds)
+    after = best_of(decode_after, body, args.rounds)
+
+    print(f"{args.nodes} nodes, {len(body) / 1024:.0f} KiB, {decode_after(body)} active tiles")
+    print(f"  decode only, json:        {decode_only_stdlib:7.2f} ms")
+    print(f"  decode only, {tile_api.JSON_DECODER + ':':12s} {decode_only:7.2f} ms")
+    print(f"  before (json + 3 passes): {before:7.2f} ms")
+    print(f"  after  ({tile_api.JSON_DECODER} + 1 pass): {after:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
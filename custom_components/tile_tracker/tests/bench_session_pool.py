@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tile API Connection Pool Benchmark
+
+Standalone benchmark comparing how many TCP connections (and so TLS
+handshakes against the real API) a multi-account refresh pattern opens:
+
+- before: every config entry owns a default aiohttp.ClientSession
+- after:  every entry shares one session from create_client_session()
+
+A local aiohttp server stands in for the Tile API, so no credentials or
+network access are needed. Home Assistant is not required.
+
+Usage:
+    python bench_session_pool.py
+    python bench_session_pool.py --accounts 4 --tiles 40 --refreshes 5
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import sys
+import types
+
+from aiohttp import web
+import aiohttp
+
+# Load the integration's tile_api module without importing Home Assistant
+INTEGRATION_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_pkg = types.ModuleType("tile_tracker_bench")
+_pkg.__path__ = [INTEGRATION_DIR]
+sys.modules["tile_tracker_bench"] = _pkg
+tile_api = importlib.import_module("tile_tracker_bench.tile_api")
+
+
+def make_app(tile_count: int, peers: set) -> web.Application:
+    """Create a fake Tile API with one groups call and N detail calls.
+    
+    Every client (address, port) pair seen is one TCP connection, i.e. one
+    TLS handshake against the real API.
+    """
+    uuids = [f"{i:012x}deadbeef" for i in range(tile_count)]
+
+    @web.middleware
+    async def count_connections(request: web.Request, handler):
+        peers.add(request.transport.get_extra_info("peername"))
+        return await handler(request)
+
+    async def groups(request: web.Request) -> web.Response:
+        nodes = {uuid: {"name": f"Tile {uuid[:4]}"} for uuid in uuids}
+        return web.json_response({"result_code": 0, "result": {"nodes": nodes}})
+
+    async def tile(request: web.Request) -> web.Response:
+        await asyncio.sleep(0.01)  # simulated server latency
+        uuid = request.match_info["uuid"]
+        return web.json_response({
+            "result_code": 0,
+            "result": {"name": f"Tile {uuid[:4]}", "auth_key": "a2V5"},
+        })
+
+    app = web.Application(middlewares=[count_connections])
+    app.router.add_get("/api/v1/users/groups", groups)
+    app.router.add_get("/api/v1/tiles/{uuid}", tile)
+    return app
+
+
+async def run(
+    accounts: int,
+    tiles: int,
+    refreshes: int,
+    shared: bool,
+    peers: set,
+) -> int:
+    """Run the refresh pattern and return the number of connections opened."""
+    peers.clear()
+
+    if shared:
+        pool = tile_api.create_client_session()
+        sessions = [pool] * accounts
+    else:
+        sessions = [aiohttp.ClientSession() for _ in range(accounts)]
+
+    clients = [tile_api.TileApiClient("bench", "bench", session=s) for s in sessions]
+    for client in clients:
+        # Skip login; the fake server doesn't check cookies
+        client.restore_session({"cookie": "bench=1", "expires": None})
+
+    for _ in range(refreshes):
+        for client in clients:
+            # Force a detail call per tile, as every refresh used to make
+            client.metadata_cache.invalidate()
+        await asyncio.gather(*(client.get_tiles() for client in clients))
+
+    for session in set(sessions):
+        await session.close()
+    return len(peers)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Tile API connection pool benchmark")
+    parser.add_argument("--accounts", type=int, default=3)
+    parser.add_argument("--tiles", type=int, default=30)
+    parser.add_argument("--refreshes", type=int, default=3)
+    args = parser.parse_args()
+
+    peers: set = set()
+    runner = web.AppRunner(make_app(args.tiles, peers))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    tile_api.TILE_API_BASE = f"http://127.0.0.1:{port}/api/v1"
+
+    try:
+        before = await run(args.accounts, args.tiles, args.refreshes, False, peers)
+        after = await run(args.accounts, args.tiles, args.refreshes, True, peers)
+    finally:
+        await runner.cleanup()
+
+    requests = args.accounts * args.refreshes * (args.tiles + 1)
+    print(f"{args.accounts} accounts x {args.refreshes} refreshes x {args.tiles + 1} requests = {requests}")
+    print(f"  per-entry default sessions: {before:4d} connections")
+    print(f"  shared pooled session:      {after:4d} connections")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
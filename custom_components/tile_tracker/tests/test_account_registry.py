@@ -0,0 +1,51 @@
+"""Tests for sharing accounts and tiles between config entries."""
+from unittest.mock import Mock
+
+from custom_components.tile_tracker.account_registry import TileAccountRegistry
+
+
+def test_same_account_shares_client():
+    """Test a second entry for an account gets the first entry's client."""
+    registry = TileAccountRegistry()
+    create = Mock(side_effect=[Mock(), Mock()])
+
+    first, created_first = registry.acquire("entry-1", "User@Example.com", create)
+    second, created_second = registry.acquire("entry-2", "user@example.com ", create)
+
+    assert first is second
+    assert (created_first, created_second) == (True, False)
+    assert create.call_count == 1
+    assert registry.is_primary("entry-1")
+    assert not registry.is_primary("entry-2")
+
+
+def test_release_promotes_next_entry():
+    """Test the client is closed only with its last entry, which takes over."""
+    registry = TileAccountRegistry()
+    registry.acquire("entry-1", "a@example.com", Mock)
+    registry.acquire("entry-2", "a@example.com", Mock)
+    on_release = Mock()
+    registry.listen("entry-2", on_release)
+
+    assert not registry.release("entry-1")
+    assert registry.is_primary("entry-2")
+    on_release.assert_called_once()
+
+    assert registry.release("entry-2")
+    assert len(registry) == 0
+
+
+def test_shared_tile_owned_once():
+    """Test a tile in two accounts belongs to the first entry reporting it."""
+    registry = TileAccountRegistry()
+    on_release = Mock()
+    registry.listen("entry-2", on_release)
+
+    assert registry.claim_tiles("entry-1", ["shared", "mine"]) == {"shared", "mine"}
+    assert registry.claim_tiles("entry-2", ["shared", "theirs"]) == {"theirs"}
+    assert registry.owner("shared") == "entry-1"
+
+    # entry-1 no longer reports the shared tile, entry-2 picks it up
+    registry.claim_tiles("entry-1", ["mine"])
+    on_release.assert_called_once()
+    assert registry.claim_tiles("entry-2", ["shared", "theirs"]) == {"shared", "theirs"}
@@ -0,0 +1,458 @@
+"""Tests for TileApiClient request handling."""
+import asyncio
+import json
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.tile_tracker.const import SESSION_DEFAULT_LIFETIME
+from custom_components.tile_tracker.tile_api import (
+    JSON_DECODER,
+    SingleFlight,
+    TileApiError,
+    TileAuthError,
+    TileApiClient,
+    TileRateLimiter,
+    TileDevice,
+    TileRateLimitError,
+    release_rate_limiter,
+)
+
+
+@pytest.fixture
+def api():
+    """Create a client with a restored session (no login needed)."""
+    client = TileApiClient("test@example.com", "password")
+    client.restore_session({"cookie": "session=abc", "expires": None})
+    yield client
+    # Don't leave a blocked limiter behind for later tests of the account
+    release_rate_limiter("test@example.com", client.rate_limiter)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_result():
+    """Test concurrent callers with the same key share one call."""
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(single_flight.run("key", fetch) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert calls == 1
+    assert single_flight.shared_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_single_flight_runs_again_after_completion():
+    """Test a finished call is not reused by later callers."""
+    single_flight = SingleFlight()
+    fetch = AsyncMock(return_value="ok")
+
+    await single_flight.run("key", fetch)
+    await single_flight.run("key", fetch)
+
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tile_states_coalesced(api):
+    """Test concurrent get_tile_states calls make one request."""
+    async def request(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return {"result_code": 0, "result": [{"tile_id": "uuid-1"}]}
+
+    with patch.object(api, "_request", side_effect=request) as mock_request:
+        results = await asyncio.gather(*(api.get_tile_states() for _ in range(3)))
+
+    assert mock_request.call_count == 1
+    assert all(result == {"uuid-1": {"tile_id": "uuid-1"}} for result in results)
+
+
+def test_rate_limiter_shared_per_account():
+    """Test clients of the same account share one rate limiter."""
+    first = TileApiClient("Shared@Example.com", "password")
+    second = TileApiClient("shared@example.com", "other")
+    other = TileApiClient("other@example.com", "password")
+
+    assert first.rate_limiter is second.rate_limiter
+    assert first.rate_limiter is not other.rate_limiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_released_on_close():
+    """Test closing the account's client drops its limiter and block state."""
+    client = TileApiClient("released@example.com", "password")
+    client.rate_limiter.on_throttled(600.0)
+
+    await client.close()
+
+    assert TileApiClient("released@example.com", "password").rate_limiter.retry_after == 0
+
+
+def test_rate_limiter_honours_retry_after():
+    """Test a throttled response blocks the bucket for Retry-After."""
+    limiter = TileRateLimiter()
+
+    assert limiter.on_throttled(120.0) == 120.0
+    assert 119.0 < limiter.retry_after <= 120.0
+    assert limiter.budget["consecutive_failures"] == 1
+
+
+def test_rate_limiter_backoff_grows():
+    """Test backoff without Retry-After grows with each failure."""
+    limiter = TileRateLimiter()
+
+    delays = [limiter.on_throttled() for _ in range(4)]
+
+    assert delays[3] > delays[0]
+    limiter.on_success()
+    assert limiter.budget["consecutive_failures"] == 0
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for seconds, dates and garbage."""
+    assert TileApiClient._parse_retry_after("30") == 30.0
+    assert TileApiClient._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert TileApiClient._parse_retry_after("soon") is None
+    assert TileApiClient._parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_request_fails_fast_while_blocked(api):
+    """Test requests fail immediately during a long server-imposed block."""
+    api.rate_limiter.on_throttled(600.0)
+
+    with pytest.raises(TileRateLimitError) as err:
+        await api._request("GET", "tiles/tile_states")
+
+    assert err.value.retry_after > 500
+
+
+def test_extract_group_nodes_skips_groups_and_inactive():
+    """Test one pass classifies nodes and finds the watermark."""
+    result = {
+        "last_modified_timestamp": 100,
+        "nodes": {
+            "tile-1": {"node_type": "TILE", "name": "Keys", "last_modified_timestamp": 150},
+            "tile-2": {"node_type": "TILE", "is_dead": True},
+            "tile-3": {"node_type": "TILE", "visible": False},
+            "group-1": {"node_type": "GROUP", "last_modified_timestamp": 300},
+        },
+    }
+
+    extracted = TileApiClient._extract_group_nodes(result)
+
+    assert list(extracted.tiles) == ["tile-1"]
+    assert extracted.inactive == {"tile-2", "tile-3"}
+    assert extracted.has_groups is True
+    assert extracted.watermark == 300
+
+
+def test_decode_invalid_json(api):
+    """Test a non-JSON body raises TileApiError."""
+    with pytest.raises(TileApiError):
+        api._decode(b"<html>", "users/groups")
+
+
+def test_custom_decoder():
+    """Test a custom decoder is used for response bodies."""
+    client = TileApiClient("test@example.com", "password", loads=lambda body: {"raw": body})
+
+    assert client._decode(b"{}", "users/groups") == {"raw": b"{}"}
+
+
+@pytest.mark.asyncio
+async def test_sync_skips_details_for_cold_tiles(api):
+    """Test skipped tiles keep their groups record without a detail call."""
+    nodes = {
+        "tile-hot": {"node_type": "TILE", "name": "Hot"},
+        "tile-cold": {"node_type": "TILE", "name": "Cold"},
+    }
+    api._get_group_nodes = AsyncMock(return_value={"nodes": nodes})
+    api.get_tile_details = AsyncMock(return_value=[])
+
+    result = await api.sync_tiles(full=True, skip_details={"tile-cold"})
+
+    api.get_tile_details.assert_awaited_once_with(["tile-hot"])
+    assert set(result.tiles) == {"tile-hot", "tile-cold"}
+
+
+@pytest.mark.asyncio
+async def test_get_tiles_leaves_watermark(api):
+    """Test only sync_tiles moves the delta-sync watermark."""
+    api._last_modified = 100
+    api._get_group_nodes = AsyncMock(return_value={
+        "last_modified_timestamp": 500,
+        "nodes": {"tile-1": {"node_type": "TILE", "name": "Keys"}},
+    })
+
+    tiles = await api.get_tiles(fetch_details=False)
+
+    assert [tile.tile_uuid for tile in tiles] == ["tile-1"]
+    assert api.last_modified == 100
+
+
+@pytest.mark.asyncio
+async def test_sync_watermark_moves_forward_on_success_only(api):
+    """Test a failed, timestamp-less or older sync never moves the watermark."""
+    api._last_modified = 1000
+    api._get_group_nodes = AsyncMock(return_value={
+        "last_modified_timestamp": 2000,
+        "nodes": {"tile-1": {"node_type": "TILE", "name": "Keys"}},
+    })
+    api.get_tile_details = AsyncMock(side_effect=TileApiError("boom"))
+
+    with pytest.raises(TileApiError):
+        await api.sync_tiles()
+    assert api.last_modified == 1000
+
+    api._get_group_nodes.return_value = {"nodes": {}}
+    await api.sync_tiles(full=True)
+    assert api.last_modified == 1000
+
+    api._get_group_nodes.return_value = {"last_modified_timestamp": 500, "nodes": {}}
+    await api.sync_tiles(full=True)
+    assert api.last_modified == 1000
+
+    api._get_group_nodes.return_value = {"last_modified_timestamp": 3000, "nodes": {}}
+    await api.sync_tiles(full=True)
+    assert api.last_modified == 3000
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_reports_removals_and_gaps(api):
+    """Test a delta lists removed tiles, and flags regressions as gaps."""
+    api._last_modified = 1000
+    api._get_group_nodes = AsyncMock(return_value={
+        "last_modified_timestamp": 1500,
+        "nodes": {
+            "tile-1": {"node_type": "TILE", "name": "Keys"},
+            "tile-2": {"node_type": "TILE", "is_dead": True},
+        },
+    })
+
+    result = await api.sync_tiles(fetch_details=False)
+
+    assert result.full is False and result.gap is False
+    assert set(result.tiles) == {"tile-1"}
+    assert result.removed == {"tile-2"}
+    assert api.last_modified == 1500
+
+    api._get_group_nodes.return_value = {"last_modified_timestamp": 900, "nodes": {}}
+    result = await api.sync_tiles(fetch_details=False)
+    assert result.gap is True
+    assert api.last_modified == 1500
+
+    api._get_group_nodes.return_value = {
+        "last_modified_timestamp": 1600,
+        "nodes": {"group-1": {"node_type": "GROUP"}},
+    }
+    assert (await api.sync_tiles(fetch_details=False)).gap is True
+
+
+class _FakeResponse:
+    """aiohttp response stand-in usable as an async context manager."""
+
+    def __init__(self, status=200, body=b'{"result_code": 0, "result": {}}', headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def test_restore_session():
+    """Test only unexpired persisted cookies are restored."""
+    client = TileApiClient("restore@example.com", "password")
+
+    assert client.restore_session(None) is False
+    assert client.restore_session({"cookie": "old", "expires": time.time() - 1}) is False
+    assert client.is_logged_in is False
+
+    assert client.restore_session({"cookie": "fresh", "expires": time.time() + 60}) is True
+    assert client.is_logged_in is True
+    assert client.session_state["cookie"] == "fresh"
+
+
+def test_parse_cookie_expiry():
+    """Test Max-Age, Expires and the default session lifetime."""
+    now = time.time()
+
+    assert TileApiClient._parse_cookie_expiry("s=1; Max-Age=3600") == pytest.approx(now + 3600, abs=5)
+    assert TileApiClient._parse_cookie_expiry(
+        "s=1; Expires=Wed, 21 Oct 2015 07:28:00 GMT"
+    ) == 1445412480.0
+    assert TileApiClient._parse_cookie_expiry("s=1") == pytest.approx(
+        now + SESSION_DEFAULT_LIFETIME, abs=5
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_login_keeps_no_cookie():
+    """Test a rejected login neither stores nor persists its cookie."""
+    session = MagicMock()
+    session.post.return_value = _FakeResponse(
+        status=401,
+        body=b'{"result_code": 1, "result": {"message": "Invalid credentials"}}',
+        headers={"Set-Cookie": "anonymous=1"},
+    )
+    client = TileApiClient("failed@example.com", "password", session=session)
+
+    with pytest.raises(TileAuthError):
+        await client.login()
+
+    assert client.session_state is None
+    assert client.session_dirty is False
+    assert client.is_logged_in is False
+
+
+@pytest.mark.asyncio
+async def test_restored_cookie_rejected_logs_in_again():
+    """Test a stale restored session is replaced by a fresh login on 401."""
+    session = MagicMock()
+    session.request.side_effect = [
+        _FakeResponse(status=401),
+        _FakeResponse(body=b'{"result_code": 0, "result": []}'),
+    ]
+    session.post.return_value = _FakeResponse(headers={"Set-Cookie": "session=fresh; Max-Age=60"})
+    client = TileApiClient("relogin@example.com", "password", session=session)
+    client.restore_session({"cookie": "session=stale", "expires": None})
+
+    result = await client._request("GET", "tiles/tile_states")
+
+    assert result == {"result_code": 0, "result": []}
+    assert session.post.call_count == 1
+    cookies = [call.kwargs["headers"]["Cookie"] for call in session.request.call_args_list]
+    assert cookies == ["session=stale", "session=fresh; Max-Age=60"]
+    assert client.session_dirty is True
+
+
+@pytest.mark.asyncio
+async def test_tile_details_capped_and_partial():
+    """Test the in-flight cap, the per-request timeout and partial failures."""
+    client = TileApiClient(
+        "details@example.com", "password", max_concurrent_requests=2, request_timeout=0.2
+    )
+    client.restore_session({"cookie": "session=abc", "expires": None})
+    in_flight = 0
+    peak = 0
+
+    class _Response(_FakeResponse):
+        async def read(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(1 if self.tile_uuid == "slow" else 0.01)
+                return self._body
+            finally:
+                in_flight -= 1
+
+    def request(method, url, **kwargs):
+        tile_uuid = url.rsplit("/", 1)[-1]
+        if tile_uuid == "broken":
+            response = _Response(status=404, body=b'{"result_code": 1, "result": {}}')
+        elif tile_uuid == "missing":
+            response = _Response(body=b'{"result_code": 1, "result": {}}')
+        else:
+            response = _Response(
+                body=b'{"result_code": 0, "result": {"name": "%s"}}' % tile_uuid.encode()
+            )
+        response.tile_uuid = tile_uuid
+        return response
+
+    client._session = MagicMock()
+    client._session.request.side_effect = request
+    uuids = ["tile-1", "slow", "tile-2", "broken", "missing", "tile-3"]
+
+    tiles = await client.get_tile_details(uuids)
+
+    assert [tile.tile_uuid for tile in tiles] == ["tile-1", "tile-2", "tile-3"]
+    assert peak == 2
+    assert client.last_fetch_failures == ["slow", "broken", "missing"]
+    assert client.last_fetch_duration < 1
+    release_rate_limiter("details@example.com", client.rate_limiter)
+
+
+@pytest.mark.asyncio
+async def test_request_timeout_excludes_limiter_wait(api):
+    """Test waiting for a rate limiter token doesn't count against the timeout."""
+    api._request_timeout = 0.1
+    api._session = MagicMock()
+    api._session.request.return_value = _FakeResponse()
+
+    async def acquire():
+        await asyncio.sleep(0.2)
+
+    with patch.object(api.rate_limiter, "acquire", side_effect=acquire):
+        assert await api._request("GET", "tiles/tile-1") == {"result_code": 0, "result": {}}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rejections_share_one_login():
+    """Test requests rejected at the same time log in again only once."""
+    class _SlowResponse(_FakeResponse):
+        async def read(self):
+            await asyncio.sleep(0.01)
+            return self._body
+
+    session = MagicMock()
+    session.request.side_effect = lambda method, url, headers, params: _SlowResponse(
+        status=401 if headers["Cookie"] == "session=stale" else 200
+    )
+    session.post.side_effect = lambda *args, **kwargs: _SlowResponse(
+        headers={"Set-Cookie": "session=fresh; Max-Age=60"}
+    )
+    client = TileApiClient("concurrent@example.com", "password", session=session)
+    client.restore_session({"cookie": "session=stale", "expires": None})
+
+    results = await asyncio.gather(
+        client._request("GET", "tiles/tile-1"), client._request("GET", "tiles/tile-2")
+    )
+
+    assert results == [{"result_code": 0, "result": {}}] * 2
+    assert session.request.call_count == 4
+    assert session.post.call_count == 1
+    release_rate_limiter("concurrent@example.com", client.rate_limiter)
+
+
+@pytest.mark.asyncio
+async def test_cold_tile_keeps_expired_metadata(api):
+    """Test a skipped tile is completed from metadata past its TTL."""
+    detailed = TileDevice.from_api_response(
+        "tile-cold",
+        {"name": "Cold", "auth_key": "a2V5", "product": "Tile Mate", "firmware_version": "1.0"},
+    )
+    with patch("custom_components.tile_tracker.tile_api.time.time", return_value=1000.0):
+        api.metadata_cache.update(detailed)
+    api._get_group_nodes = AsyncMock(return_value={
+        "nodes": {"tile-cold": {"node_type": "TILE", "name": "Cold"}},
+    })
+    api.get_tile_details = AsyncMock(return_value=[])
+
+    with patch("custom_components.tile_tracker.tile_api.time.time", return_value=1000.0 + 2 * 86400):
+        result = await api.sync_tiles(full=True, skip_details={"tile-cold"})
+
+    api.get_tile_details.assert_not_called()
+    tile = result.tiles["tile-cold"]
+    assert (tile.auth_key, tile.product, tile.firmware_version) == ("a2V5", "Tile Mate", "1.0")
+
+
+def test_json_decoder_reported():
+    """Test the client reports which decoder parses its responses."""
+    assert TileApiClient("decoder@example.com", "password").json_decoder == JSON_DECODER
+    assert TileApiClient("decoder@example.com", "password", loads=json.loads).json_decoder == "json"
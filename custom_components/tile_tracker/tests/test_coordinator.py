@@ -0,0 +1,431 @@
+"""Tests for TileDataUpdateCoordinator change-aware listener updates."""
+from datetime import timedelta
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from custom_components.tile_tracker import TileDataUpdateCoordinator
+from custom_components.tile_tracker.tile_api import TileDevice
+
+
+def _tile(tile_uuid: str, latitude: float = 1.0) -> TileDevice:
+    """Create a tile with a location fix."""
+    return TileDevice.from_api_response(
+        tile_uuid,
+        {
+            "name": tile_uuid,
+            "last_tile_state": {"timestamp": 1_700_000_000_000, "latitude": latitude},
+        },
+    )
+
+
+@pytest.fixture
+def coordinator():
+    """Create a coordinator with two tiles already delivered."""
+    coordinator = TileDataUpdateCoordinator(MagicMock(), Mock(), timedelta(minutes=5))
+    coordinator.data = {"tile-a": _tile("tile-a"), "tile-b": _tile("tile-b")}
+    coordinator._async_refresh_finished()
+    coordinator.async_update_listeners()
+    return coordinator
+
+
+def _listeners(coordinator):
+    """Register a global listener and one per tile."""
+    listeners = {key: Mock() for key in ("global", "tile-a", "tile-b")}
+    coordinator.async_add_listener(listeners["global"])
+    coordinator.async_add_tile_listener("tile-a", listeners["tile-a"])
+    coordinator.async_add_listener(listeners["tile-b"], "tile-b")
+    return listeners
+
+
+def test_only_changed_tile_notified(coordinator):
+    """Test listeners of unchanged tiles are skipped."""
+    listeners = _listeners(coordinator)
+    coordinator.data["tile-a"].apply_state(
+        {"timestamp": 1_700_000_060_000, "latitude": 2.0}
+    )
+
+    coordinator._async_refresh_finished()
+    coordinator.async_update_listeners()
+
+    listeners["global"].assert_called_once()
+    listeners["tile-a"].assert_called_once()
+    listeners["tile-b"].assert_not_called()
+    assert coordinator.tile_versions == {"tile-a": 2, "tile-b": 1}
+
+
+def test_in_place_song_change_notified(coordinator):
+    """Test mutating a tile's songs list in place counts as a change."""
+    listeners = _listeners(coordinator)
+    coordinator.data["tile-b"].available_songs = [{"id": 1, "name": "Chirp"}]
+    coordinator._async_refresh_finished()
+    coordinator.async_update_listeners()
+    listeners["tile-b"].reset_mock()
+
+    coordinator.data["tile-b"].available_songs[0]["name"] = "Bionic Birdie"
+    coordinator._async_refresh_finished()
+    coordinator.async_update_listeners()
+
+    listeners["tile-b"].assert_called_once()
+    listeners["tile-a"].assert_not_called()
+
+
+def test_unknown_listener_layout_notifies_all(coordinator):
+    """Test a changed private listener layout falls back to notifying everyone."""
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+    coordinator._listeners = {1: (Mock(), "tile-a", "extra")}
+
+    with patch.object(DataUpdateCoordinator, "async_update_listeners") as update_all:
+        coordinator._async_notify_contexts({"tile-a"}, include_global=False)
+
+    update_all.assert_called_once()
+
+
+def test_unchanged_refresh_notifies_global_only(coordinator):
+    """Test a refresh with identical data wakes no per-tile listener."""
+    listeners = _listeners(coordinator)
+    coordinator.data = {"tile-a": _tile("tile-a"), "tile-b": _tile("tile-b")}
+
+    coordinator._async_refresh_finished()
+    coordinator.async_update_listeners()
+
+    listeners["global"].assert_called_once()
+    listeners["tile-a"].assert_not_called()
+    listeners["tile-b"].assert_not_called()
+
+
+def test_removed_tile_notified(coordinator):
+    """Test listeners of a tile that disappeared are notified."""
+    listeners = _listeners(coordinator)
+    del coordinator.data["tile-b"]
+
+    coordinator._async_refresh_finished()
+    coordinator.async_update_listeners()
+
+    listeners["tile-b"].assert_called_once()
+    assert "tile-b" not in coordinator.tile_versions
+
+
+def test_availability_change_notifies_all(coordinator):
+    """Test a failed refresh updates every entity (availability)."""
+    listeners = _listeners(coordinator)
+    coordinator.last_update_success = False
+
+    coordinator._async_refresh_finished()
+    coordinator.async_update_listeners()
+
+    for listener in listeners.values():
+        listener.assert_called_once()
+
+
+def test_apply_options_in_place(coordinator):
+    """Test option changes update the running coordinator."""
+    coordinator.async_apply_options(
+        {"scan_interval": 1, "exclude_days": 0, "exclude_invisible": True}
+    )
+
+    assert coordinator.exclude_invisible is True
+    assert coordinator.exclude_days == 0
+    assert coordinator.poll_scheduler.base_interval == 60
+    assert coordinator.poll_scheduler.cold_after is None
+    assert coordinator.update_interval <= timedelta(minutes=1)
+
+
+def test_refresh_staggered_onto_slot():
+    """Test a coordinator in the shared scheduler refreshes on its slot."""
+    from custom_components.tile_tracker.refresh_scheduler import TileRefreshScheduler
+
+    hass = MagicMock()
+    hass.loop.time.return_value = 1000.0
+    scheduler = TileRefreshScheduler(window=60, jitter=0)
+    scheduler.register(object())
+    coordinator = TileDataUpdateCoordinator(hass, Mock(), timedelta(minutes=5))
+    coordinator.config_entry = None
+    leave = coordinator.async_join_scheduler(scheduler)
+
+    coordinator._schedule_refresh()
+
+    when = hass.loop.call_at.call_args[0][0]
+    assert when % 60 == 30
+    assert abs(when - 1300) <= 30
+
+    leave()
+    assert coordinator.refresh_scheduler is None
+    assert len(scheduler) == 1
+
+
+def test_scheduler_skipped_without_private_attributes():
+    """Test the refresh keeps HA's own schedule if its private attributes change."""
+    from custom_components.tile_tracker.refresh_scheduler import TileRefreshScheduler
+
+    hass = MagicMock()
+    hass.loop.time.return_value = 1000.0
+    scheduler = TileRefreshScheduler(window=60, jitter=0)
+    coordinator = TileDataUpdateCoordinator(hass, Mock(), timedelta(minutes=5))
+    coordinator.config_entry = None
+    coordinator.async_join_scheduler(scheduler)
+    del coordinator._update_interval_seconds
+    microsecond = coordinator._microsecond
+
+    with patch(
+        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator._schedule_refresh"
+    ) as schedule_refresh:
+        coordinator._schedule_refresh()
+
+    schedule_refresh.assert_called_once()
+    assert coordinator._microsecond == microsecond
+
+
+@pytest.mark.asyncio
+async def test_shared_tiles_left_to_owner():
+    """Test tiles owned by another entry are dropped and skip details."""
+    from custom_components.tile_tracker.account_registry import TileAccountRegistry
+    from custom_components.tile_tracker.tile_api import TileSyncResult
+
+    accounts = TileAccountRegistry()
+    accounts.claim_tiles("other", ["shared"])
+    api = Mock()
+    api.is_logged_in = True
+    api.sync_tiles = AsyncMock(return_value=TileSyncResult(
+        tiles={"shared": _tile("shared"), "mine": _tile("mine")},
+        removed=set(),
+        full=True,
+    ))
+    coordinator = TileDataUpdateCoordinator(
+        MagicMock(), api, timedelta(minutes=5), accounts=accounts, entry_id="entry"
+    )
+
+    tiles = await coordinator._async_update_data()
+
+    assert set(tiles) == {"mine"}
+    assert coordinator._foreign_uuids == {"shared"}
+
+    await coordinator._async_sync_tiles()
+    assert "shared" in api.sync_tiles.call_args.kwargs["skip_details"]
+
+
+@pytest.mark.asyncio
+async def test_secondary_entry_does_not_poll():
+    """Test a second entry for the same account leaves polling to the first."""
+    from custom_components.tile_tracker.account_registry import TileAccountRegistry
+
+    accounts = TileAccountRegistry()
+    accounts.acquire("first", "a@example.com", Mock)
+    api, _ = accounts.acquire("second", "a@example.com", Mock)
+    coordinator = TileDataUpdateCoordinator(
+        MagicMock(), api, timedelta(minutes=5), accounts=accounts, entry_id="second"
+    )
+
+    assert await coordinator._async_update_data() == {}
+    coordinator.data = {"tile-a": _tile("tile-a")}
+    assert await coordinator._async_update_data() == {"tile-a": coordinator.data["tile-a"]}
+    api.sync_tiles.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_only_polling_entry_saves_client():
+    """Test only the entry polling a shared account persists its client."""
+    from custom_components.tile_tracker.account_registry import TileAccountRegistry
+    from custom_components.tile_tracker.tile_api import TileSyncResult
+
+    accounts = TileAccountRegistry()
+    api, _ = accounts.acquire("first", "a@example.com", Mock)
+    accounts.acquire("second", "a@example.com", Mock)
+    api.is_logged_in = True
+    api.sync_tiles = AsyncMock(return_value=TileSyncResult(
+        tiles={"tile-a": _tile("tile-a")}, removed=set(), full=True
+    ))
+    coordinators = {}
+    for entry_id in ("first", "second"):
+        coordinator = coordinators[entry_id] = TileDataUpdateCoordinator(
+            MagicMock(), api, timedelta(minutes=5),
+            api_store=Mock(), accounts=accounts, entry_id=entry_id,
+        )
+        await coordinator._async_update_data()
+
+    coordinators["first"].api_store.async_schedule_save.assert_called_once_with(api)
+    coordinators["second"].api_store.async_schedule_save.assert_not_called()
+
+
+def test_released_tiles_fetched_with_details():
+    """Test a release clears the foreign tiles before the resync."""
+    coordinator = TileDataUpdateCoordinator(MagicMock(), Mock(), timedelta(minutes=5))
+    coordinator._foreign_uuids = {"shared"}
+    coordinator.async_request_refresh = Mock()
+
+    coordinator.async_tiles_released()
+
+    assert coordinator._foreign_uuids == set()
+    assert coordinator._last_full_sync is None
+    coordinator.hass.async_create_task.assert_called_once()
+
+
+def test_presence_notifies_only_its_tile(coordinator):
+    """Test a tile arriving or leaving locally updates just its entities."""
+    listeners = _listeners(coordinator)
+    coordinator.presence.configure(home_rssi=-80, away_rssi=-90, away_after=300)
+
+    coordinator.async_observe_advertisement("tile-a", -60)
+    coordinator.async_observe_advertisement("tile-a", -62)
+
+    listeners["tile-a"].assert_called_once()
+    listeners["tile-b"].assert_not_called()
+    listeners["global"].assert_not_called()
+
+    coordinator.presence.get("tile-a").last_seen -= 600
+    coordinator.async_check_presence()
+    assert listeners["tile-a"].call_count == 2
+    assert coordinator.presence.get("tile-a").home is False
+
+
+def test_stale_advertisement_ignored(coordinator):
+    """Test an advertisement heard before the presence timeout doesn't make a tile home."""
+    listeners = _listeners(coordinator)
+    coordinator.presence.configure(home_rssi=-80, away_rssi=-90, away_after=300)
+
+    coordinator.async_observe_advertisement("tile-a", -60, time.time() - 600)
+
+    assert coordinator.presence.get("tile-a") is None
+    listeners["tile-a"].assert_not_called()
+
+    coordinator.async_observe_advertisement("tile-a", -60, time.time() - 60)
+    assert coordinator.presence.get("tile-a").home is True
+
+
+def _sync_coordinator(*results):
+    """Create a coordinator with tiles whose groups syncs return ``results``."""
+    api = Mock()
+    api.is_logged_in = True
+    api.sync_tiles = AsyncMock(side_effect=list(results))
+    coordinator = TileDataUpdateCoordinator(MagicMock(), api, timedelta(minutes=5))
+    coordinator.data = {"tile-a": _tile("tile-a"), "tile-b": _tile("tile-b")}
+    coordinator._last_full_sync = time.monotonic() - 1
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_delta_sync_merged():
+    """Test an incremental sync updates and removes tiles in place."""
+    from custom_components.tile_tracker.tile_api import TileSyncResult
+
+    coordinator = _sync_coordinator(TileSyncResult(
+        tiles={"tile-a": _tile("tile-a", latitude=5.0), "tile-c": _tile("tile-c")},
+        removed={"tile-b"},
+        full=False,
+    ))
+    last_full_sync = coordinator._last_full_sync
+
+    tiles = await coordinator._async_sync_tiles()
+
+    assert coordinator.api.sync_tiles.call_args.kwargs["full"] is False
+    assert set(tiles) == {"tile-a", "tile-c"}
+    assert tiles["tile-a"].latitude == 5.0
+    assert coordinator._inactive_uuids == {"tile-b"}
+    assert coordinator._last_full_sync == last_full_sync
+
+
+@pytest.mark.asyncio
+async def test_delta_gap_runs_full_resync():
+    """Test a gap in the delta replaces the data with a full resync."""
+    from custom_components.tile_tracker.tile_api import TileSyncResult
+
+    coordinator = _sync_coordinator(
+        TileSyncResult(full=False, gap=True),
+        TileSyncResult(tiles={"tile-a": _tile("tile-a")}, removed={"tile-x"}, full=True),
+    )
+    last_full_sync = coordinator._last_full_sync
+
+    tiles = await coordinator._async_sync_tiles()
+
+    assert [call.kwargs["full"] for call in coordinator.api.sync_tiles.call_args_list] == [False, True]
+    assert set(tiles) == {"tile-a"}
+    assert coordinator._inactive_uuids == {"tile-x"}
+    assert coordinator._last_full_sync > last_full_sync
+
+
+def _states_coordinator(states):
+    """Create a coordinator with tiles whose tile_states call returns ``states``."""
+    api = Mock()
+    api.is_logged_in = True
+    api.get_tile_states = AsyncMock(return_value=states)
+    api.get_tile_details = AsyncMock(return_value=[])
+    coordinator = TileDataUpdateCoordinator(MagicMock(), api, timedelta(minutes=5))
+    coordinator.data = {"tile-a": _tile("tile-a"), "tile-b": _tile("tile-b")}
+    coordinator._last_metadata_refresh = time.monotonic()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_tile_states_merged_into_tiles():
+    """Test tile_states updates locations on the existing tiles."""
+    coordinator = _states_coordinator({
+        "tile-a": {"timestamp": 1_700_000_060_000, "latitude": 5.0, "longitude": 6.0},
+        "tile-b": {"timestamp": 1_700_000_060_000},
+    })
+    tile_a = coordinator.data["tile-a"]
+
+    tiles = await coordinator._async_refresh_states(["tile-a"])
+
+    assert tiles["tile-a"] is tile_a
+    assert (tile_a.latitude, tile_a.longitude) == (5.0, 6.0)
+    assert tiles["tile-b"].latitude == 1.0
+    coordinator.api.get_tile_details.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_tile_states_ignores_inactive_and_foreign():
+    """Test states of dead, invisible or foreign tiles are skipped."""
+    fix = {"timestamp": 1_700_000_060_000, "latitude": 5.0}
+    coordinator = _states_coordinator({"tile-a": fix, "dead": fix, "shared": fix})
+    coordinator._inactive_uuids = {"dead"}
+    coordinator._foreign_uuids = {"shared"}
+
+    tiles = await coordinator._async_refresh_states(["tile-a"])
+
+    assert set(tiles) == {"tile-a", "tile-b"}
+    assert tiles["tile-a"].latitude == 5.0
+
+
+@pytest.mark.asyncio
+async def test_new_tile_in_states_runs_full_sync():
+    """Test an unknown UUID in tile_states falls through to the slow tier."""
+    from custom_components.tile_tracker.tile_api import TileSyncResult
+
+    coordinator = _states_coordinator({"tile-new": {"timestamp": 1, "latitude": 5.0}})
+    coordinator.api.sync_tiles = AsyncMock(return_value=TileSyncResult(
+        tiles={"tile-a": _tile("tile-a"), "tile-new": _tile("tile-new")},
+        full=True,
+    ))
+
+    assert await coordinator._async_refresh_states(["tile-a"]) is None
+
+    tiles = await coordinator._async_fetch_data()
+
+    assert coordinator.api.sync_tiles.call_args.kwargs["full"] is True
+    assert set(tiles) == {"tile-a", "tile-new"}
+
+
+@pytest.mark.asyncio
+async def test_failed_detail_fetch_keeps_static_fields():
+    """Test a full sync whose detail call fails keeps the previous auth key."""
+    from custom_components.tile_tracker.tile_api import TileApiClient, TileApiError
+
+    api = TileApiClient("details-fail@example.com", "password")
+    api._get_group_nodes = AsyncMock(return_value={
+        "nodes": {"tile-a": {"node_type": "TILE", "name": "tile-a"}},
+    })
+    api.get_tile = AsyncMock(side_effect=TileApiError("boom"))
+    coordinator = TileDataUpdateCoordinator(MagicMock(), api, timedelta(minutes=5))
+    previous = TileDevice.from_api_response(
+        "tile-a", {"name": "tile-a", "auth_key": "a2V5", "product": "Tile Mate"}
+    )
+    coordinator.data = {"tile-a": previous}
+
+    tiles = await coordinator._async_sync_tiles()
+
+    assert api.last_fetch_failures == ["tile-a"]
+    assert tiles["tile-a"] is not previous
+    assert tiles["tile-a"].auth_key == "a2V5"
+    assert tiles["tile-a"].product == "Tile Mate"
@@ -0,0 +1,68 @@
+"""Tests for the Tile Tracker device tracker state."""
+import time
+
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+
+from homeassistant.const import STATE_HOME, STATE_NOT_HOME
+
+from custom_components.tile_tracker.device_tracker import TileDeviceTracker
+from custom_components.tile_tracker.presence import TilePresenceEngine
+from custom_components.tile_tracker.tile_api import TileDevice
+
+
+@pytest.fixture
+def tracker():
+    """Create a tracker for a tile with a cloud fix."""
+    coordinator = Mock()
+    coordinator.presence = TilePresenceEngine(home_rssi=-80, away_rssi=-90, away_after=300)
+    coordinator.data = {
+        "tile-a": TileDevice.from_api_response(
+            "tile-a",
+            {"name": "Keys", "last_tile_state": {"latitude": 1.0, "longitude": 2.0}},
+        )
+    }
+    entity = TileDeviceTracker(coordinator, "tile-a")
+    entity.hass = MagicMock()
+    return entity
+
+
+def test_no_local_presence_follows_cloud(tracker):
+    """Test a tile never heard locally leaves the state to its coordinates."""
+    assert tracker.location_name is None
+
+
+def test_heard_at_home(tracker):
+    """Test a strong local signal makes the tile home."""
+    tracker.coordinator.presence.observe("tile-a", -60)
+
+    assert tracker.location_name == STATE_HOME
+
+
+def test_weak_signal_not_forced_away(tracker):
+    """Test a tile heard weakly falls back to its coordinates, not not_home."""
+    tracker.coordinator.presence.observe("tile-a", -60)
+    for _ in range(10):
+        tracker.coordinator.presence.observe("tile-a", -100)
+
+    assert tracker.coordinator.presence.get("tile-a").home is False
+    assert tracker.location_name is None
+
+
+def test_timed_out_away_unless_in_zone(tracker):
+    """Test an unheard tile is not_home, but never overrides a zone match."""
+    presence = tracker.coordinator.presence
+    presence.observe("tile-a", -60, now=time.time() - 600)
+    presence.check()
+
+    with patch(
+        "custom_components.tile_tracker.device_tracker.zone.async_active_zone",
+        return_value=None,
+    ):
+        assert tracker.location_name == STATE_NOT_HOME
+
+    with patch(
+        "custom_components.tile_tracker.device_tracker.zone.async_active_zone",
+        return_value=Mock(),
+    ):
+        assert tracker.location_name is None
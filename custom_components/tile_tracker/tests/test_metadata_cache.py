@@ -0,0 +1,93 @@
+"""Tests for the Tile API static metadata cache."""
+import pytest
+from unittest.mock import patch
+
+from custom_components.tile_tracker.tile_api import TileDevice, TileMetadataCache
+
+
+@pytest.fixture
+def mock_tile():
+    """Create a tile as returned by the detail call."""
+    return TileDevice(
+        tile_uuid="test-uuid-123",
+        name="Test Tile",
+        auth_key="test-auth-key",
+        archetype="TILE_SLIM",
+        firmware_version="01.23.45.67",
+        hardware_version="02.34",
+        product="Tile Slim",
+        visible=True,
+        is_dead=False,
+        expected_tdt_cmd_config="0x01",
+    )
+
+
+def _groups_tile(firmware_version: str = "01.23.45.67") -> TileDevice:
+    """Create a tile as parsed from a lighter groups node."""
+    return TileDevice.from_api_response(
+        "test-uuid-123",
+        {"name": "Test Tile", "firmware_version": firmware_version},
+    )
+
+
+def test_apply_fills_static_fields(mock_tile):
+    """Test fresh metadata is copied onto a groups tile."""
+    cache = TileMetadataCache()
+    cache.update(mock_tile)
+
+    tile = _groups_tile()
+    assert cache.apply(tile) is True
+    assert tile.auth_key == "test-auth-key"
+    assert tile.product == "Tile Slim"
+    assert tile.expected_tdt_cmd_config == "0x01"
+
+
+def test_apply_misses_unknown_tile():
+    """Test an uncached tile needs a detail fetch."""
+    cache = TileMetadataCache()
+    assert cache.apply(_groups_tile()) is False
+
+
+def test_firmware_change_invalidates(mock_tile):
+    """Test a new firmware version drops the cached entry."""
+    cache = TileMetadataCache()
+    cache.update(mock_tile)
+
+    assert cache.apply(_groups_tile("02.00.00.00")) is False
+    assert len(cache) == 0
+
+
+def test_expired_field_is_stale(mock_tile):
+    """Test one expired field makes the whole entry stale."""
+    cache = TileMetadataCache(ttls={"auth_key": 100, "firmware_version": 10})
+
+    with patch("custom_components.tile_tracker.tile_api.time.time", return_value=1000.0):
+        cache.update(mock_tile)
+    with patch("custom_components.tile_tracker.tile_api.time.time", return_value=1050.0):
+        assert cache.is_fresh(mock_tile.tile_uuid) is False
+
+
+def test_round_trip(mock_tile):
+    """Test the cache survives as_dict/load."""
+    cache = TileMetadataCache()
+    cache.update(mock_tile)
+
+    restored = TileMetadataCache()
+    restored.load(cache.as_dict())
+
+    assert restored.is_fresh(mock_tile.tile_uuid)
+    assert restored.dirty is False
+
+
+def test_apply_copies_valid_fields_when_one_expired(mock_tile):
+    """Test fields within their TTL are applied even if another expired."""
+    cache = TileMetadataCache(ttls={"auth_key": 100, "product": 100, "firmware_version": 10})
+
+    with patch("custom_components.tile_tracker.tile_api.time.time", return_value=1000.0):
+        cache.update(mock_tile)
+    tile = _groups_tile()
+    with patch("custom_components.tile_tracker.tile_api.time.time", return_value=1050.0):
+        assert cache.apply(tile) is False
+
+    assert tile.auth_key == "test-auth-key"
+    assert tile.product == "Tile Slim"
@@ -0,0 +1,119 @@
+"""Tests for the adaptive per-tile poll scheduler."""
+import pytest
+
+from custom_components.tile_tracker.poll_scheduler import TilePollScheduler
+from custom_components.tile_tracker.tile_api import TileDevice
+
+WALL_NOW = 1_700_000_000.0
+
+
+def _tile(tile_uuid: str, age: float = 86400, speed: float | None = None, lat: float = 1.0) -> TileDevice:
+    """Create a tile whose last fix is ``age`` seconds old."""
+    return TileDevice.from_api_response(
+        tile_uuid,
+        {
+            "name": tile_uuid,
+            "last_tile_state": {
+                "timestamp": int((WALL_NOW - age) * 1000),
+                "latitude": lat,
+                "longitude": 2.0,
+                "speed": speed,
+            },
+        },
+    )
+
+
+@pytest.fixture
+def scheduler():
+    """Create a scheduler with a 5 minute base interval."""
+    return TilePollScheduler(300, hot_interval=60, max_interval=3600, backoff=2)
+
+
+def test_hot_tiles_polled_often(scheduler):
+    """Test moving and recently seen tiles get the hot interval."""
+    assert scheduler.observe(_tile("moving", speed=3.0), 0, wall_now=WALL_NOW) == 60
+    assert scheduler.observe(_tile("recent", age=30), 0, wall_now=WALL_NOW) == 60
+    assert scheduler.observe(_tile("drawer"), 0, wall_now=WALL_NOW) == 300
+
+
+def test_unchanged_tiles_back_off(scheduler):
+    """Test the interval doubles per unchanged poll up to the cap."""
+    tile = _tile("drawer")
+    intervals = [scheduler.observe(tile, 0, wall_now=WALL_NOW) for _ in range(6)]
+
+    assert intervals == [300, 600, 1200, 2400, 3600, 3600]
+
+
+def test_change_resets_backoff(scheduler):
+    """Test a changed state goes back to the base interval."""
+    for _ in range(3):
+        scheduler.observe(_tile("drawer"), 0, wall_now=WALL_NOW)
+
+    assert scheduler.observe(_tile("drawer", lat=5.0), 0, wall_now=WALL_NOW) == 300
+
+
+def test_free_refresh_keeps_schedule(scheduler):
+    """Test a tile that wasn't due keeps its schedule unless it changed."""
+    tile = _tile("drawer")
+    scheduler.observe(tile, 0, wall_now=WALL_NOW)
+    scheduler.observe(tile, 0, wall_now=WALL_NOW)  # 600s
+
+    assert scheduler.observe(tile, 100, polled=False, wall_now=WALL_NOW) == 500
+    assert scheduler.interval("drawer") == 600
+
+
+def test_due_and_next_due(scheduler):
+    """Test due tiles are batched and the next wakeup is the earliest."""
+    tiles = {"a": _tile("a"), "b": _tile("b", speed=1.0), "gone": _tile("gone")}
+    scheduler.observe_all(tiles, 0)
+    del tiles["gone"]
+    scheduler.observe_all(tiles, 0, polled=[])
+
+    assert len(scheduler) == 2
+    assert scheduler.next_due(0) == 60
+    assert scheduler.due(60) == ["b"]
+    assert sorted(scheduler.due(300)) == ["a", "b"]
+
+
+def test_hot_interval_not_above_base():
+    """Test a short scan interval is never slowed down by the hot interval."""
+    scheduler = TilePollScheduler(30, hot_interval=60)
+
+    assert scheduler.hot_interval == 30
+
+
+def test_stale_tiles_go_cold():
+    """Test tiles older than the threshold move to the daily cold tier."""
+    scheduler = TilePollScheduler(300, cold_after=30 * 86400, cold_interval=86400)
+
+    assert scheduler.observe(_tile("lost", age=90 * 86400), 0, wall_now=WALL_NOW) == 86400
+    assert scheduler.observe(_tile("drawer", age=86400), 0, wall_now=WALL_NOW) == 300
+    assert scheduler.cold_tiles == {"lost"}
+    assert scheduler.stats(0)["cold"] == 1
+
+
+def test_cold_tile_promoted_on_new_fix():
+    """Test a cold tile whose timestamp moves comes straight back."""
+    scheduler = TilePollScheduler(300, hot_interval=60, cold_after=30 * 86400)
+    scheduler.observe(_tile("lost", age=90 * 86400), 0, wall_now=WALL_NOW)
+
+    assert scheduler.observe(_tile("lost", age=10), 5, polled=False, wall_now=WALL_NOW) == 60
+    assert scheduler.cold_tiles == set()
+
+
+def test_rebase_after_settings_change(scheduler):
+    """Test a shorter interval and cold threshold apply to scheduled tiles."""
+    tiles = {"drawer": _tile("drawer", age=10 * 86400)}
+    for _ in range(3):
+        scheduler.observe_all(tiles, 0)
+    assert scheduler.interval("drawer") == 1200
+
+    scheduler.base_interval = 120
+    scheduler.cold_after = 5 * 86400
+    scheduler.rebase(tiles, 0)
+    assert scheduler.cold_tiles == {"drawer"}
+
+    scheduler.cold_after = None
+    scheduler.rebase(tiles, 0)
+    assert scheduler.cold_tiles == set()
+    assert scheduler.next_due(0) == 120
@@ -0,0 +1,62 @@
+"""Tests for local presence from BLE advertisements."""
+from custom_components.tile_tracker.presence import TilePresenceEngine
+
+NOW = 1_700_000_000.0
+
+
+def test_rssi_smoothed():
+    """Test a single strong advertisement doesn't make a weak tile home."""
+    engine = TilePresenceEngine(home_rssi=-80, away_rssi=-90, smoothing=0.25)
+    engine.observe("keys", -100, now=NOW)
+
+    assert engine.observe("keys", -60, now=NOW + 1) is False
+    assert engine.get("keys").rssi == -90
+    assert engine.get("keys").last_seen == NOW + 1
+
+
+def test_hysteresis_between_thresholds():
+    """Test a tile stays home until its signal drops below the away threshold."""
+    engine = TilePresenceEngine(home_rssi=-80, away_rssi=-90, smoothing=1.0)
+
+    assert engine.observe("keys", -75, now=NOW) is True
+    assert engine.observe("keys", -88, now=NOW + 1) is False
+    assert engine.get("keys").home is True
+    assert engine.observe("keys", -85, now=NOW + 2) is False
+    assert engine.observe("keys", -95, now=NOW + 3) is True
+    assert engine.get("keys").home is False
+    assert engine.observe("keys", -85, now=NOW + 4) is False
+
+
+def test_unheard_tiles_leave():
+    """Test tiles not heard for away_after seconds are marked away."""
+    engine = TilePresenceEngine(home_rssi=-80, away_rssi=-90, away_after=300)
+    engine.observe("keys", -60, now=NOW)
+    engine.observe("wallet", -60, now=NOW + 200)
+
+    assert engine.check(now=NOW + 301) == ["keys"]
+    assert engine.check(now=NOW + 302) == []
+    assert engine.stats()["home"] == 1
+
+    engine.prune({"keys"})
+    assert engine.get("wallet") is None
+    assert len(engine) == 1
+
+
+def test_timed_out():
+    """Test only tiles unheard for away_after count as timed out."""
+    engine = TilePresenceEngine(away_after=300)
+    engine.observe("keys", -100, now=NOW)
+
+    assert engine.timed_out("keys", now=NOW + 299) is False
+    assert engine.timed_out("keys", now=NOW + 301) is True
+    assert engine.timed_out("wallet", now=NOW + 301) is False
+
+
+def test_older_advertisement_ignored():
+    """Test an advertisement older than the last one recorded changes nothing."""
+    engine = TilePresenceEngine(home_rssi=-80, away_rssi=-90, smoothing=1.0)
+    engine.observe("keys", -100, now=NOW)
+
+    assert engine.observe("keys", -60, now=NOW - 30) is False
+    assert engine.get("keys").rssi == -100
+    assert engine.get("keys").last_seen == NOW
@@ -0,0 +1,73 @@
+"""Tests for the refresh scheduler shared by config entries."""
+import asyncio
+
+import pytest
+
+from custom_components.tile_tracker.refresh_scheduler import TileRefreshScheduler
+
+
+def test_entries_get_evenly_spaced_slots():
+    """Test refreshes due at the same time are spread over the window."""
+    scheduler = TileRefreshScheduler(window=60, jitter=0)
+    members = [object() for _ in range(4)]
+    for member in members:
+        scheduler.register(member)
+
+    target = 6000.0
+    landed = [(target + scheduler.offset(member, target)) % 60 for member in members]
+
+    assert landed == [0, 15, 30, 45]
+    assert all(abs(scheduler.offset(member, target)) <= 30 for member in members)
+
+
+def test_unregister_respaces_slots():
+    """Test leaving the scheduler frees its slot."""
+    scheduler = TileRefreshScheduler(window=60, jitter=0)
+    first, second = object(), object()
+    unregister = scheduler.register(first)
+    scheduler.register(second)
+    assert scheduler.slot_spacing == 30
+
+    unregister()
+
+    assert len(scheduler) == 1
+    assert scheduler.slot_spacing == 60
+    assert scheduler.offset(first, 100) == 0.0
+
+
+def test_jitter_stays_near_slot():
+    """Test jitter moves a refresh by at most a fraction of the spacing."""
+    scheduler = TileRefreshScheduler(window=60, jitter=0.1)
+    members = [object(), object()]
+    for member in members:
+        scheduler.register(member)
+
+    for _ in range(50):
+        landed = (1000 + scheduler.offset(members[1], 1000)) % 60
+        assert 27 <= landed <= 33
+
+
+@pytest.mark.asyncio
+async def test_sweeps_capped_and_reported():
+    """Test concurrent sweeps are limited and saturation is reported."""
+    scheduler = TileRefreshScheduler(max_concurrent=2, stats_window=1)
+    running = 0
+    peak = 0
+
+    async def _sweep():
+        nonlocal running, peak
+        async with scheduler.sweep():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(_sweep() for _ in range(5)))
+
+    stats = scheduler.stats()
+    assert peak == 2
+    assert stats["sweeps"] == 5
+    assert stats["active"] == 0
+    assert stats["waiting"] == 0
+    assert stats["max_wait"] > 0
+    assert 0 < stats["saturation"] < 1
@@ -0,0 +1,109 @@
+"""Tests for the persisted coordinator snapshot."""
+import json
+import time
+from datetime import timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from custom_components.tile_tracker import TileDataUpdateCoordinator
+from custom_components.tile_tracker.storage import StoredTileData
+from custom_components.tile_tracker.tile_api import TileDevice
+
+
+def _tile() -> TileDevice:
+    """Create a tile with location and lost state."""
+    return TileDevice.from_api_response(
+        "e1a2b3c4d5f6-7788",
+        {
+            "name": "Keys",
+            "auth_key": "a2V5",
+            "archetype": "TILE_MATE",
+            "product": "Tile Mate",
+            "lost": True,
+            "lost_timestamp": 1_690_000_000_000,
+            "last_tile_state": {
+                "timestamp": 1_700_000_000_000,
+                "latitude": 47.6,
+                "longitude": -122.3,
+                "h_accuracy": 12.5,
+            },
+        },
+    )
+
+
+def test_snapshot_round_trip():
+    """Test a tile survives StoredTileData and JSON unchanged."""
+    tile = _tile()
+
+    stored = StoredTileData.from_tile(tile)
+    restored = StoredTileData.from_dict(json.loads(json.dumps(stored.as_dict())))
+
+    assert restored.location.latitude == 47.6
+    assert restored.to_tile() == tile
+
+
+def test_legacy_record_has_no_tile():
+    """Test records written without a device snapshot are skipped."""
+    stored = StoredTileData.from_dict({"tile_uuid": "uuid", "name": "Old"})
+
+    assert stored.to_tile() is None
+
+
+def test_coordinator_seeded_from_snapshot():
+    """Test the coordinator starts with the stored tiles."""
+    tile = _tile()
+    tile_store = Mock()
+    tile_store.get_tiles.return_value = {tile.tile_uuid: tile}
+    coordinator = TileDataUpdateCoordinator(
+        MagicMock(), Mock(), timedelta(minutes=5), tile_store=tile_store
+    )
+
+    assert coordinator.async_restore_snapshot() is True
+    assert coordinator.data == {tile.tile_uuid: tile}
+
+
+def test_changed_data_schedules_save():
+    """Test a refresh that changed tiles schedules a delayed write."""
+    tile_store = Mock()
+    coordinator = TileDataUpdateCoordinator(
+        MagicMock(), Mock(), timedelta(minutes=5), tile_store=tile_store
+    )
+    coordinator.data = {"uuid": _tile()}
+
+    coordinator._async_refresh_finished()
+    coordinator.async_update_listeners()
+    tile_store.async_schedule_save.assert_called_once_with(coordinator.data)
+
+    coordinator._async_refresh_finished()
+    tile_store.async_schedule_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_api_cache_round_trip():
+    """Test the session and metadata cache survive TileApiCacheStore."""
+    from custom_components.tile_tracker.storage import TileApiCacheStore
+    from custom_components.tile_tracker.tile_api import TileApiClient
+
+    saved = {}
+
+    def _store(*args, **kwargs):
+        store = MagicMock()
+        store.async_delay_save.side_effect = lambda data_func, delay: saved.update(data_func())
+        store.async_load = AsyncMock(side_effect=lambda: dict(saved) or None)
+        return store
+
+    with patch("custom_components.tile_tracker.storage.Store", side_effect=_store):
+        api = TileApiClient("store@example.com", "password")
+        api.restore_session({"cookie": "session=abc", "expires": time.time() + 60})
+        api.session_dirty = True
+        api.metadata_cache.update(_tile())
+        TileApiCacheStore(MagicMock(), "entry").async_schedule_save(api)
+
+        restored = TileApiClient("store@example.com", "password")
+        assert await TileApiCacheStore(MagicMock(), "entry").load(restored) is True
+
+    assert restored.session_state == api.session_state
+    assert restored.is_logged_in is True
+    assert restored.metadata_cache.is_fresh("e1a2b3c4d5f6-7788")
+    assert api.session_dirty is False and api.metadata_cache.dirty is False
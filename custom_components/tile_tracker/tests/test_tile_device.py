@@ -0,0 +1,92 @@
+"""Tests for the TileDevice model."""
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.tile_tracker.tile_api import TileDevice
+
+
+@pytest.fixture
+def api_tile():
+    """Create a tile from a groups node."""
+    return TileDevice.from_api_response(
+        "e1a2b3c4d5f6-7788",
+        {
+            "name": "Keys",
+            "archetype": "TILE_MATE",
+            "product": "",
+            "lost_timestamp": "2024-01-02T03:04:05Z",
+            "last_tile_state": {"timestamp": 1_700_000_000_000, "latitude": 1.0},
+        },
+    )
+
+
+def test_timestamps_parsed_lazily(api_tile):
+    """Test raw epoch values are kept and converted on first read."""
+    assert api_tile.last_timestamp_ms == 1_700_000_000_000
+    assert api_tile._last_timestamp is None
+
+    expected = datetime.fromtimestamp(1_700_000_000, tz=timezone.utc)
+    assert api_tile.last_timestamp == expected
+    assert api_tile.last_timestamp is api_tile.last_timestamp
+    assert api_tile.lost_timestamp == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def test_datetime_timestamps_accepted():
+    """Test datetime values still work in the constructor and setters."""
+    when = datetime(2024, 5, 6, tzinfo=timezone.utc)
+    tile = TileDevice(
+        tile_uuid="uuid",
+        name="Tile",
+        auth_key="",
+        archetype="",
+        firmware_version="",
+        hardware_version=None,
+        product="",
+        visible=True,
+        is_dead=False,
+        expected_tdt_cmd_config=None,
+        last_timestamp=when,
+    )
+
+    assert tile.last_timestamp is when
+    assert tile.last_timestamp_ms == int(when.timestamp() * 1000)
+    assert tile.lost_timestamp is None
+
+
+def test_derived_fields_cached(api_tile):
+    """Test mac_address and tile_type are derived once and invalidated."""
+    assert api_tile.mac_address == "E1:A2:B3:C4:D5:F6"
+    assert api_tile.tile_type == "TILE_MATE"
+
+    api_tile.product = "Tile Mate"
+    assert api_tile.tile_type == "Tile Mate"
+
+    api_tile.mac_address = None
+    assert api_tile.mac_address is None
+
+
+def test_apply_state_updates_timestamp(api_tile):
+    """Test a new state replaces the cached datetime."""
+    assert api_tile.last_timestamp is not None
+
+    assert api_tile.apply_state({"timestamp": 1_700_000_060_000, "latitude": 2.0})
+    assert api_tile.last_timestamp == datetime.fromtimestamp(1_700_000_060, tz=timezone.utc)
+    assert api_tile.latitude == 2.0
+
+
+def test_slots_and_equality(api_tile):
+    """Test tiles are slotted and compare by value."""
+    assert not hasattr(api_tile, "__dict__")
+    with pytest.raises(AttributeError):
+        api_tile.unknown_field = 1
+
+    other = TileDevice.from_api_response(api_tile.tile_uuid, {
+        "name": "Keys",
+        "archetype": "TILE_MATE",
+        "product": "",
+        "lost_timestamp": "2024-01-02T03:04:05Z",
+        "last_tile_state": {"timestamp": 1_700_000_000_000, "latitude": 1.0},
+    })
+    assert other == api_tile
+    assert "name='Keys'" in repr(api_tile)
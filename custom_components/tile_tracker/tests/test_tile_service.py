@@ -0,0 +1,375 @@
+"""Tests for the TileService tile index and BLE cache."""
+import asyncio
+import sys
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.tile_tracker.tile_api import TileDevice
+from custom_components.tile_tracker.tile_service import (
+    AmbiguousTileError,
+    TileIndex,
+    TileService,
+)
+
+
+def _tile(tile_uuid: str, name: str) -> TileDevice:
+    """Create a tile."""
+    return TileDevice.from_api_response(tile_uuid, {"name": name})
+
+
+@pytest.fixture
+def index():
+    """Create an index over two config entries."""
+    index = TileIndex()
+    index.update_entry("entry-1", {
+        "aabbccddeeff0001": _tile("aabbccddeeff0001", "Keys"),
+        "112233445566ffff": _tile("112233445566ffff", "Wallet"),
+    })
+    index.update_entry("entry-2", {"a1b2c3d4e5f60002": _tile("a1b2c3d4e5f60002", "Bag")})
+    return index
+
+
+def test_lookup_by_uuid_name_and_mac(index):
+    """Test every supported key resolves to the tile."""
+    assert index.get("aabbccddeeff0001").name == "Keys"
+    assert index.get("  wallet ").tile_uuid == "112233445566ffff"
+    assert index.get("A1:B2:C3:D4:E5:F6").name == "Bag"
+    assert index.get_by_mac("aa-bb-cc-dd-ee-ff").name == "Keys"
+    assert index.get("Phone") is None
+
+
+def test_ambiguous_name_raises(index):
+    """Test a name shared by two tiles is an error, not the first match."""
+    index.update_entry("entry-2", {"a1b2c3d4e5f60002": _tile("a1b2c3d4e5f60002", "keys")})
+
+    with pytest.raises(AmbiguousTileError, match="matches 2 tiles"):
+        index.get("Keys")
+    assert index.get("aabbccddeeff0001").name == "Keys"
+
+
+def test_incremental_update(index):
+    """Test renamed and removed tiles are re-indexed."""
+    index.update_entry("entry-1", {"aabbccddeeff0001": _tile("aabbccddeeff0001", "House Keys")})
+
+    assert index.get("Keys") is None
+    assert index.get("house keys").tile_uuid == "aabbccddeeff0001"
+    assert index.get("Wallet") is None
+    assert len(index) == 2
+
+    index.remove_entry("entry-2")
+    assert [tile.name for tile in index.tiles] == ["House Keys"]
+
+
+def test_service_tracks_coordinator():
+    """Test the service index follows coordinator refreshes."""
+    service = TileService(MagicMock())
+    coordinator = MagicMock()
+    coordinator.data = {"aabbccddeeff0001": _tile("aabbccddeeff0001", "Keys")}
+
+    untrack = service.track_coordinator("entry-1", coordinator)
+    assert service.get_tile_from_coordinator("Keys") is not None
+
+    update = coordinator.async_add_listener.call_args[0][0]
+    coordinator.data = {}
+    update()
+    assert service.get_all_tiles() == []
+
+    coordinator.data = {"aabbccddeeff0001": _tile("aabbccddeeff0001", "Keys")}
+    update()
+    untrack()
+    assert service.get_tile_from_coordinator("Keys") is None
+
+
+@pytest.mark.asyncio
+async def test_passive_advertisements_fill_cache():
+    """Test advertisements from HA's bluetooth manager are served without a scan."""
+    service = TileService(MagicMock())
+    service._passive_unsubs.append(MagicMock())
+    device = MagicMock(address="E1:A2:B3:C4:D5:F6")
+    device.name = "Tile"
+    service_info = MagicMock(device=device, advertisement=MagicMock(rssi=-60), rssi=-60)
+
+    service._async_on_advertisement(service_info, None)
+
+    with patch("custom_components.tile_tracker.tile_service.BleakScanner") as scanner:
+        tiles = await service.scan_for_tiles(timeout=10)
+    scanner.assert_not_called()
+    assert [found.address for found, _ in tiles] == ["E1:A2:B3:C4:D5:F6"]
+    assert service.cache.mac_to_device["E1:A2:B3:C4:D5:F6"].rssi == -60
+
+    service.async_stop_passive_discovery()
+    assert not service.passive_discovery
+
+
+class _FakeScanner:
+    """BleakScanner stand-in that reports advertisements right after start."""
+
+    adverts: list = []
+
+    def __init__(self, detection_callback):
+        self._callback = detection_callback
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        for delay, device in self.adverts:
+            adv = MagicMock(rssi=-70, service_uuids=["0000feed-0000-1000-8000-00805f9b34fb"])
+            loop.call_later(delay, self._callback, device, adv)
+
+    async def stop(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_targeted_scan_returns_early():
+    """Test a cache miss returns as soon as the wanted tile advertises."""
+    service = TileService(MagicMock())
+    other = MagicMock(address="11:22:33:44:55:66")
+    target = MagicMock(address="E1:A2:B3:C4:D5:F6")
+    _FakeScanner.adverts = [(0.01, other), (0.05, target)]
+
+    with patch("custom_components.tile_tracker.tile_service.BleakScanner", _FakeScanner):
+        started = time.monotonic()
+        device = await service.find_tile_ble("e1a2b3c4d5f6-7788", scan_timeout=10)
+
+    assert device is target
+    assert time.monotonic() - started < 1
+    assert service.cache.get_mac_for_uuid("e1a2b3c4d5f6-7788") == "E1:A2:B3:C4:D5:F6"
+    assert "11:22:33:44:55:66" in service.cache.mac_to_device
+
+
+@pytest.mark.asyncio
+async def test_targeted_scan_times_out_without_match():
+    """Test a tile that never advertises isn't matched to another Tile."""
+    service = TileService(MagicMock())
+    _FakeScanner.adverts = [(0.01, MagicMock(address="11:22:33:44:55:66"))]
+
+    with patch("custom_components.tile_tracker.tile_service.BleakScanner", _FakeScanner):
+        device = await service.find_tile_ble("e1a2b3c4d5f6-7788", scan_timeout=0.1)
+
+    assert device is None
+    assert service.cache.get_mac_for_uuid("e1a2b3c4d5f6-7788") is None
+    assert "11:22:33:44:55:66" in service.cache.mac_to_device
+
+
+@pytest.mark.asyncio
+async def test_passive_miss_falls_back_to_scan():
+    """Test a tile HA hasn't heard yet is scanned for, then resolved through HA."""
+    service = TileService(MagicMock())
+    service._passive_unsubs.append(MagicMock())
+    target = MagicMock(address="E1:A2:B3:C4:D5:F6")
+    connectable = MagicMock(address="E1:A2:B3:C4:D5:F6")
+    _FakeScanner.adverts = [(0.01, target)]
+
+    bluetooth = MagicMock()
+    bluetooth.async_ble_device_from_address.side_effect = [None, connectable]
+    with patch.dict(sys.modules, {"homeassistant.components.bluetooth": bluetooth}), patch(
+        "custom_components.tile_tracker.tile_service.BleakScanner", _FakeScanner
+    ):
+        device = await service.find_tile_ble("e1a2b3c4d5f6-7788", scan_timeout=10)
+
+    assert device is connectable
+    assert service.cache.get_mac_for_uuid("e1a2b3c4d5f6-7788") == "E1:A2:B3:C4:D5:F6"
+
+
+@pytest.mark.asyncio
+async def test_passive_forced_scan_honours_timeout():
+    """Test force_refresh scans for the timeout even with passive discovery."""
+    service = TileService(MagicMock())
+    service._passive_unsubs.append(MagicMock())
+    service._scan = AsyncMock(return_value=[])
+
+    await service.scan_for_tiles(timeout=3)
+    service._scan.assert_not_called()
+
+    await service.scan_for_tiles(timeout=3, force_refresh=True)
+    service._scan.assert_awaited_once_with(3)
+
+
+def test_tile_advertisement_classifier():
+    """Test Tiles are recognised by service UUID, service data or name."""
+    from bleak.backends.device import BLEDevice
+    from bleak.backends.scanner import AdvertisementData
+
+    from custom_components.tile_tracker.tile_service import is_tile_advertisement
+
+    def _adv(uuids=(), service_data=None):
+        return AdvertisementData(None, {}, service_data or {}, list(uuids), None, -60, ())
+
+    phone = BLEDevice("11:22:33:44:55:66", "Phone", {})
+    assert is_tile_advertisement(phone, _adv(["0000feed-0000-1000-8000-00805f9b34fb"]))
+    assert is_tile_advertisement(phone, _adv(service_data={"0000FEEC-0000-1000-8000-00805F9B34FB": b""}))
+    assert is_tile_advertisement(BLEDevice("11:22:33:44:55:66", "tile", {}), _adv())
+    assert not is_tile_advertisement(phone, _adv(["0000fe9f-0000-1000-8000-00805f9b34fb"]))
+
+
+def test_mapping_ttl_enforced():
+    """Test mappings expire unless the tile keeps advertising."""
+    from custom_components.tile_tracker.tile_service import TileBleCache
+
+    cache = TileBleCache(mapping_ttl=3600)
+    cache.cache_mapping("uuid-old", "AA:AA:AA:AA:AA:AA", last_seen=time.time() - 7200)
+    cache.cache_mapping("uuid-new", "BB:BB:BB:BB:BB:BB", last_seen=time.time() - 7200)
+    cache.cache_device(MagicMock(address="BB:BB:BB:BB:BB:BB"), None, -55)
+
+    assert cache.get_mac_for_uuid("uuid-old") is None
+    assert "AA:AA:AA:AA:AA:AA" not in cache.mac_to_uuid
+    assert cache.get_mac_for_uuid("uuid-new") == "BB:BB:BB:BB:BB:BB"
+    assert cache.mappings_as_dict()["uuid-new"]["rssi"] == -55
+
+
+@pytest.mark.asyncio
+async def test_mappings_restored_lazily():
+    """Test persisted mappings are loaded on first lookup and saved on change."""
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value={
+        "e1a2b3c4d5f6-7788": {"mac": "E1:A2:B3:C4:D5:F6", "last_seen": time.time() - 60, "rssi": -70},
+        "expired": {"mac": "11:22:33:44:55:66", "last_seen": time.time() - 86400, "rssi": None},
+    })
+    service = TileService(MagicMock(), store)
+    service._passive_unsubs.append(MagicMock())
+    store.async_load.assert_not_called()
+
+    bluetooth = MagicMock()
+    bluetooth.async_ble_device_from_address.return_value = MagicMock(address="E1:A2:B3:C4:D5:F6")
+    with patch.dict(sys.modules, {"homeassistant.components.bluetooth": bluetooth}):
+        await service.find_tile_ble("e1a2b3c4d5f6-7788")
+
+    bluetooth.async_ble_device_from_address.assert_called_once_with(service.hass, "E1:A2:B3:C4:D5:F6", connectable=True)
+    assert service.cache.get_mac_for_uuid("expired") is None
+    store.async_schedule_save.assert_not_called()
+
+    service.clear_cache()
+    store.async_schedule_save.assert_called_once_with(service.cache)
+
+
+@pytest.mark.asyncio
+async def test_mappings_survive_early_advertisements():
+    """Test advertisements after a restart don't replace the persisted mappings."""
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value={
+        "e1a2b3c4d5f6-7788": {"mac": "E1:A2:B3:C4:D5:F6", "last_seen": time.time() - 60, "rssi": -70},
+    })
+    service = TileService(MagicMock(), store)
+    service.index.update_entry("entry-1", {"a1b2c3d4e5f6-0002": _tile("a1b2c3d4e5f6-0002", "Bag")})
+    bag = MagicMock(address="A1:B2:C3:D4:E5:F6")
+    bag.name = "Tile"
+
+    # An advertisement racing the load is cached but not written yet
+    service._async_on_advertisement(MagicMock(device=bag, rssi=-60), None)
+    store.async_schedule_save.assert_not_called()
+
+    bluetooth = MagicMock()
+    bluetooth.async_discovered_service_info.return_value = []
+    with patch.dict(sys.modules, {"homeassistant.components.bluetooth": bluetooth}):
+        await service.async_start_passive_discovery()
+
+    store.async_load.assert_awaited_once()
+    store.async_schedule_save.assert_called_once_with(service.cache)
+    assert set(service.cache.mappings_as_dict()) == {"e1a2b3c4d5f6-7788", "a1b2c3d4e5f6-0002"}
+    assert service.cache.get_mac_for_uuid("e1a2b3c4d5f6-7788") == "E1:A2:B3:C4:D5:F6"
+
+
+def test_duplicate_advertisement_deliveries_ignored():
+    """Test an advertisement delivered once per matching matcher counts once."""
+    service = TileService(MagicMock())
+    coordinator = MagicMock()
+    coordinator.data = {"e1a2b3c4d5f6-7788": _tile("e1a2b3c4d5f6-7788", "Keys")}
+    service.track_coordinator("entry-1", coordinator)
+    device = MagicMock(address="E1:A2:B3:C4:D5:F6")
+    device.name = "Tile"
+
+    for _ in range(3):
+        service._async_on_advertisement(MagicMock(device=device, rssi=-60, time=100.0), None)
+    service._async_on_advertisement(MagicMock(device=device, rssi=-62, time=101.5), None)
+
+    assert coordinator.async_observe_advertisement.call_count == 2
+    assert service.cache.mac_to_device["E1:A2:B3:C4:D5:F6"].advertised_at == 101.5
+
+
+def test_exact_mac_resolution_without_fallback():
+    """Test a tile resolves only to its own address, never to another Tile."""
+    service = TileService(MagicMock())
+    stranger = MagicMock(address="11:22:33:44:55:66")
+    service._cache_advertisement(stranger, None, -60)
+
+    assert service.find_ble_device_for_uuid("e1a2b3c4d5f6-7788") is None
+
+    mine = MagicMock(address="e1:a2:b3:c4:d5:f6")
+    service._cache_advertisement(mine, None, -60)
+    assert service.find_ble_device_for_uuid("e1a2b3c4d5f6-7788") is mine
+    assert service.cache.get_mac_for_uuid("e1a2b3c4d5f6-7788") == "e1:a2:b3:c4:d5:f6"
+
+
+def test_address_rotation_tracked():
+    """Test a known tile seen at a new address moves its mapping explicitly."""
+    service = TileService(MagicMock())
+    service.index.update_entry("entry-1", {"e1a2b3c4d5f6-7788": _tile("e1a2b3c4d5f6-7788", "Keys")})
+    service.cache.cache_mapping("e1a2b3c4d5f6-7788", "AA:BB:CC:DD:EE:FF")
+
+    service._cache_advertisement(MagicMock(address="E1:A2:B3:C4:D5:F6"), None, -50)
+
+    assert service.cache.get_mac_for_uuid("e1a2b3c4d5f6-7788") == "E1:A2:B3:C4:D5:F6"
+    assert service.get_cache_stats()["address_rotations"] == 1
+    assert "AA:BB:CC:DD:EE:FF" not in service.cache.mac_to_uuid
+
+
+def test_device_cache_bounded():
+    """Test the device cache evicts least recently used and expired entries."""
+    from custom_components.tile_tracker.tile_service import TileBleCache
+
+    cache = TileBleCache(max_devices=2, device_ttl=600)
+    for address in ("AA:00:00:00:00:01", "AA:00:00:00:00:02"):
+        cache.cache_device(MagicMock(address=address), MagicMock(local_name="Tile", tx_power=None), -60)
+    assert cache.get_device("AA:00:00:00:00:01") is not None  # now most recent
+
+    cache.cache_device(MagicMock(address="AA:00:00:00:00:03"), None, -60)
+
+    assert list(cache.mac_to_device) == ["AA:00:00:00:00:01", "AA:00:00:00:00:03"]
+    assert cache.get_device_by_mac("AA0000000002") is None
+    assert cache.evictions == 1
+    assert cache.mac_to_device["AA:00:00:00:00:01"].local_name == "Tile"
+
+    cache.mac_to_device["AA:00:00:00:00:03"].last_seen -= 3600
+    assert cache.get_device("AA:00:00:00:00:03") is None
+    assert cache.expirations == 1
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_advertisements_feed_presence():
+    """Test advertisements of a known tile reach the coordinator tracking it."""
+    service = TileService(MagicMock())
+    tracking, other = MagicMock(), MagicMock()
+    tracking.data = {"e1a2b3c4d5f6-7788": _tile("e1a2b3c4d5f6-7788", "Keys")}
+    other.data = {}
+    service.track_coordinator("entry-1", tracking)
+    service.track_coordinator("entry-2", other)
+
+    service._cache_advertisement(MagicMock(address="E1:A2:B3:C4:D5:F6"), MagicMock(), -55)
+    service._cache_advertisement(MagicMock(address="E1:A2:B3:C4:D5:F6"), None, -100)
+
+    tracking.async_observe_advertisement.assert_called_once_with("e1a2b3c4d5f6-7788", -55, None)
+    other.async_observe_advertisement.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_seeded_advertisements_keep_their_time():
+    """Test advertisements known at startup reach presence with when they were heard."""
+    service = TileService(MagicMock())
+    coordinator = MagicMock()
+    coordinator.data = {"e1a2b3c4d5f6-7788": _tile("e1a2b3c4d5f6-7788", "Keys")}
+    service.track_coordinator("entry-1", coordinator)
+    device = MagicMock(address="E1:A2:B3:C4:D5:F6")
+    device.name = "Tile"
+    bluetooth = MagicMock()
+    bluetooth.async_discovered_service_info.return_value = [
+        MagicMock(device=device, rssi=-60, time=time.monotonic() - 900),
+    ]
+
+    with patch.dict(sys.modules, {"homeassistant.components.bluetooth": bluetooth}):
+        await service.async_start_passive_discovery()
+
+    (tile_uuid, rssi, seen_at), _ = coordinator.async_observe_advertisement.call_args
+    assert (tile_uuid, rssi) == ("e1a2b3c4d5f6-7788", -60)
+    assert time.time() - seen_at == pytest.approx(900, abs=5)
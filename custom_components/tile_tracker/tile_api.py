@@ -8,14 +8,40 @@ SPDX-License-Identifier: MIT
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from dataclasses import dataclass
+import random
+import time
+import weakref
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from email.utils import parsedate_to_datetime
+from http.cookies import CookieError, SimpleCookie
+from typing import Any, Awaitable, Callable, Collection, Hashable, Mapping, TypeVar
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from .const import (
+    API_BACKOFF_BASE,
+    API_BACKOFF_MAX,
+    API_CONNECT_TIMEOUT,
+    API_CONNECTION_LIMIT_PER_HOST,
+    API_DNS_CACHE_TTL,
+    API_KEEPALIVE_TIMEOUT,
+    API_MAX_CONCURRENT_REQUESTS,
+    API_MAX_RETRIES,
+    API_MAX_RETRY_WAIT,
+    API_RATE_BURST,
+    API_RATE_LIMIT,
+    API_REQUEST_TIMEOUT,
+    METADATA_FIELD_TTLS,
+    SESSION_DEFAULT_LIFETIME,
+    SYNC_WATERMARK_OVERLAP,
     TILE_API_BASE,
     TILE_APP_ID,
     TILE_APP_VERSION,
@@ -25,88 +51,351 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Decoder for API response bodies. orjson (bundled with Home Assistant) is
+# several times faster than the stdlib on the large /users/groups document.
+JsonLoads = Callable[[bytes], Any]
+json_loads: JsonLoads = orjson.loads if orjson is not None else json.loads
+JSON_DECODER = "orjson" if orjson is not None else "json"
+
+
+def create_client_session(
+    limit_per_host: int = API_CONNECTION_LIMIT_PER_HOST,
+    keepalive_timeout: float = API_KEEPALIVE_TIMEOUT,
+    dns_cache_ttl: int = API_DNS_CACHE_TTL,
+    request_timeout: float = API_REQUEST_TIMEOUT,
+    connect_timeout: float = API_CONNECT_TIMEOUT,
+) -> aiohttp.ClientSession:
+    """Create a pooled aiohttp session tuned for the Tile API.
+    
+    Connections are kept alive and reused across requests, refreshes and
+    (when the session is shared) config entries. The cookie jar is disabled
+    because each TileApiClient sends its own session cookie; a shared jar
+    would leak one account's cookie into another account's requests.
+    """
+    connector = aiohttp.TCPConnector(
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=dns_cache_ttl,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        timeout=aiohttp.ClientTimeout(
+            total=request_timeout, connect=connect_timeout
+        ),
+    )
+
+
+# Optional tile_states keys mapped to TileDevice attributes
+STATE_FIELDS: dict[str, str] = {
+    "altitude": "altitude",
+    "h_accuracy": "accuracy",
+    "advertised_rssi": "advertised_rssi",
+    "speed": "speed",
+    "ring_state": "ring_state",
+    "connection_state": "connection_state",
+    "voip_state": "voip_state",
+}
+
 
 class TileAuthError(Exception):
     """Raised when authentication fails."""
 
 
-@dataclass
-class TileDevice:
-    """Represents a Tile device."""
-
-    tile_uuid: str
-    name: str
-    auth_key: str
-    archetype: str
-    firmware_version: str
-    hardware_version: str | None
-    product: str
-    visible: bool
-    is_dead: bool
-    expected_tdt_cmd_config: str | None
-    
-    # State info
-    advertised_rssi: float | None = None
-    speed: float | None = None
-    ring_state: str | None = None
-    battery_status: str | None = None
-    latitude: float | None = None
-    longitude: float | None = None
-    altitude: float | None = None
-    accuracy: float | None = None
-    last_timestamp: datetime | None = None
-    connection_state: str | None = None
-    voip_state: str | None = None
-    
-    # Lost status (from diagnostics)
-    lost: bool = False
-    lost_timestamp: datetime | None = None
-    
-    # Device kind (TILE, PHONE, etc.)
-    kind: str = "TILE"
+class TileApiError(Exception):
+    """Raised when the Tile API returns an error or cannot be reached."""
+
+
+class TileRateLimitError(TileApiError):
+    """Raised when the Tile API keeps throttling or failing requests."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        """Initialize with the number of seconds to wait before retrying."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TileRateLimiter:
+    """Token bucket with Retry-After aware backoff for one Tile account.
     
-    # MAC address (derived from UUID)
-    mac_address: str | None = None
+    Requests take a token before they are sent; tokens refill at ``rate``
+    per second up to ``burst``. A 429 or 5xx response blocks the bucket for
+    the server's Retry-After, or for an exponentially growing, jittered
+    delay when no Retry-After is given. A success resets the backoff.
+    """
+
+    def __init__(
+        self,
+        rate: float = API_RATE_LIMIT,
+        burst: int = API_RATE_BURST,
+    ) -> None:
+        """Initialize a full bucket."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._failures = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def retry_after(self) -> float:
+        """Return seconds until requests are allowed again (0 if not blocked)."""
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    @property
+    def budget(self) -> dict[str, Any]:
+        """Return the current request budget."""
+        self._refill()
+        return {
+            "tokens": round(self._tokens, 2),
+            "burst": self._burst,
+            "rate": self._rate,
+            "retry_after": round(self.retry_after, 1),
+            "consecutive_failures": self._failures,
+        }
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then take a token."""
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self.retry_after
+                if not wait and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep(max(wait, (1 - self._tokens) / self._rate))
+
+    def on_success(self) -> None:
+        """Reset the backoff after a successful response."""
+        self._failures = 0
+
+    def on_throttled(self, retry_after: float | None = None) -> float:
+        """Block the bucket after a 429/5xx and return the delay applied."""
+        self._failures += 1
+        if retry_after is None:
+            backoff = min(API_BACKOFF_MAX, API_BACKOFF_BASE * 2 ** (self._failures - 1))
+            retry_after = random.uniform(backoff / 2, backoff)
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        return retry_after
+
+
+# Rate limiters shared by every live client of the same account. Weakly
+# held, so a limiter goes away with its last client; closing the account's
+# client drops it right away so a reload starts with a fresh budget.
+_rate_limiters: weakref.WeakValueDictionary[str, TileRateLimiter] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def get_rate_limiter(email: str) -> TileRateLimiter:
+    """Get or create the rate limiter for a Tile account."""
+    key = email.strip().lower()
+    limiter = _rate_limiters.get(key)
+    if limiter is None:
+        limiter = _rate_limiters[key] = TileRateLimiter()
+    return limiter
+
+
+def release_rate_limiter(email: str, limiter: TileRateLimiter) -> None:
+    """Forget an account's rate limiter if it is still the shared one."""
+    key = email.strip().lower()
+    if _rate_limiters.get(key) is limiter:
+        del _rate_limiters[key]
+
+
+_UNSET: Any = object()
+
+
+def _freeze(value: Any) -> Any:
+    """Return an immutable copy of a list, dict or set field value."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+def _ms_to_datetime(value: float | None) -> datetime | None:
+    """Convert a Tile API epoch-milliseconds timestamp to an aware datetime."""
+    if not value:
+        return None
+    try:
+        # Tile API returns milliseconds since epoch - use UTC timezone
+        return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+    except (ValueError, TypeError, OSError):
+        return None
+
+
+def _datetime_to_ms(value: datetime) -> int:
+    """Convert a datetime to epoch milliseconds (naive values are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+class TileDevice:
+    """Represents a Tile device.
     
-    # Song configuration (populated via BLE when available)
-    available_songs: list[dict] | None = None  # [{"id": 0, "name": "Default"}, ...]
-    selected_song_id: int = 0  # Currently selected song ID for ring
+    Slotted to keep large accounts compact in memory. Timestamps are kept
+    as the raw epoch values the API returns and only turned into datetimes
+    (once) when read; ``mac_address`` and ``tile_type`` are derived lazily
+    and cached. Attributes and constructor arguments are the same as the
+    former dataclass, and datetime timestamps are still accepted.
+    """
+
+    # Public fields in constructor order (used by __repr__ and __eq__)
+    _FIELDS = (
+        "tile_uuid",
+        "name",
+        "auth_key",
+        "archetype",
+        "firmware_version",
+        "hardware_version",
+        "product",
+        "visible",
+        "is_dead",
+        "expected_tdt_cmd_config",
+        "advertised_rssi",
+        "speed",
+        "ring_state",
+        "battery_status",
+        "latitude",
+        "longitude",
+        "altitude",
+        "accuracy",
+        "last_timestamp",
+        "connection_state",
+        "voip_state",
+        "lost",
+        "lost_timestamp",
+        "kind",
+        "mac_address",
+        "available_songs",
+        "selected_song_id",
+    )
+
+    __slots__ = (
+        "tile_uuid",
+        "name",
+        "auth_key",
+        "firmware_version",
+        "hardware_version",
+        "visible",
+        "is_dead",
+        "expected_tdt_cmd_config",
+        "advertised_rssi",
+        "speed",
+        "ring_state",
+        "battery_status",
+        "latitude",
+        "longitude",
+        "altitude",
+        "accuracy",
+        "connection_state",
+        "voip_state",
+        "lost",
+        "kind",
+        "available_songs",
+        "selected_song_id",
+        "_archetype",
+        "_product",
+        "_tile_type",
+        "_mac_address",
+        "_last_timestamp_ms",
+        "_last_timestamp",
+        "_lost_timestamp_raw",
+        "_lost_timestamp",
+    )
+
+    # Slots compared by fingerprint() (lazy caches are left out)
+    _FINGERPRINT_SLOTS = tuple(
+        name
+        for name in __slots__
+        if name not in ("_tile_type", "_mac_address", "_last_timestamp", "_lost_timestamp")
+    )
+
+    def __init__(
+        self,
+        tile_uuid: str,
+        name: str,
+        auth_key: str,
+        archetype: str,
+        firmware_version: str,
+        hardware_version: str | None,
+        product: str,
+        visible: bool,
+        is_dead: bool,
+        expected_tdt_cmd_config: str | None,
+        # State info
+        advertised_rssi: float | None = None,
+        speed: float | None = None,
+        ring_state: str | None = None,
+        battery_status: str | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        altitude: float | None = None,
+        accuracy: float | None = None,
+        last_timestamp: datetime | int | None = None,
+        connection_state: str | None = None,
+        voip_state: str | None = None,
+        # Lost status (from diagnostics)
+        lost: bool = False,
+        lost_timestamp: datetime | int | str | None = None,
+        # Device kind (TILE, PHONE, etc.)
+        kind: str = "TILE",
+        # MAC address (derived from UUID when not given)
+        mac_address: str | None = _UNSET,
+        # Song configuration (populated via BLE when available)
+        available_songs: list[dict] | None = None,  # [{"id": 0, "name": "Default"}, ...]
+        selected_song_id: int = 0,  # Currently selected song ID for ring
+    ) -> None:
+        """Initialize the tile."""
+        self.tile_uuid = tile_uuid
+        self.name = name
+        self.auth_key = auth_key
+        self._archetype = archetype
+        self.firmware_version = firmware_version
+        self.hardware_version = hardware_version
+        self._product = product
+        self._tile_type: str | None = None
+        self.visible = visible
+        self.is_dead = is_dead
+        self.expected_tdt_cmd_config = expected_tdt_cmd_config
+        self.advertised_rssi = advertised_rssi
+        self.speed = speed
+        self.ring_state = ring_state
+        self.battery_status = battery_status
+        self.latitude = latitude
+        self.longitude = longitude
+        self.altitude = altitude
+        self.accuracy = accuracy
+        self.last_timestamp = last_timestamp
+        self.connection_state = connection_state
+        self.voip_state = voip_state
+        self.lost = lost
+        self.lost_timestamp = lost_timestamp
+        self.kind = kind
+        self._mac_address = mac_address
+        self.available_songs = available_songs
+        self.selected_song_id = selected_song_id
 
     @classmethod
     def from_api_response(cls, tile_uuid: str, data: dict[str, Any]) -> TileDevice:
         """Create TileDevice from API response."""
-        last_state = data.get("last_tile_state", {}) or {}
-        firmware = data.get("firmware", {}) or {}
-        
-        # Parse timestamp
-        timestamp = last_state.get("timestamp")
-        last_ts = None
-        if timestamp:
-            try:
-                # Tile API returns milliseconds since epoch - use UTC timezone
-                last_ts = datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc)
-            except (ValueError, TypeError, OSError):
-                pass
-        
-        # Parse lost timestamp
-        lost_ts_raw = data.get("lost_timestamp")
-        lost_ts = None
-        if lost_ts_raw:
-            try:
-                if isinstance(lost_ts_raw, (int, float)):
-                    lost_ts = datetime.fromtimestamp(lost_ts_raw / 1000, tz=timezone.utc)
-                elif isinstance(lost_ts_raw, str):
-                    # ISO format - ensure timezone aware
-                    parsed = datetime.fromisoformat(lost_ts_raw.replace("Z", "+00:00"))
-                    lost_ts = parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
-            except (ValueError, TypeError, OSError):
-                pass
-        
-        # Derive MAC address from UUID (first 12 chars = MAC without colons)
-        mac_address = None
-        uuid_clean = tile_uuid.replace("-", "").replace(":", "").upper()
-        if len(uuid_clean) >= 12:
-            mac_address = ":".join(uuid_clean[i:i+2] for i in range(0, 12, 2))
+        last_state = data.get("last_tile_state") or {}
+        firmware = data.get("firmware") or {}
 
         return cls(
             tile_uuid=tile_uuid,
@@ -127,19 +416,185 @@ class TileDevice:
             longitude=last_state.get("longitude"),
             altitude=last_state.get("altitude"),
             accuracy=last_state.get("h_accuracy"),
-            last_timestamp=last_ts,
+            last_timestamp=last_state.get("timestamp"),
             connection_state=last_state.get("connection_state"),
             voip_state=last_state.get("voip_state"),
             lost=data.get("lost", False),
-            lost_timestamp=lost_ts,
+            lost_timestamp=data.get("lost_timestamp"),
             kind=data.get("kind", "TILE"),
-            mac_address=mac_address,
         )
 
+    def __repr__(self) -> str:
+        """Return a dataclass-style representation."""
+        fields_repr = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self._FIELDS
+        )
+        return f"{type(self).__name__}({fields_repr})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare all public fields, like the former dataclass."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self._FIELDS
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def fingerprint(self) -> tuple[Any, ...]:
+        """Return a snapshot of every field, for cheap change detection.
+        
+        Mutable values (the songs list) are copied into tuples, so changing
+        them in place still shows up as a change.
+        """
+        return (
+            *(_freeze(getattr(self, name)) for name in self._FINGERPRINT_SLOTS),
+            self.mac_address,
+        )
+
+    def keep_metadata(self, previous: TileDevice) -> None:
+        """Fill static fields this record lacks from an earlier record.
+        
+        A groups-only record (detail fetch failed or skipped) has no auth
+        key, product or firmware; the previous record of the tile does.
+        """
+        for name in METADATA_FIELD_TTLS:
+            if not getattr(self, name) and (value := getattr(previous, name)):
+                setattr(self, name, value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable dict (timestamps stay raw)."""
+        data = {name: getattr(self, name) for name in self._FIELDS}
+        data["last_timestamp"] = self._last_timestamp_ms
+        data["lost_timestamp"] = self._lost_timestamp_raw
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> TileDevice:
+        """Create a TileDevice from as_dict() output.
+        
+        Raises:
+            TypeError: If a required field is missing
+        """
+        return cls(**{name: data[name] for name in cls._FIELDS if name in data})
+
+    @property
+    def archetype(self) -> str:
+        """Return the tile archetype."""
+        return self._archetype
+
+    @archetype.setter
+    def archetype(self, value: str) -> None:
+        self._archetype = value
+        self._tile_type = None
+
+    @property
+    def product(self) -> str:
+        """Return the tile product name."""
+        return self._product
+
+    @product.setter
+    def product(self, value: str) -> None:
+        self._product = value
+        self._tile_type = None
+
+    @property
+    def last_timestamp_ms(self) -> int | float | None:
+        """Return the last location fix as raw epoch milliseconds."""
+        return self._last_timestamp_ms
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        """Return the last location fix as an aware datetime."""
+        if self._last_timestamp is None and self._last_timestamp_ms:
+            self._last_timestamp = _ms_to_datetime(self._last_timestamp_ms)
+        return self._last_timestamp
+
+    @last_timestamp.setter
+    def last_timestamp(self, value: datetime | int | float | None) -> None:
+        if isinstance(value, datetime):
+            self._last_timestamp_ms = _datetime_to_ms(value)
+            self._last_timestamp = value
+        else:
+            self._last_timestamp_ms = value if isinstance(value, (int, float)) else None
+            self._last_timestamp = None
+
+    @property
+    def lost_timestamp(self) -> datetime | None:
+        """Return when the tile was marked lost as an aware datetime."""
+        raw = self._lost_timestamp_raw
+        if self._lost_timestamp is None and raw:
+            if isinstance(raw, (int, float)):
+                self._lost_timestamp = _ms_to_datetime(raw)
+            elif isinstance(raw, str):
+                try:
+                    # ISO format - ensure timezone aware
+                    parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+                except ValueError:
+                    return None
+                self._lost_timestamp = (
+                    parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+                )
+        return self._lost_timestamp
+
+    @lost_timestamp.setter
+    def lost_timestamp(self, value: datetime | int | float | str | None) -> None:
+        if isinstance(value, datetime):
+            self._lost_timestamp_raw = _datetime_to_ms(value)
+            self._lost_timestamp = value
+        else:
+            self._lost_timestamp_raw = value
+            self._lost_timestamp = None
+
+    @property
+    def mac_address(self) -> str | None:
+        """Return the MAC address (derived from the UUID unless set)."""
+        if self._mac_address is _UNSET:
+            # First 12 chars of the UUID = MAC without colons
+            uuid_clean = self.tile_uuid.replace("-", "").replace(":", "").upper()
+            self._mac_address = (
+                ":".join(uuid_clean[i:i+2] for i in range(0, 12, 2))
+                if len(uuid_clean) >= 12
+                else None
+            )
+        return self._mac_address
+
+    @mac_address.setter
+    def mac_address(self, value: str | None) -> None:
+        self._mac_address = value
+
+    def apply_state(self, state: dict[str, Any]) -> bool:
+        """Update volatile location fields from a tiles/tile_states entry.
+        
+        Accepts the state either flat or nested under ``last_tile_state``.
+        Static metadata (auth key, firmware, product) is left untouched.
+        
+        Returns:
+            True if the state carried a location fix and was applied
+        """
+        last_state = state.get("last_tile_state") or state
+        timestamp = last_state.get("timestamp")
+        if (
+            not timestamp
+            or not isinstance(timestamp, (int, float))
+            or last_state.get("latitude") is None
+        ):
+            return False
+        
+        self.last_timestamp = timestamp
+        self.latitude = last_state.get("latitude")
+        self.longitude = last_state.get("longitude")
+        for key, attr in STATE_FIELDS.items():
+            if key in last_state:
+                setattr(self, attr, last_state[key])
+        return True
+
     @property
     def tile_type(self) -> str:
         """Return the tile type (product/archetype)."""
-        return self.product or self.archetype
+        if self._tile_type is None:
+            self._tile_type = self._product or self._archetype
+        return self._tile_type
     
     @property
     def last_tile_state(self) -> str | None:
@@ -149,6 +604,186 @@ class TileDevice:
         return None
 
 
+class TileMetadataCache:
+    """Cache of static TileDevice fields with a TTL per field.
+    
+    Static fields (auth key, firmware, product, ...) come from the heavy
+    per-tile detail call but almost never change. Tiles whose cached fields
+    are all still fresh can be built from the lighter groups node instead.
+    A firmware version in the groups node that differs from the cached one
+    invalidates the tile's entry.
+    
+    Timestamps are wall-clock so the cache can be persisted across restarts
+    via as_dict()/load().
+    """
+
+    def __init__(self, ttls: dict[str, float] | None = None) -> None:
+        """Initialize the metadata cache."""
+        self._ttls = dict(ttls or METADATA_FIELD_TTLS)
+        # tile_uuid -> field -> (value, cached_at)
+        self._entries: dict[str, dict[str, tuple[Any, float]]] = {}
+        self.dirty = False
+
+    def __len__(self) -> int:
+        """Return the number of cached tiles."""
+        return len(self._entries)
+
+    def update(self, tile: TileDevice) -> None:
+        """Cache the static fields of a freshly fetched tile."""
+        now = time.time()
+        self._entries[tile.tile_uuid] = {
+            name: (getattr(tile, name), now) for name in self._ttls
+        }
+        self.dirty = True
+
+    def invalidate(self, tile_uuid: str | None = None) -> None:
+        """Drop the cached fields of one tile, or of every tile."""
+        if tile_uuid is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(tile_uuid, None)
+        self.dirty = True
+
+    def is_fresh(self, tile_uuid: str) -> bool:
+        """Return True if every cached field of a tile is within its TTL."""
+        entry = self._entries.get(tile_uuid)
+        if not entry:
+            return False
+        now = time.time()
+        return all(
+            name in entry and now - entry[name][1] < ttl
+            for name, ttl in self._ttls.items()
+        )
+
+    def apply(self, tile: TileDevice, allow_stale: bool = False) -> bool:
+        """Fill a tile's static fields from the cache.
+        
+        Every field still within its TTL is copied, even when others have
+        expired, so a tile whose detail fetch fails keeps what is valid.
+        With ``allow_stale``, expired fields fill in whatever the tile
+        lacks: static data like the auth key is better late than missing.
+        
+        Returns:
+            True if every field was fresh; False if the tile's details
+            need fetching (missing, expired or firmware changed)
+        """
+        entry = self._entries.get(tile.tile_uuid)
+        if not entry:
+            return False
+        
+        cached_firmware = entry.get("firmware_version", (None, 0.0))[0]
+        if tile.firmware_version and tile.firmware_version != cached_firmware:
+            _LOGGER.debug(
+                "Firmware changed for tile %s (%s -> %s), invalidating metadata",
+                tile.tile_uuid,
+                cached_firmware,
+                tile.firmware_version,
+            )
+            self.invalidate(tile.tile_uuid)
+            return False
+        
+        now = time.time()
+        fresh = True
+        for name, ttl in self._ttls.items():
+            item = entry.get(name)
+            if item is None:
+                fresh = False
+            elif now - item[1] < ttl:
+                setattr(tile, name, item[0])
+            else:
+                fresh = False
+                if allow_stale and not getattr(tile, name):
+                    setattr(tile, name, item[0])
+        return fresh
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation for storage."""
+        return {
+            tile_uuid: {
+                name: {"value": value, "cached_at": cached_at}
+                for name, (value, cached_at) in entry.items()
+            }
+            for tile_uuid, entry in self._entries.items()
+        }
+
+    def load(self, data: dict[str, Any] | None) -> None:
+        """Load entries previously returned by as_dict()."""
+        self._entries = {}
+        for tile_uuid, entry in (data or {}).items():
+            try:
+                self._entries[tile_uuid] = {
+                    name: (item["value"], float(item["cached_at"]))
+                    for name, item in entry.items()
+                    if name in self._ttls
+                }
+            except (KeyError, TypeError, ValueError):
+                continue
+        self.dirty = False
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key.
+    
+    The first caller starts the call; callers arriving while it is still
+    running await the same task and get the same result (or exception).
+    The task is shielded so a cancelled caller doesn't cancel it for the
+    others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.shared_calls = 0
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Run ``func`` unless a call with ``key`` is already in flight."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.shared_calls += 1
+            _LOGGER.debug("Joining in-flight request %s", key)
+        else:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+
+@dataclass
+class TileSyncResult:
+    """Result of a /users/groups sync.
+    
+    For a full sync ``tiles`` holds every active tile on the account. For an
+    incremental sync it only holds tiles changed since the last watermark,
+    and ``removed`` lists tiles that became dead or invisible.
+    """
+
+    tiles: dict[str, TileDevice] = field(default_factory=dict)
+    removed: set[str] = field(default_factory=set)
+    full: bool = True
+    
+    # True if the delta could not be merged safely and a full sync is needed
+    gap: bool = False
+
+
+@dataclass
+class GroupNodes:
+    """Tiles extracted from a /users/groups result in a single pass."""
+
+    tiles: dict[str, TileDevice] = field(default_factory=dict)
+    
+    # Dead or invisible tiles (never turned into TileDevice objects)
+    inactive: set[str] = field(default_factory=set)
+    
+    # Tile nodes that could not be parsed and need a detail fetch
+    unparsed: set[str] = field(default_factory=set)
+    
+    # True if the result contained GROUP nodes
+    has_groups: bool = False
+    
+    # Newest last_modified_timestamp in the result (ms since epoch)
+    watermark: int | None = None
+
+
 class TileApiClient:
     """Client for the Tile API."""
 
@@ -157,24 +792,122 @@ class TileApiClient:
         email: str,
         password: str,
         session: aiohttp.ClientSession | None = None,
+        max_concurrent_requests: int = API_MAX_CONCURRENT_REQUESTS,
+        request_timeout: float = API_REQUEST_TIMEOUT,
+        loads: JsonLoads | None = None,
     ) -> None:
-        """Initialize the Tile API client."""
+        """Initialize the Tile API client.
+        
+        Args:
+            email: Tile account email
+            password: Tile account password
+            session: Shared aiohttp session (one is created if omitted)
+            max_concurrent_requests: Cap on concurrent detail requests
+            request_timeout: Timeout for each detail request in seconds
+            loads: JSON decoder for response bodies (defaults to json_loads)
+        """
         self._email = email
         self._password = password
         self._session = session
         self._cookie: str | None = None
+        self._cookie_expires: float | None = None
         self._own_session = False
         self._logged_in = False
+        
+        # True once the session cookie changed and should be persisted
+        self.session_dirty = False
+        self._max_concurrent_requests = max(1, max_concurrent_requests)
+        self._request_timeout = request_timeout
+        self._loads = loads or json_loads
+        
+        # Stats from the most recent detail fan-out (see get_tile_details)
+        self.last_fetch_duration: float | None = None
+        self.last_fetch_failures: list[str] = []
+        
+        # Server-side modification watermark (ms since epoch) for delta syncs
+        self._last_modified: int = 0
+        
+        # Static per-tile fields reused between detail fetches
+        self.metadata_cache = TileMetadataCache()
+        
+        # Coalesces identical concurrent reads (refresh buttons, services,
+        # scheduled polls) into one request
+        self._single_flight = SingleFlight()
+        
+        # Request budget shared with other clients of the same account
+        self.rate_limiter = get_rate_limiter(email)
 
     @property
     def is_logged_in(self) -> bool:
-        """Return True if logged in."""
-        return self._logged_in and self._cookie is not None
+        """Return True if logged in with an unexpired session cookie."""
+        if not self._logged_in or self._cookie is None:
+            return False
+        return self._cookie_expires is None or self._cookie_expires > time.time()
+
+    @property
+    def json_decoder(self) -> str:
+        """Return the name of the decoder used for response bodies."""
+        if self._loads is json_loads:
+            return JSON_DECODER
+        return getattr(self._loads, "__module__", None) or repr(self._loads)
+
+    @property
+    def session_state(self) -> dict[str, Any] | None:
+        """Return the session cookie and its expiry for persistence."""
+        if not self._cookie:
+            return None
+        return {"cookie": self._cookie, "expires": self._cookie_expires}
+
+    def restore_session(self, state: dict[str, Any] | None) -> bool:
+        """Reuse a persisted session cookie instead of logging in.
+        
+        The cookie is not checked here; it is validated lazily by the first
+        real request, which logs in again if the server rejects it.
+        
+        Returns:
+            True if an unexpired cookie was restored
+        """
+        if not state or not state.get("cookie"):
+            return False
+        expires = state.get("expires")
+        if expires is not None and expires <= time.time():
+            _LOGGER.debug("Persisted Tile session has expired")
+            return False
+        
+        self._cookie = state["cookie"]
+        self._cookie_expires = expires
+        self._logged_in = True
+        _LOGGER.debug("Restored persisted Tile session")
+        return True
+
+    @staticmethod
+    def _parse_cookie_expiry(set_cookie: str) -> float:
+        """Return the expiry (epoch seconds) of a Set-Cookie header."""
+        now = time.time()
+        try:
+            cookie = SimpleCookie()
+            cookie.load(set_cookie)
+            for morsel in cookie.values():
+                if morsel["max-age"]:
+                    return now + int(morsel["max-age"])
+                if morsel["expires"]:
+                    return parsedate_to_datetime(morsel["expires"]).timestamp()
+        except (CookieError, TypeError, ValueError):
+            pass
+        return now + SESSION_DEFAULT_LIFETIME
+
+    @property
+    def last_modified(self) -> int:
+        """Return the modification watermark of the last groups sync."""
+        return self._last_modified
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create the aiohttp session."""
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = create_client_session(
+                limit_per_host=self._max_concurrent_requests,
+                request_timeout=self._request_timeout,
+            )
             self._own_session = True
         return self._session
 
@@ -191,9 +924,130 @@ class TileApiClient:
             headers["Cookie"] = self._cookie
         return headers
 
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Make an authenticated API request and return the decoded JSON.
+        
+        Logs in first if there is no session, and logs in again (once) if the
+        server rejects the current cookie, e.g. a stale persisted session.
+        Every attempt takes a token from the account's rate limiter; 429 and
+        5xx responses are retried after the limiter's backoff, honouring
+        Retry-After. Only the HTTP exchange itself counts against
+        ``request_timeout``, not the wait for a token.
+        
+        Raises:
+            TileAuthError: If (re-)login fails
+            TileRateLimitError: If throttling outlasts the retry budget
+            TileApiError: If the request cannot be completed or times out
+        """
+        if not self.is_logged_in:
+            await self.login()
+        
+        session = await self._get_session()
+        url = f"{TILE_API_BASE}/{path}"
+        relogged = False
+        retries = 0
+        
+        while True:
+            self._check_rate_limit()
+            await self.rate_limiter.acquire()
+            cookie = self._cookie
+            try:
+                async with asyncio.timeout(self._request_timeout):
+                    async with session.request(
+                        method, url, headers=self._get_headers(), params=params
+                    ) as response:
+                        status = response.status
+                        retry_after = response.headers.get("Retry-After")
+                        body = await response.read()
+            except asyncio.TimeoutError as err:
+                raise TileApiError(
+                    f"Timed out after {self._request_timeout:.1f}s requesting {path}"
+                ) from err
+            except aiohttp.ClientError as err:
+                raise TileApiError(str(err)) from err
+            
+            if status in (401, 403):
+                if relogged:
+                    raise TileAuthError("Session rejected after login")
+                relogged = True
+                # Concurrent requests rejected together share one login, and
+                # one rejected after another request logged in just retries
+                if self._cookie == cookie or not self.is_logged_in:
+                    _LOGGER.debug(
+                        "Tile session rejected (HTTP %d), logging in again", status
+                    )
+                    self._logged_in = False
+                    await self.login()
+                continue
+            
+            if status == 429 or status >= 500:
+                delay = self.rate_limiter.on_throttled(self._parse_retry_after(retry_after))
+                if retries >= API_MAX_RETRIES or delay > API_MAX_RETRY_WAIT:
+                    raise TileRateLimitError(f"HTTP {status} from {path}", delay)
+                retries += 1
+                _LOGGER.debug(
+                    "HTTP %d from %s, retrying in %.1fs (%d/%d)",
+                    status,
+                    path,
+                    delay,
+                    retries,
+                    API_MAX_RETRIES,
+                )
+                continue
+            
+            self.rate_limiter.on_success()
+            return self._decode(body, path)
+
+    def _decode(self, body: bytes, path: str) -> Any:
+        """Decode a response body with the configured JSON decoder.
+        
+        Raises:
+            TileApiError: If the body is not valid JSON
+        """
+        try:
+            return self._loads(body)
+        except ValueError as err:
+            raise TileApiError(f"Invalid JSON from {path}: {err}") from err
+
+    def _check_rate_limit(self) -> None:
+        """Fail fast instead of waiting out a long server-imposed block."""
+        retry_after = self.rate_limiter.retry_after
+        if retry_after > API_MAX_RETRY_WAIT:
+            raise TileRateLimitError(
+                f"Rate limited for another {retry_after:.0f}s", retry_after
+            )
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> float | None:
+        """Parse a Retry-After header (seconds or HTTP date)."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
     async def login(self) -> bool:
-        """Login to the Tile API."""
+        """Login to the Tile API.
+        
+        Concurrent callers, e.g. requests whose session was rejected at
+        the same time, share a single login.
+        """
+        return await self._single_flight.run(("login",), self._login)
+
+    async def _login(self) -> bool:
+        """Login to the Tile API (not coalesced)."""
         session = await self._get_session()
+        await self.rate_limiter.acquire()
         
         url = f"{TILE_API_BASE}/clients/{TILE_CLIENT_UUID}/sessions"
         headers = self._get_headers(include_cookie=False)
@@ -206,15 +1060,16 @@ class TileApiClient:
 
         try:
             async with session.post(url, headers=headers, data=data) as response:
-                # Get cookie from response
-                cookie = response.headers.get("Set-Cookie")
-                if cookie:
-                    self._cookie = cookie
-                
-                result = await response.json()
+                body = await response.read()
+                try:
+                    result = self._loads(body)
+                except ValueError as err:
+                    raise TileAuthError(f"Invalid login response: {err}") from err
                 
-                if result.get("result_code") != 0:
-                    error_msg = result.get("result", {}).get("message", "Unknown error")
+                if response.status >= 400 or result.get("result_code") != 0:
+                    error_msg = result.get("result", {}).get(
+                        "message", f"HTTP {response.status}"
+                    )
                     _LOGGER.error("Tile API login failed: %s", error_msg)
                     raise TileAuthError(error_msg)
                 
@@ -222,6 +1077,13 @@ class TileApiClient:
                     _LOGGER.error("Tile API reported invalid credentials")
                     raise TileAuthError("Invalid credentials")
                 
+                # Only a successful login's cookie is kept (and persisted)
+                cookie = response.headers.get("Set-Cookie")
+                if cookie:
+                    self._cookie = cookie
+                    self._cookie_expires = self._parse_cookie_expiry(cookie)
+                    self.session_dirty = True
+                
                 _LOGGER.debug("Tile API login successful")
                 self._logged_in = True
                 return True
@@ -236,106 +1098,334 @@ class TileApiClient:
         Args:
             fetch_details: If True, fetch full details for each tile (slower but more complete)
         """
-        session = await self._get_session()
+        return await self._single_flight.run(
+            ("tiles", fetch_details), lambda: self._get_tiles(fetch_details)
+        )
+
+    async def _get_tiles(self, fetch_details: bool) -> list[TileDevice]:
+        """Get all tiles from the account (not coalesced)."""
+        try:
+            result = await self._get_group_nodes()
+        except TileApiError as err:
+            _LOGGER.error("Error getting tiles: %s", err)
+            return []
         
-        url = f"{TILE_API_BASE}/users/groups"
-        params = {"last_modified_timestamp": "0"}
+        # The watermark belongs to sync_tiles: moving it here would let the
+        # next incremental sync skip changes the coordinator never merged
+        extracted = self._extract_group_nodes(result)
         
-        try:
-            async with session.get(
-                url, headers=self._get_headers(), params=params
-            ) as response:
-                result = await response.json()
-                
-                if result.get("result_code") != 0:
-                    error_msg = result.get("result", {}).get("message", "Unknown error")
-                    _LOGGER.error("Error getting tiles: %s", error_msg)
-                    return []
-                
-                nodes = result.get("result", {}).get("nodes", {})
-                tiles = []
-                tile_uuids = []
-                
-                for tile_uuid, tile_data in nodes.items():
-                    # Skip GROUP nodes, only process actual tiles
-                    if tile_data.get("node_type") == "GROUP":
-                        continue
-                    
-                    # Filter out dead and invisible tiles
-                    if tile_data.get("is_dead", False):
-                        _LOGGER.debug("Skipping dead tile: %s", tile_data.get("name"))
-                        continue
-                    if not tile_data.get("visible", True):
-                        _LOGGER.debug("Skipping invisible tile: %s", tile_data.get("name"))
-                        continue
-                    
-                    tile_uuids.append(tile_uuid)
-                    
-                    if not fetch_details:
-                        try:
-                            tile = TileDevice.from_api_response(tile_uuid, tile_data)
-                            tiles.append(tile)
-                        except Exception as err:
-                            _LOGGER.warning(
-                                "Error parsing tile %s: %s", tile_uuid, err
-                            )
-                
-                # Fetch full details for each tile if requested
-                if fetch_details and tile_uuids:
-                    for tile_uuid in tile_uuids:
-                        tile = await self.get_tile(tile_uuid)
-                        if tile:
-                            tiles.append(tile)
+        if fetch_details:
+            tiles = list((await self._resolve_tiles(extracted)).values())
+        else:
+            tiles = list(extracted.tiles.values())
 
-                _LOGGER.debug("Found %d active tiles", len(tiles))
-                return tiles
+        _LOGGER.debug("Found %d active tiles", len(tiles))
+        return tiles
 
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Error getting tiles: %s", err)
+    async def sync_tiles(
+        self,
+        full: bool = False,
+        fetch_details: bool = True,
+        skip_details: Collection[str] = (),
+    ) -> TileSyncResult:
+        """Sync tiles from /users/groups, incrementally when possible.
+        
+        An incremental sync asks only for nodes modified since the last
+        watermark. The result is flagged as a gap when it cannot be merged
+        safely (the watermark went backwards, or group membership changed so
+        removals cannot be inferred); callers should then run a full sync.
+        
+        Args:
+            full: Ignore the watermark and fetch the whole account
+            fetch_details: Fetch full details for new or changed tiles
+            skip_details: UUIDs (e.g. cold tiles) to build from the groups
+                node and cached metadata only, never with a detail call
+            
+        Raises:
+            TileApiError: If the groups call fails
+        """
+        full = full or not self._last_modified
+        skip = frozenset(skip_details)
+        return await self._single_flight.run(
+            ("sync", full, fetch_details, skip),
+            lambda: self._sync_tiles(full, fetch_details, skip),
+        )
+
+    async def _sync_tiles(
+        self,
+        full: bool,
+        fetch_details: bool,
+        skip_details: Collection[str] = (),
+    ) -> TileSyncResult:
+        """Sync tiles from /users/groups (not coalesced)."""
+        since = 0 if full else max(0, self._last_modified - SYNC_WATERMARK_OVERLAP)
+        
+        result = await self._get_group_nodes(since)
+        extracted = self._extract_group_nodes(result)
+        removed = extracted.inactive
+        
+        gap = False
+        if not full:
+            watermark = extracted.watermark
+            if watermark is not None and watermark < self._last_modified:
+                _LOGGER.debug(
+                    "Groups watermark went backwards (%d < %d)",
+                    watermark,
+                    self._last_modified,
+                )
+                gap = True
+            elif extracted.has_groups:
+                _LOGGER.debug("Group membership changed since last sync")
+                gap = True
+        if gap:
+            return TileSyncResult(full=False, gap=True)
+        
+        if fetch_details:
+            tiles = await self._resolve_tiles(extracted, skip_details)
+        else:
+            tiles = extracted.tiles
+        
+        self._advance_watermark(extracted.watermark)
+        
+        _LOGGER.debug(
+            "%s sync: %d changed, %d removed",
+            "Full" if full else "Incremental",
+            len(tiles),
+            len(removed),
+        )
+        return TileSyncResult(tiles=tiles, removed=removed, full=full)
+
+    async def _get_group_nodes(self, since: int = 0) -> dict[str, Any]:
+        """Fetch the /users/groups result modified since ``since`` (ms epoch).
+        
+        Raises:
+            TileApiError: If the request fails or the API reports an error
+        """
+        params = {"last_modified_timestamp": str(since)}
+        result = await self._request("GET", "users/groups", params=params)
+        
+        if result.get("result_code") != 0:
+            error_msg = result.get("result", {}).get("message", "Unknown error")
+            raise TileApiError(error_msg)
+        
+        return result.get("result", {}) or {}
+
+    @staticmethod
+    def _extract_group_nodes(result: dict[str, Any]) -> GroupNodes:
+        """Extract active tiles from a /users/groups result in one pass.
+        
+        GROUP, dead and invisible nodes are only classified, never turned
+        into TileDevice objects, and the watermark is collected on the way
+        so the (potentially thousands of) nodes are walked exactly once.
+        """
+        extracted = GroupNodes()
+        tiles = extracted.tiles
+        inactive = extracted.inactive
+        
+        watermark = result.get("last_modified_timestamp")
+        if not isinstance(watermark, (int, float)):
+            watermark = None
+        
+        for tile_uuid, node in (result.get("nodes") or {}).items():
+            stamp = node.get("last_modified_timestamp")
+            if isinstance(stamp, (int, float)) and (watermark is None or stamp > watermark):
+                watermark = stamp
+            
+            # Skip GROUP nodes, only process actual tiles
+            if node.get("node_type") == "GROUP":
+                extracted.has_groups = True
+                continue
+            
+            # Filter out dead and invisible tiles
+            if node.get("is_dead", False) or not node.get("visible", True):
+                inactive.add(tile_uuid)
+                continue
+            
+            try:
+                tiles[tile_uuid] = TileDevice.from_api_response(tile_uuid, node)
+            except Exception as err:
+                _LOGGER.warning("Error parsing tile %s: %s", tile_uuid, err)
+                extracted.unparsed.add(tile_uuid)
+        
+        if watermark is not None:
+            extracted.watermark = int(watermark)
+        if inactive:
+            _LOGGER.debug("Skipping %d dead or invisible tiles", len(inactive))
+        return extracted
+
+    async def _resolve_tiles(
+        self,
+        extracted: GroupNodes,
+        skip_details: Collection[str] = (),
+    ) -> dict[str, TileDevice]:
+        """Complete extracted tiles, fetching details only when needed.
+        
+        Tiles with fresh cached metadata are completed from the cache; the
+        rest (and nodes that failed to parse) get a full detail fetch, except
+        those in ``skip_details``. Tiles whose detail call fails or is skipped
+        keep the lighter groups record, completed with cached metadata even
+        past its TTL.
+        """
+        tiles = extracted.tiles
+        stale = [
+            tile_uuid
+            for tile_uuid, tile in tiles.items()
+            if not self.metadata_cache.apply(tile) and tile_uuid not in skip_details
+        ]
+        stale.extend(extracted.unparsed)
+        
+        fetched: set[str] = set()
+        if stale:
+            for tile in await self.get_tile_details(stale):
+                tiles[tile.tile_uuid] = tile
+                fetched.add(tile.tile_uuid)
+        
+        for tile_uuid, tile in tiles.items():
+            if tile_uuid not in fetched:
+                self.metadata_cache.apply(tile, allow_stale=True)
+        
+        _LOGGER.debug(
+            "Resolved %d tiles (%d detail calls, %d skipped)",
+            len(tiles),
+            len(stale),
+            len(skip_details),
+        )
+        return tiles
+
+    def _advance_watermark(self, watermark: int | None) -> None:
+        """Move the delta-sync watermark forward after a successful sync.
+        
+        The watermark is in server time, so a result without timestamps
+        keeps the previous one rather than mixing in the local clock.
+        """
+        if watermark is not None:
+            self._last_modified = max(self._last_modified, watermark)
+
+    async def get_tile_details(self, tile_uuids: list[str]) -> list[TileDevice]:
+        """Fetch full details for several tiles concurrently.
+        
+        At most ``max_concurrent_requests`` requests are in flight at once and
+        each one is bounded by ``request_timeout``, so the total time tracks the
+        slowest request rather than the sum of all of them. A slot is held
+        until its request has finished or timed out, so nothing keeps running
+        beyond the cap. Tiles that fail or time out are logged and skipped;
+        the ones that loaded are returned.
+        
+        Args:
+            tile_uuids: UUIDs of the tiles to fetch
+            
+        Returns:
+            TileDevice objects for the tiles that loaded, in request order
+        """
+        if not tile_uuids:
             return []
+        
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        
+        async def fetch(tile_uuid: str) -> TileDevice | None:
+            async with semaphore:
+                return await self.get_tile(tile_uuid)
+        
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(fetch(tile_uuid) for tile_uuid in tile_uuids),
+            return_exceptions=True,
+        )
+        self.last_fetch_duration = time.monotonic() - start
+        
+        tiles: list[TileDevice] = []
+        failures: list[str] = []
+        for tile_uuid, result in zip(tile_uuids, results):
+            if isinstance(result, TileAuthError):
+                raise result
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Error fetching tile %s: %s", tile_uuid, result)
+                failures.append(tile_uuid)
+            elif result is None:
+                failures.append(tile_uuid)
+            else:
+                tiles.append(result)
+        self.last_fetch_failures = failures
+        
+        _LOGGER.debug(
+            "Fetched details for %d/%d tiles in %.2fs (max %d in flight)",
+            len(tiles),
+            len(tile_uuids),
+            self.last_fetch_duration,
+            self._max_concurrent_requests,
+        )
+        return tiles
 
     async def get_tile(self, tile_uuid: str) -> TileDevice | None:
         """Get a specific tile by UUID."""
-        session = await self._get_session()
-        
-        url = f"{TILE_API_BASE}/tiles/{tile_uuid}"
-        
-        try:
-            async with session.get(url, headers=self._get_headers()) as response:
-                result = await response.json()
-                
-                if result.get("result_code") != 0:
-                    error_msg = result.get("result", {}).get("message", "Unknown error")
-                    _LOGGER.error("Error getting tile %s: %s", tile_uuid, error_msg)
-                    return None
-                
-                tile_data = result.get("result", {})
-                return TileDevice.from_api_response(tile_uuid, tile_data)
+        return await self._single_flight.run(
+            ("tile", tile_uuid), lambda: self._get_tile(tile_uuid)
+        )
 
-        except aiohttp.ClientError as err:
+    async def _get_tile(self, tile_uuid: str) -> TileDevice | None:
+        """Get a specific tile by UUID (not coalesced)."""
+        try:
+            result = await self._request("GET", f"tiles/{tile_uuid}")
+        except TileRateLimitError:
+            raise
+        except TileApiError as err:
             _LOGGER.error("Error getting tile %s: %s", tile_uuid, err)
             return None
+        
+        if result.get("result_code") != 0:
+            error_msg = result.get("result", {}).get("message", "Unknown error")
+            _LOGGER.error("Error getting tile %s: %s", tile_uuid, error_msg)
+            return None
+        
+        tile_data = result.get("result", {})
+        tile = TileDevice.from_api_response(tile_uuid, tile_data)
+        self.metadata_cache.update(tile)
+        return tile
 
     async def get_tile_states(self) -> dict[str, dict[str, Any]]:
-        """Get current states for all tiles."""
-        session = await self._get_session()
-        
-        url = f"{TILE_API_BASE}/tiles/tile_states"
+        """Get current states for all tiles, keyed by tile UUID.
         
-        try:
-            async with session.get(url, headers=self._get_headers()) as response:
-                result = await response.json()
-                
-                if result.get("result_code") != 0:
-                    error_msg = result.get("result", {}).get("message", "Unknown error")
-                    _LOGGER.error("Error getting tile states: %s", error_msg)
-                    return {}
-                
-                return result.get("result", {})
+        The endpoint returns either a list of state objects carrying a
+        ``tile_id``/``tile_uuid`` or a mapping keyed by UUID; both are
+        normalised to a mapping.
+        """
+        return await self._single_flight.run(("tile_states",), self._get_tile_states)
 
-        except aiohttp.ClientError as err:
+    async def _get_tile_states(self) -> dict[str, dict[str, Any]]:
+        """Get current states for all tiles (not coalesced)."""
+        try:
+            result = await self._request("GET", "tiles/tile_states")
+        except TileRateLimitError:
+            raise
+        except TileApiError as err:
             _LOGGER.error("Error getting tile states: %s", err)
             return {}
+        
+        if result.get("result_code") != 0:
+            error_msg = result.get("result", {}).get("message", "Unknown error")
+            _LOGGER.error("Error getting tile states: %s", error_msg)
+            return {}
+        
+        return self._normalize_tile_states(result.get("result"))
+
+    @staticmethod
+    def _normalize_tile_states(raw: Any) -> dict[str, dict[str, Any]]:
+        """Return tile_states results as a mapping of tile UUID to state."""
+        if isinstance(raw, dict):
+            return {
+                tile_uuid: state
+                for tile_uuid, state in raw.items()
+                if isinstance(state, dict)
+            }
+        
+        states: dict[str, dict[str, Any]] = {}
+        for state in raw or []:
+            if not isinstance(state, dict):
+                continue
+            tile_uuid = state.get("tile_id") or state.get("tile_uuid") or state.get("uuid")
+            if tile_uuid:
+                states[tile_uuid] = state
+        return states
 
     async def set_lost(self, tile_uuid: str, lost: bool) -> bool:
         """Mark a tile as lost or found.
@@ -373,22 +1463,16 @@ class TileApiClient:
         Returns:
             Raw API response dict or None
         """
-        session = await self._get_session()
-        
-        url = f"{TILE_API_BASE}/tiles/{tile_uuid}"
-        
         try:
-            async with session.get(url, headers=self._get_headers()) as response:
-                result = await response.json()
-                
-                if result.get("result_code") != 0:
-                    return None
-                
-                return result.get("result", {})
-
-        except aiohttp.ClientError as err:
+            result = await self._request("GET", f"tiles/{tile_uuid}")
+        except TileApiError as err:
             _LOGGER.error("Error getting raw tile data %s: %s", tile_uuid, err)
             return None
+        
+        if result.get("result_code") != 0:
+            return None
+        
+        return result.get("result", {})
 
     async def get_all_tiles_raw(self) -> list[dict[str, Any]]:
         """Get raw API response for all tiles (for diagnostics).
@@ -429,7 +1513,8 @@ class TileApiClient:
         return raw_tiles
 
     async def close(self) -> None:
-        """Close the session if we own it."""
+        """Close the session if we own it and release the rate limiter."""
+        release_rate_limiter(self._email, self.rate_limiter)
         if self._own_session and self._session:
             await self._session.close()
             self._session = None
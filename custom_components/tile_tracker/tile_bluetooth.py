@@ -122,9 +122,9 @@ async def scan_for_tiles(
         {
             "address": device.address,
             "name": device.name or "Unknown Tile",
-            "rssi": adv_data.rssi if adv_data else -100,
+            "rssi": cached.rssi,
         }
-        for device, adv_data in tiles
+        for device, cached in tiles
     ]
 
 
@@ -7,7 +7,8 @@ SPDX-License-Identifier: MIT
 
 Provides a unified service layer for Tile operations:
 - API access with caching
-- BLE scanning with UUID→MAC caching
+- BLE discovery with UUID→MAC caching, fed passively by Home Assistant's
+  bluetooth integration
 - Authentication with session caching
 - Ring/locate operations
 
@@ -21,23 +22,28 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
 from bleak import BleakClient, BleakScanner
 from bleak_retry_connector import establish_connection, BleakNotFoundError
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
+from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
-    DOMAIN,
+    FEEC_SERVICE_UUID,
     FEED_SERVICE_UUID,
     UUID_MAC_CACHE_TTL,
     SCAN_CACHE_TTL,
     BLE_CONNECTION_TIMEOUT,
     BLE_AUTH_TIMEOUT,
+    BLE_DEVICE_CACHE_SIZE,
+    BLE_DEVICE_CACHE_TTL,
 )
+from .storage import TileBleCacheStore
 from .tile_auth import (
     TileAuthenticator,
     TileVolume,
@@ -45,63 +51,263 @@ from .tile_auth import (
 )
 
 if TYPE_CHECKING:
+    from homeassistant.components.bluetooth import (
+        BluetoothChange,
+        BluetoothServiceInfoBleak,
+    )
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
     from .tile_api import TileDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedBleDevice:
-    """Cached BLE device info."""
+    """Cached BLE device info.
+    
+    Keeps the few advertisement fields we use rather than the whole
+    AdvertisementData, whose raw service and manufacturer data would stay
+    alive as long as the entry.
+    """
     address: str
     rssi: int
     last_seen: float = field(default_factory=time.time)
     device: BLEDevice | None = None
-    adv_data: AdvertisementData | None = None
+    local_name: str | None = None
+    tx_power: int | None = None
+    advertised_at: float | None = None
 
 
 @dataclass
 class TileBleCache:
-    """Cache for UUID→MAC mappings and scan results."""
+    """Cache for UUID→MAC mappings and scan results.
+    
+    A mapping expires UUID_MAC_CACHE_TTL seconds after its MAC was last
+    seen advertising. Mappings, with the last RSSI and sighting, are
+    persisted by TileBleCacheStore; ``dirty`` marks unsaved changes.
+    
+    Devices are kept in least-recently-used order, at most ``max_devices``
+    of them, and are dropped ``device_ttl`` seconds after they were last
+    seen, so a busy street doesn't grow the cache without bound.
+    """
     
     # UUID to MAC address mapping (tile_uuid -> mac_address)
     uuid_to_mac: dict[str, str] = field(default_factory=dict)
     
-    # MAC to cached device info
-    mac_to_device: dict[str, CachedBleDevice] = field(default_factory=dict)
+    # When each mapped MAC was last seen, and its RSSI then
+    mapping_seen: dict[str, float] = field(default_factory=dict)
+    mapping_rssi: dict[str, int | None] = field(default_factory=dict)
+    
+    # Reverse of uuid_to_mac, to refresh mappings from advertisements
+    mac_to_uuid: dict[str, str] = field(default_factory=dict)
+    
+    # Cached devices by normalized 12-hex MAC, for exact O(1) lookups
+    devices_by_mac: dict[str, CachedBleDevice] = field(default_factory=dict)
+    
+    # Mappings that moved to a new address
+    address_rotations: int = 0
+    
+    mapping_ttl: float = UUID_MAC_CACHE_TTL
+    dirty: bool = False
+    
+    # MAC to cached device info, least recently used first
+    mac_to_device: OrderedDict[str, CachedBleDevice] = field(default_factory=OrderedDict)
+    max_devices: int = BLE_DEVICE_CACHE_SIZE
+    device_ttl: float = BLE_DEVICE_CACHE_TTL
+    
+    # Device lookup counters
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
     
     # Last full scan timestamp
     last_scan: float = 0.0
     
-    # All discovered Tiles from last scan
-    discovered_tiles: list[tuple[BLEDevice, AdvertisementData]] = field(default_factory=list)
+    # All discovered Tiles from last scan (the device records, not copies)
+    discovered_tiles: list[tuple[BLEDevice, CachedBleDevice]] = field(default_factory=list)
     
     def get_mac_for_uuid(self, tile_uuid: str) -> str | None:
-        """Get cached MAC for a tile UUID."""
-        return self.uuid_to_mac.get(tile_uuid)
+        """Get cached MAC for a tile UUID, dropping it if expired."""
+        mac = self.uuid_to_mac.get(tile_uuid)
+        if mac is None:
+            return None
+        if time.time() - self.mapping_seen.get(tile_uuid, 0.0) > self.mapping_ttl:
+            _LOGGER.debug("Mapping for %s expired", tile_uuid[:8])
+            self.forget_mapping(tile_uuid)
+            return None
+        return mac
     
     def get_device(self, mac_address: str) -> BLEDevice | None:
         """Get cached BLE device for MAC, if still valid."""
-        cached = self.mac_to_device.get(mac_address)
+        cached = self._lookup(mac_address)
         if cached and (time.time() - cached.last_seen) < SCAN_CACHE_TTL:
             return cached.device
         return None
     
-    def cache_mapping(self, tile_uuid: str, mac_address: str) -> None:
+    def _lookup(self, mac_address: str) -> CachedBleDevice | None:
+        """Get a device entry, counting the hit or miss and expiring it."""
+        cached = self.mac_to_device.get(mac_address)
+        if cached is not None and time.time() - cached.last_seen > self.device_ttl:
+            self._drop_device(mac_address)
+            self.expirations += 1
+            cached = None
+        if cached is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.mac_to_device.move_to_end(mac_address)
+        return cached
+    
+    def _drop_device(self, mac_address: str) -> None:
+        """Remove a device entry and its MAC index key."""
+        cached = self.mac_to_device.pop(mac_address, None)
+        if cached is not None:
+            key = normalize_mac(mac_address)
+            if self.devices_by_mac.get(key) is cached:
+                del self.devices_by_mac[key]
+    
+    def _evict(self, now: float) -> None:
+        """Expire stale devices from the old end and enforce the size cap."""
+        while self.mac_to_device:
+            address, oldest = next(iter(self.mac_to_device.items()))
+            if now - oldest.last_seen > self.device_ttl:
+                self.expirations += 1
+            elif len(self.mac_to_device) > self.max_devices:
+                self.evictions += 1
+            else:
+                break
+            self._drop_device(address)
+    
+    def cache_mapping(
+        self,
+        tile_uuid: str,
+        mac_address: str,
+        last_seen: float | None = None,
+        rssi: int | None = None,
+    ) -> None:
         """Cache a UUID→MAC mapping."""
+        old_mac = self.uuid_to_mac.get(tile_uuid)
+        if old_mac is not None and old_mac != mac_address:
+            self.mac_to_uuid.pop(old_mac, None)
+            self.address_rotations += 1
+            _LOGGER.info(
+                "Tile %s changed address: %s -> %s", tile_uuid[:8], old_mac, mac_address
+            )
         self.uuid_to_mac[tile_uuid] = mac_address
+        self.mac_to_uuid[mac_address] = tile_uuid
+        
+        cached = self.mac_to_device.get(mac_address)
+        if last_seen is None:
+            last_seen = cached.last_seen if cached else time.time()
+        if rssi is None and cached:
+            rssi = cached.rssi
+        self.mapping_seen[tile_uuid] = last_seen
+        self.mapping_rssi[tile_uuid] = rssi
+        self.dirty = True
         _LOGGER.debug("Cached mapping: %s -> %s", tile_uuid[:8], mac_address)
     
-    def cache_device(self, device: BLEDevice, adv_data: AdvertisementData | None, rssi: int = -100) -> None:
-        """Cache a discovered device."""
-        self.mac_to_device[device.address] = CachedBleDevice(
-            address=device.address,
-            rssi=rssi,
-            last_seen=time.time(),
-            device=device,
-            adv_data=adv_data,
-        )
+    def forget_mapping(self, tile_uuid: str) -> None:
+        """Drop a UUID→MAC mapping."""
+        mac = self.uuid_to_mac.pop(tile_uuid, None)
+        if mac is None:
+            return
+        if self.mac_to_uuid.get(mac) == tile_uuid:
+            del self.mac_to_uuid[mac]
+        self.mapping_seen.pop(tile_uuid, None)
+        self.mapping_rssi.pop(tile_uuid, None)
+        self.dirty = True
+    
+    def cache_device(
+        self,
+        device: BLEDevice,
+        adv_data: AdvertisementData | None,
+        rssi: int = -100,
+    ) -> CachedBleDevice:
+        """Cache a discovered device.
+        
+        Returns:
+            The device's cache entry
+        """
+        now = time.time()
+        cached = self.mac_to_device.get(device.address)
+        if cached is None:
+            cached = self.mac_to_device[device.address] = CachedBleDevice(
+                address=device.address, rssi=rssi
+            )
+            self.devices_by_mac[normalize_mac(device.address)] = cached
+        else:
+            self.mac_to_device.move_to_end(device.address)
+        cached.rssi = rssi
+        cached.last_seen = now
+        cached.device = device
+        if adv_data is not None:
+            cached.local_name = adv_data.local_name
+            cached.tx_power = adv_data.tx_power
+        self._evict(now)
+        
+        # A sighting keeps the device's mapping alive; persisting every
+        # advertisement isn't worth it, a tenth of the TTL is close enough
+        tile_uuid = self.mac_to_uuid.get(device.address)
+        if tile_uuid is not None:
+            if now - self.mapping_seen.get(tile_uuid, 0.0) > self.mapping_ttl / 10:
+                self.dirty = True
+            self.mapping_seen[tile_uuid] = now
+            self.mapping_rssi[tile_uuid] = rssi
+        return cached
+    
+    def mappings_as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the UUID→MAC mappings with their metadata for storage."""
+        return {
+            tile_uuid: {
+                "mac": mac,
+                "last_seen": self.mapping_seen.get(tile_uuid),
+                "rssi": self.mapping_rssi.get(tile_uuid),
+            }
+            for tile_uuid, mac in self.uuid_to_mac.items()
+        }
+    
+    def load_mappings(self, data: Mapping[str, Mapping[str, Any]] | None) -> int:
+        """Restore persisted mappings that haven't expired.
+        
+        Mappings cached since startup win over stored ones.
+        
+        Returns:
+            Number of mappings restored
+        """
+        restored = 0
+        now = time.time()
+        for tile_uuid, entry in (data or {}).items():
+            if tile_uuid in self.uuid_to_mac:
+                continue
+            try:
+                mac = entry["mac"]
+                last_seen = float(entry["last_seen"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if now - last_seen > self.mapping_ttl:
+                continue
+            self.cache_mapping(tile_uuid, mac, last_seen, entry.get("rssi"))
+            restored += 1
+        return restored
+    
+    def seen_tiles(self, max_age: float = SCAN_CACHE_TTL) -> list[tuple[BLEDevice, CachedBleDevice]]:
+        """Get devices seen within ``max_age`` seconds."""
+        cutoff = time.time() - max_age
+        return [
+            (cached.device, cached)
+            for cached in self.mac_to_device.values()
+            if cached.device is not None and cached.last_seen >= cutoff
+        ]
+    
+    def get_device_by_mac(self, mac: str) -> CachedBleDevice | None:
+        """Get a cached device by normalized MAC (see normalize_mac)."""
+        cached = self.devices_by_mac.get(mac)
+        if cached is None:
+            self.misses += 1
+            return None
+        return self._lookup(cached.address)
     
     def is_scan_stale(self) -> bool:
         """Check if we need a fresh scan."""
@@ -110,10 +316,170 @@ class TileBleCache:
     def clear_scan_cache(self) -> None:
         """Clear scan cache but keep UUID→MAC mappings."""
         self.mac_to_device.clear()
+        self.devices_by_mac.clear()
         self.discovered_tiles.clear()
         self.last_scan = 0.0
 
 
+# Service UUIDs Tiles advertise, as bleak reports them (lower case) and
+# in upper case for backends that don't normalize
+TILE_SERVICE_UUIDS: frozenset[str] = frozenset(
+    uuid
+    for base in (FEED_SERVICE_UUID, FEEC_SERVICE_UUID)
+    for uuid in (base, base.upper())
+)
+TILE_LOCAL_NAMES: frozenset[str] = frozenset({"Tile", "tile", "TILE"})
+
+
+def is_tile_advertisement(device: BLEDevice, adv_data: AdvertisementData) -> bool:
+    """Return True if an advertisement comes from a Tile.
+    
+    Runs for every advertisement in range, so it only does set lookups and
+    builds no strings.
+    """
+    if adv_data.service_uuids and not TILE_SERVICE_UUIDS.isdisjoint(adv_data.service_uuids):
+        return True
+    if adv_data.service_data and not TILE_SERVICE_UUIDS.isdisjoint(adv_data.service_data):
+        return True
+    return device.name in TILE_LOCAL_NAMES
+
+
+def _advertisement_wall_time(service_info: BluetoothServiceInfoBleak) -> float:
+    """Return the wall-clock time Home Assistant heard an advertisement.
+    
+    ``service_info.time`` is monotonic; presence works in wall-clock time.
+    """
+    return time.time() - (time.monotonic() - service_info.time)
+
+
+def mac_from_uuid(tile_uuid: str) -> str:
+    """Return the normalized MAC a Tile derives from its UUID.
+    
+    Tile UUIDs start with the MAC address: cd46a6a4ddad54f0... advertises
+    as CD:46:A6:A4:DD:AD.
+    """
+    return normalize_mac(tile_uuid.replace("-", "")[:12])
+
+
+class AmbiguousTileError(HomeAssistantError):
+    """Raised when a tile name matches more than one tile."""
+
+
+def normalize_tile_name(name: str) -> str:
+    """Normalize a tile name for lookups (case and surrounding space)."""
+    return " ".join(name.split()).casefold()
+
+
+def normalize_mac(address: str) -> str:
+    """Normalize a MAC address to 12 upper-case hex digits."""
+    return address.replace(":", "").replace("-", "").upper()
+
+
+class TileIndex:
+    """UUID, name and MAC indices over the tiles of every coordinator.
+    
+    Updated per config entry when its coordinator refreshes, so lookups are
+    dictionary hits instead of scans over every entry and tile.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty indices."""
+        self._by_uuid: dict[str, TileDevice] = {}
+        self._by_name: dict[str, set[str]] = {}
+        self._by_mac: dict[str, str] = {}
+        # tile_uuid -> (normalized name, normalized MAC) as indexed
+        self._keys: dict[str, tuple[str, str | None]] = {}
+        self._entry_tiles: dict[str, set[str]] = {}
+        self._all_tiles: list[TileDevice] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of indexed tiles."""
+        return len(self._by_uuid)
+
+    def update_entry(self, entry_id: str, tiles: Mapping[str, TileDevice]) -> None:
+        """Re-index the tiles of one config entry."""
+        previous = self._entry_tiles.get(entry_id, set())
+        self._entry_tiles[entry_id] = set(tiles)
+        for tile_uuid in previous - tiles.keys():
+            self._remove(tile_uuid)
+        
+        for tile_uuid, tile in tiles.items():
+            if self._by_uuid.get(tile_uuid) is not tile:
+                self._by_uuid[tile_uuid] = tile
+                self._all_tiles = None
+            
+            mac = tile.mac_address
+            keys = (normalize_tile_name(tile.name), normalize_mac(mac) if mac else None)
+            old_keys = self._keys.get(tile_uuid)
+            if keys == old_keys:
+                continue
+            if old_keys:
+                self._unindex(tile_uuid, old_keys)
+            self._keys[tile_uuid] = keys
+            self._by_name.setdefault(keys[0], set()).add(tile_uuid)
+            if keys[1]:
+                self._by_mac[keys[1]] = tile_uuid
+
+    def remove_entry(self, entry_id: str) -> None:
+        """Drop every tile of a config entry."""
+        for tile_uuid in self._entry_tiles.pop(entry_id, set()):
+            self._remove(tile_uuid)
+
+    def _remove(self, tile_uuid: str) -> None:
+        """Drop one tile from every index, unless another entry still has it."""
+        if any(tile_uuid in uuids for uuids in self._entry_tiles.values()):
+            return
+        self._by_uuid.pop(tile_uuid, None)
+        keys = self._keys.pop(tile_uuid, None)
+        if keys:
+            self._unindex(tile_uuid, keys)
+        self._all_tiles = None
+
+    def _unindex(self, tile_uuid: str, keys: tuple[str, str | None]) -> None:
+        """Remove a tile's name and MAC keys."""
+        name, mac = keys
+        uuids = self._by_name.get(name)
+        if uuids:
+            uuids.discard(tile_uuid)
+            if not uuids:
+                del self._by_name[name]
+        if mac and self._by_mac.get(mac) == tile_uuid:
+            del self._by_mac[mac]
+
+    def get(self, tile_id: str) -> TileDevice | None:
+        """Find a tile by UUID, name or MAC address.
+        
+        Raises:
+            AmbiguousTileError: If ``tile_id`` is a name shared by several tiles
+        """
+        tile = self._by_uuid.get(tile_id)
+        if tile is not None:
+            return tile
+        
+        uuids = self._by_name.get(normalize_tile_name(tile_id))
+        if uuids:
+            if len(uuids) > 1:
+                raise AmbiguousTileError(
+                    f"Tile name '{tile_id}' matches {len(uuids)} tiles "
+                    f"({', '.join(sorted(uuids))}); use the tile UUID instead"
+                )
+            return self._by_uuid[next(iter(uuids))]
+        
+        return self.get_by_mac(tile_id)
+
+    def get_by_mac(self, address: str) -> TileDevice | None:
+        """Find a tile by MAC address (any separator or case)."""
+        tile_uuid = self._by_mac.get(normalize_mac(address))
+        return self._by_uuid.get(tile_uuid) if tile_uuid else None
+
+    @property
+    def tiles(self) -> list[TileDevice]:
+        """Return every indexed tile (rebuilt only after changes)."""
+        if self._all_tiles is None:
+            self._all_tiles = list(self._by_uuid.values())
+        return self._all_tiles
+
+
 class TileService:
     """Tile service layer with caching.
     
@@ -123,136 +489,287 @@ class TileService:
     - Ring/locate with automatic connection management
     """
     
-    def __init__(self, hass: HomeAssistant):
+    def __init__(self, hass: HomeAssistant, cache_store: TileBleCacheStore | None = None):
         """Initialize Tile service."""
         self.hass = hass
         self.cache = TileBleCache()
+        self._cache_store = cache_store
+        self._cache_loaded = cache_store is None
+        self.index = TileIndex()
+        self._cache_load_lock = asyncio.Lock()
         self._scan_lock = asyncio.Lock()
         self._ring_locks: dict[str, asyncio.Lock] = {}
+        self._passive_unsubs: list[Callable[[], None]] = []
+        self._coordinators: dict[str, DataUpdateCoordinator] = {}
+    
+    async def _async_load_cache(self) -> None:
+        """Restore persisted UUID→MAC mappings on first use.
+        
+        Mappings learned from advertisements before the load finished are
+        kept, and saved together with the restored ones.
+        """
+        if self._cache_loaded:
+            return
+        async with self._cache_load_lock:
+            if self._cache_loaded:
+                return
+            learned = self.cache.dirty
+            restored = self.cache.load_mappings(await self._cache_store.async_load())
+            self._cache_loaded = True
+            self.cache.dirty = learned
+        _LOGGER.debug("Restored %d UUID→MAC mappings", restored)
+        self._schedule_cache_save()
+    
+    def _schedule_cache_save(self) -> None:
+        """Persist the mappings if they changed.
+        
+        Nothing is written before the persisted mappings are loaded, as
+        that write would replace them.
+        """
+        if self._cache_store is not None and self._cache_loaded and self.cache.dirty:
+            self._cache_store.async_schedule_save(self.cache)
+    
+    @property
+    def passive_discovery(self) -> bool:
+        """Return True if advertisements arrive from HA's bluetooth integration."""
+        return bool(self._passive_unsubs)
+    
+    async def async_start_passive_discovery(self) -> None:
+        """Feed the BLE cache from Home Assistant's bluetooth integration.
+        
+        Restores the persisted mappings, then registers passive
+        advertisement callbacks for the Tile service UUIDs and seeds the
+        cache with what the adapters and proxies already know, so lookups
+        need no scan of our own. Does nothing if already running.
+        """
+        if self._passive_unsubs:
+            return
+        await self._async_load_cache()
+        if self._passive_unsubs:
+            return
+        
+        from homeassistant.components import bluetooth
+        
+        for matcher in (
+            bluetooth.BluetoothCallbackMatcher(service_uuid=FEED_SERVICE_UUID),
+            bluetooth.BluetoothCallbackMatcher(service_uuid=FEEC_SERVICE_UUID),
+            bluetooth.BluetoothCallbackMatcher(local_name="Tile"),
+        ):
+            self._passive_unsubs.append(
+                bluetooth.async_register_callback(
+                    self.hass,
+                    self._async_on_advertisement,
+                    matcher,
+                    bluetooth.BluetoothScanningMode.PASSIVE,
+                )
+            )
+        
+        for service_info in bluetooth.async_discovered_service_info(self.hass, connectable=False):
+            if is_tile_advertisement(service_info.device, service_info.advertisement):
+                self._cache_advertisement(
+                    service_info.device,
+                    service_info.advertisement,
+                    service_info.rssi,
+                    _advertisement_wall_time(service_info),
+                )
+        _LOGGER.debug(
+            "Passive BLE discovery started, %d Tile(s) already known",
+            len(self.cache.mac_to_device),
+        )
+    
+    def async_stop_passive_discovery(self) -> None:
+        """Unregister the passive advertisement callbacks."""
+        while self._passive_unsubs:
+            self._passive_unsubs.pop()()
+    
+    def _async_on_advertisement(
+        self,
+        service_info: BluetoothServiceInfoBleak,
+        change: BluetoothChange,
+    ) -> None:
+        """Cache a Tile advertisement seen by Home Assistant.
+        
+        An advertisement matching more than one of our matchers is
+        delivered once per matcher; only the first delivery is used.
+        """
+        cached = self.cache.mac_to_device.get(service_info.device.address)
+        if cached is not None and cached.advertised_at == service_info.time:
+            return
+        cached = self._cache_advertisement(
+            service_info.device,
+            service_info.advertisement,
+            service_info.rssi,
+            _advertisement_wall_time(service_info),
+        )
+        cached.advertised_at = service_info.time
+        self._schedule_cache_save()
+    
+    def _cache_advertisement(
+        self,
+        device: BLEDevice,
+        adv_data: AdvertisementData | None,
+        rssi: int,
+        seen_at: float | None = None,
+    ) -> CachedBleDevice:
+        """Cache a Tile's advertisement and map it to a known tile.
+        
+        The address is resolved through the tile index, so a tile is only
+        ever mapped to an address it derives from its own UUID. A known
+        tile showing up at a new address is recorded as a rotation.
+        Every advertisement of a known tile also updates its local
+        presence, as of ``seen_at``, in the coordinators that track it.
+        """
+        cached = self.cache.cache_device(device, adv_data, rssi)
+        tile = self.index.get_by_mac(device.address)
+        if tile is not None:
+            tile_uuid = tile.tile_uuid
+            if self.cache.uuid_to_mac.get(tile_uuid) != device.address:
+                self.cache.cache_mapping(tile_uuid, device.address)
+        else:
+            tile_uuid = self.cache.mac_to_uuid.get(device.address)
+        
+        # Only real advertisements carry an RSSI worth smoothing
+        if tile_uuid is not None and adv_data is not None:
+            for coordinator in self._coordinators.values():
+                if tile_uuid in (coordinator.data or {}):
+                    coordinator.async_observe_advertisement(tile_uuid, rssi, seen_at)
+        return cached
+    
+    def track_coordinator(
+        self,
+        entry_id: str,
+        coordinator: DataUpdateCoordinator,
+    ) -> Callable[[], None]:
+        """Keep the tile index in sync with a config entry's coordinator.
+        
+        Returns:
+            Callback that stops tracking and drops the entry's tiles
+        """
+        def _update() -> None:
+            self.index.update_entry(entry_id, coordinator.data or {})
+        
+        _update()
+        unsub = coordinator.async_add_listener(_update)
+        self._coordinators[entry_id] = coordinator
+        
+        def _untrack() -> None:
+            unsub()
+            self.index.remove_entry(entry_id)
+            self._coordinators.pop(entry_id, None)
+        
+        return _untrack
     
     def get_tile_from_coordinator(self, tile_id: str) -> TileDevice | None:
         """Get a tile from coordinator cache.
         
         Args:
-            tile_id: Tile UUID or name
+            tile_id: Tile UUID, name (case-insensitive) or MAC address
             
         Returns:
             TileDevice if found, None otherwise
+            
+        Raises:
+            AmbiguousTileError: If the name matches more than one tile
         """
-        for entry_id, data in self.hass.data.get(DOMAIN, {}).items():
-            if not isinstance(data, dict):
-                continue
-            coordinator = data.get("coordinator")
-            if coordinator and coordinator.data:
-                for tile in coordinator.data.values():
-                    if tile.tile_uuid == tile_id or tile.name == tile_id:
-                        return tile
-        return None
+        return self.index.get(tile_id)
     
     def get_all_tiles(self) -> list:
         """Get all tiles from all coordinators."""
-        tiles = []
-        for entry_id, data in self.hass.data.get(DOMAIN, {}).items():
-            if not isinstance(data, dict):
-                continue
-            coordinator = data.get("coordinator")
-            if coordinator and coordinator.data:
-                tiles.extend(coordinator.data.values())
-        return tiles
+        return self.index.tiles
     
     async def scan_for_tiles(
         self,
         timeout: float = 10.0,
         force_refresh: bool = False
-    ) -> list[tuple[BLEDevice, AdvertisementData | None]]:
+    ) -> list[tuple[BLEDevice, CachedBleDevice]]:
         """Scan for nearby Tile devices.
         
-        Uses cache if available and not stale.
+        Uses cache if available and not stale. With passive discovery
+        running, returns the Tiles Home Assistant has seen advertising
+        recently without scanning, unless ``force_refresh`` asks for a
+        scan; the result then also includes the Tiles seen passively.
         
         Args:
-            timeout: Scan timeout in seconds
+            timeout: Scan timeout in seconds (used when a scan runs)
             force_refresh: Force a new scan even if cache is fresh
             
         Returns:
-            List of (BLEDevice, AdvertisementData) tuples
+            List of (BLEDevice, CachedBleDevice) tuples; the cache entry
+            carries the last RSSI
         """
+        await self._async_load_cache()
+        if self.passive_discovery:
+            if force_refresh:
+                async with self._scan_lock:
+                    await self._scan(timeout)
+            tiles = self.cache.seen_tiles()
+            self.cache.discovered_tiles = tiles
+            self.cache.last_scan = time.time()
+            return tiles
+        
         async with self._scan_lock:
             # Return cache if still valid
             if not force_refresh and not self.cache.is_scan_stale() and self.cache.discovered_tiles:
                 _LOGGER.debug("Using cached scan results (%d tiles)", len(self.cache.discovered_tiles))
                 return self.cache.discovered_tiles
             
-            _LOGGER.debug("Starting BLE scan for Tiles (timeout=%ss)", timeout)
+            return await self._scan(timeout)
+    
+    async def _scan(self, timeout: float) -> list[tuple[BLEDevice, CachedBleDevice]]:
+        """Run an active scan for ``timeout`` seconds and cache what it finds.
+        
+        The caller holds ``_scan_lock``.
+        """
+        _LOGGER.debug("Starting BLE scan for Tiles (timeout=%ss)", timeout)
+        
+        tiles: list[tuple[BLEDevice, CachedBleDevice]] = []
+        seen_addresses: set[str] = set()
+        
+        def detection_callback(device: BLEDevice, adv_data: AdvertisementData):
+            if device.address in seen_addresses:
+                return
             
-            tiles: list[tuple[BLEDevice, AdvertisementData]] = []
-            seen_addresses: set[str] = set()
+            if is_tile_advertisement(device, adv_data):
+                seen_addresses.add(device.address)
+                tiles.append((device, self._cache_advertisement(device, adv_data, adv_data.rssi)))
+                _LOGGER.debug("Found Tile: %s @ %s (RSSI: %d)",
+                             device.name or "Unknown", device.address, adv_data.rssi)
+        
+        try:
+            scanner = BleakScanner(detection_callback=detection_callback)
+            await scanner.start()
+            await asyncio.sleep(timeout)
+            await scanner.stop()
             
-            def detection_callback(device: BLEDevice, adv_data: AdvertisementData):
+            # Also check already discovered devices
+            discovered = await BleakScanner.discover(timeout=1.0)
+            for device in discovered:
                 if device.address in seen_addresses:
-                    return
-                
-                # Check for Tile services
-                service_uuids = [str(u).lower() for u in (adv_data.service_uuids or [])]
-                service_data_keys = [str(k).lower() for k in (adv_data.service_data or {}).keys()]
-                all_services = service_uuids + service_data_keys
-                
-                is_tile = any(
-                    "feed" in s or "feec" in s or
-                    FEED_SERVICE_UUID.lower() in s or
-                    "0000feed" in s or "0000feec" in s
-                    for s in all_services
-                )
-                
-                # Also check device name
+                    continue
                 if device.name and device.name.lower() == "tile":
-                    is_tile = True
-                
-                if is_tile:
-                    seen_addresses.add(device.address)
-                    tiles.append((device, adv_data))
-                    self.cache.cache_device(device, adv_data, adv_data.rssi)
-                    _LOGGER.debug("Found Tile: %s @ %s (RSSI: %d)",
-                                 device.name or "Unknown", device.address, adv_data.rssi)
+                    tiles.append((device, self._cache_advertisement(device, None, -100)))
             
-            try:
-                scanner = BleakScanner(detection_callback=detection_callback)
-                await scanner.start()
-                await asyncio.sleep(timeout)
-                await scanner.stop()
-                
-                # Also check already discovered devices
-                discovered = await BleakScanner.discover(timeout=1.0)
-                for device in discovered:
-                    if device.address in seen_addresses:
-                        continue
-                    if device.name and device.name.lower() == "tile":
-                        tiles.append((device, None))
-                        self.cache.cache_device(device, None, -100)
-                
-                # Update cache
-                self.cache.discovered_tiles = tiles
-                self.cache.last_scan = time.time()
-                
-                _LOGGER.info("BLE scan complete: found %d Tile(s)", len(tiles))
-                return tiles
-                
-            except Exception as e:
-                _LOGGER.error("BLE scan failed: %s", e)
-                return []
+            # Update cache
+            self.cache.discovered_tiles = tiles
+            self.cache.last_scan = time.time()
+            
+            _LOGGER.info("BLE scan complete: found %d Tile(s)", len(tiles))
+            return tiles
+            
+        except Exception as e:
+            _LOGGER.error("BLE scan failed: %s", e)
+            return []
     
-    def find_ble_device_for_uuid(
-        self,
-        tile_uuid: str,
-        tiles: list[tuple[BLEDevice, AdvertisementData | None]] | None = None
-    ) -> BLEDevice | None:
-        """Find BLE device matching a tile UUID.
+    def find_ble_device_for_uuid(self, tile_uuid: str) -> BLEDevice | None:
+        """Find the cached BLE device of a tile UUID.
         
-        Tile UUIDs map to MAC addresses - the first 12 chars of UUID
-        match the MAC address (without colons).
+        Tile UUIDs start with the tile's MAC address, so the device is an
+        exact lookup by normalized MAC in the cache's index. There is no
+        fallback to other devices: a tile that hasn't advertised is not
+        found.
         
         Args:
             tile_uuid: The tile UUID from API
-            tiles: Optional list of scanned tiles (uses cache if not provided)
             
         Returns:
             Matching BLEDevice or None
@@ -265,39 +782,14 @@ class TileService:
                 _LOGGER.debug("Cache hit for UUID %s -> %s", tile_uuid[:8], cached_mac)
                 return cached_device
         
-        # Use provided tiles or cache
-        if tiles is None:
-            tiles = self.cache.discovered_tiles
-        
-        if not tiles:
+        cached = self.cache.get_device_by_mac(
+            normalize_mac(cached_mac) if cached_mac else mac_from_uuid(tile_uuid)
+        )
+        if cached is None or cached.device is None:
             return None
-        
-        # UUID to MAC matching
-        # Tile UUID format: cd46a6a4ddad54f0...
-        # MAC format: CD:46:A6:A4:DD:AD
-        tile_uuid_short = tile_uuid.replace(":", "").replace("-", "").lower()[:12]
-        
-        for device, adv_data in tiles:
-            addr_short = device.address.replace(":", "").lower()
-            
-            # Direct match
-            if addr_short == tile_uuid_short or addr_short.startswith(tile_uuid_short):
-                self.cache.cache_mapping(tile_uuid, device.address)
-                return device
-            
-            # Reverse match (MAC might be in different order)
-            if tile_uuid_short.startswith(addr_short):
-                self.cache.cache_mapping(tile_uuid, device.address)
-                return device
-        
-        # No exact match - return first tile if we only have one
-        if len(tiles) == 1:
-            device = tiles[0][0]
-            _LOGGER.warning("No UUID match, using only discovered Tile: %s", device.address)
-            self.cache.cache_mapping(tile_uuid, device.address)
-            return device
-        
-        return None
+        if self.cache.uuid_to_mac.get(tile_uuid) != cached.address:
+            self.cache.cache_mapping(tile_uuid, cached.address)
+        return cached.device
     
     async def find_tile_ble(
         self,
@@ -315,6 +807,31 @@ class TileService:
         Returns:
             BLEDevice or None
         """
+        await self._async_load_cache()
+        try:
+            return await self._async_find_tile_ble(tile_uuid, scan_timeout, force_scan)
+        finally:
+            self._schedule_cache_save()
+    
+    async def _async_find_tile_ble(
+        self,
+        tile_uuid: str,
+        scan_timeout: float,
+        force_scan: bool,
+    ) -> BLEDevice | None:
+        """Find a Tile via BLE (see find_tile_ble)."""
+        if self.passive_discovery:
+            device = self._find_tile_passive(tile_uuid)
+            if device is not None:
+                return device
+            # Home Assistant hasn't heard the tile (yet); scan for it, then
+            # let HA pick the best connectable adapter for the address
+            _LOGGER.debug("Tile %s not seen passively, scanning", tile_uuid[:8])
+            device = await self._scan_for_tile(tile_uuid, scan_timeout)
+            if device is None:
+                return None
+            return self._find_tile_passive(tile_uuid) or device
+        
         # Try cache first
         if not force_scan:
             cached_mac = self.cache.get_mac_for_uuid(tile_uuid)
@@ -323,11 +840,83 @@ class TileService:
                 if cached_device:
                     return cached_device
         
-        # Scan for tiles
-        tiles = await self.scan_for_tiles(timeout=scan_timeout, force_refresh=force_scan)
+        # Scan until this tile shows up
+        return await self._scan_for_tile(tile_uuid, scan_timeout)
+    
+    async def _scan_for_tile(self, tile_uuid: str, timeout: float) -> BLEDevice | None:
+        """Scan until the Tile for a UUID advertises, or until the timeout.
+        
+        Returns as soon as an advertisement from the tile's cached MAC, or
+        the MAC derived from its UUID, arrives; other Tiles seen meanwhile
+        are cached. Used on a cache miss, and on a passive miss before Home
+        Assistant has heard the tile. There is no match against other
+        devices after the timeout.
         
-        # Find matching device
-        return self.find_ble_device_for_uuid(tile_uuid, tiles)
+        Args:
+            tile_uuid: The tile UUID from API
+            timeout: Longest time to scan in seconds
+            
+        Returns:
+            BLEDevice or None if the tile didn't advertise in time
+        """
+        cached_mac = self.cache.get_mac_for_uuid(tile_uuid)
+        targets = {mac_from_uuid(tile_uuid)}
+        if cached_mac:
+            targets.add(normalize_mac(cached_mac))
+        found: asyncio.Future[BLEDevice] = asyncio.get_running_loop().create_future()
+        
+        def detection_callback(device: BLEDevice, adv_data: AdvertisementData):
+            if not is_tile_advertisement(device, adv_data):
+                return
+            self._cache_advertisement(device, adv_data, adv_data.rssi)
+            if not found.done() and normalize_mac(device.address) in targets:
+                found.set_result(device)
+        
+        async with self._scan_lock:
+            _LOGGER.debug("Scanning for Tile %s (timeout=%ss)", tile_uuid[:8], timeout)
+            started = time.monotonic()
+            try:
+                scanner = BleakScanner(detection_callback=detection_callback)
+                await scanner.start()
+                try:
+                    device = await asyncio.wait_for(found, timeout)
+                except asyncio.TimeoutError:
+                    return None
+                finally:
+                    await scanner.stop()
+            except Exception as e:
+                _LOGGER.error("BLE scan failed: %s", e)
+                return None
+        
+        _LOGGER.debug(
+            "Found Tile %s @ %s after %.1fs",
+            tile_uuid[:8],
+            device.address,
+            time.monotonic() - started,
+        )
+        self.cache.cache_mapping(tile_uuid, device.address)
+        return device
+    
+    def _find_tile_passive(self, tile_uuid: str) -> BLEDevice | None:
+        """Resolve a Tile from passively collected advertisements.
+        
+        Home Assistant picks the connectable adapter or proxy with the best
+        signal for the address, so the ring path never scans.
+        """
+        from homeassistant.components import bluetooth
+        
+        mac = self.cache.get_mac_for_uuid(tile_uuid)
+        if mac is None:
+            key = mac_from_uuid(tile_uuid)
+            cached = self.cache.get_device_by_mac(key)
+            mac = cached.address if cached else ":".join(
+                key[i:i + 2] for i in range(0, 12, 2)
+            )
+        
+        device = bluetooth.async_ble_device_from_address(self.hass, mac, connectable=True)
+        if device is not None and self.cache.uuid_to_mac.get(tile_uuid) != device.address:
+            self.cache.cache_mapping(tile_uuid, device.address)
+        return device
     
     async def ring_tile(
         self,
@@ -382,7 +971,7 @@ class TileService:
             # Find device via BLE
             device = await self.find_tile_ble(tile.tile_uuid)
             
-            if not device:
+            if not device and not self.passive_discovery:
                 # Try forced scan if cache miss
                 _LOGGER.info("Tile not found in cache, forcing BLE scan...")
                 device = await self.find_tile_ble(tile.tile_uuid, force_scan=True)
@@ -430,8 +1019,7 @@ class TileService:
             except Exception as e:
                 _LOGGER.error("Error ringing Tile %s: %s", tile.name, e)
                 # Clear cache on error - device might have moved
-                if tile.tile_uuid in self.cache.uuid_to_mac:
-                    self.cache.uuid_to_mac.pop(tile.tile_uuid)
+                self.cache.forget_mapping(tile.tile_uuid)
                 return False
                 
             finally:
@@ -443,7 +1031,8 @@ class TileService:
     
     def clear_cache(self) -> None:
         """Clear all caches."""
-        self.cache = TileBleCache()
+        self.cache = TileBleCache(dirty=True)
+        self._schedule_cache_save()
         _LOGGER.info("Tile BLE cache cleared")
     
     async def program_bionic_birdie(
@@ -506,8 +1095,7 @@ class TileService:
             
         except Exception as e:
             _LOGGER.error("Error programming song to Tile %s: %s", tile.name, e)
-            if tile.tile_uuid in self.cache.uuid_to_mac:
-                self.cache.uuid_to_mac.pop(tile.tile_uuid)
+            self.cache.forget_mapping(tile.tile_uuid)
             return False
             
         finally:
@@ -595,8 +1183,7 @@ class TileService:
                 
             except Exception as e:
                 _LOGGER.error("Error programming custom song to Tile %s: %s", tile.name, e)
-                if tile.tile_uuid in self.cache.uuid_to_mac:
-                    self.cache.uuid_to_mac.pop(tile.tile_uuid)
+                self.cache.forget_mapping(tile.tile_uuid)
                 return False
                 
             finally:
@@ -614,6 +1201,12 @@ class TileService:
             "discovered_tiles": len(self.cache.discovered_tiles),
             "last_scan": datetime.fromtimestamp(self.cache.last_scan).isoformat() if self.cache.last_scan else None,
             "scan_stale": self.cache.is_scan_stale(),
+            "address_rotations": self.cache.address_rotations,
+            "max_devices": self.cache.max_devices,
+            "hits": self.cache.hits,
+            "misses": self.cache.misses,
+            "evictions": self.cache.evictions,
+            "expirations": self.cache.expirations,
         }
 
 
@@ -625,7 +1218,7 @@ def get_tile_service(hass: HomeAssistant) -> TileService:
     """Get or create TileService instance for a Home Assistant instance."""
     hass_id = id(hass)
     if hass_id not in _tile_services:
-        _tile_services[hass_id] = TileService(hass)
+        _tile_services[hass_id] = TileService(hass, TileBleCacheStore(hass))
     return _tile_services[hass_id]
 
 
@@ -633,4 +1226,4 @@ async def async_cleanup_services(hass: HomeAssistant) -> None:
     """Cleanup service instance when Home Assistant stops."""
     hass_id = id(hass)
     if hass_id in _tile_services:
-        del _tile_services[hass_id]
+        _tile_services.pop(hass_id).async_stop_passive_discovery()